@@ -0,0 +1,110 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Annotation extraction
+
+"""Compare whole-buffer annotation extraction with the previous per-line loop.
+
+Usage: python benchmarks/bench_annotation_extraction.py [LINES] [REPEAT]
+
+Generates a large source file and a large markdown file (with code fences),
+checks both engines agree, and prints the best-of-REPEAT time for each.
+"""
+
+import re
+import sys
+import timeit
+
+from backlink_scanner.scanner import _extract_annotations, _FileAnnotations
+
+# The per-line patterns used before the whole-buffer engine
+LINE_SPEC_PATTERN = re.compile(r"^\s*(?://|#)\s*spec:\s*([\w./\-]+)\s*$")
+LINE_SECTION_PATTERN = re.compile(r"^\s*(?://|#)\s*spec-section:\s*(.+?)\s*$")
+LINE_FENCE_PATTERN = re.compile(r"^\s*```")
+
+
+def extract_by_line(content: str, is_markdown: bool) -> _FileAnnotations:
+    """The per-line loop: two regex calls and one string per line."""
+    in_code_fence = False
+    annotations = _FileAnnotations()
+    current_spec: str | None = None
+
+    for line in content.splitlines():
+        if is_markdown and LINE_FENCE_PATTERN.match(line):
+            in_code_fence = not in_code_fence
+            continue
+        if in_code_fence:
+            continue
+
+        spec_match = LINE_SPEC_PATTERN.match(line)
+        if spec_match:
+            current_spec = spec_match.group(1)
+            annotations.spec_paths.append(current_spec)
+            continue
+
+        section_match = LINE_SECTION_PATTERN.match(line)
+        if section_match and current_spec is not None:
+            annotations.sections.setdefault(current_spec, []).append(section_match.group(1))
+
+    return annotations
+
+
+def generate_source(lines: int) -> str:
+    """Mostly ordinary code, with a spec and section annotation every 500 lines."""
+    out = []
+    for i in range(lines):
+        if i % 500 == 0:
+            out.append(f"# spec: specs/feature{i // 500 % 20}.md")
+        elif i % 500 == 1:
+            out.append(f"# spec-section: Behavior/Part {i % 7}")
+        else:
+            out.append(f"    value_{i} = compute(value_{i - 1}, 'spec text {i}')  # comment")
+    return "\n".join(out) + "\n"
+
+
+def generate_markdown(lines: int) -> str:
+    """Prose with a fenced block every 50 lines, some containing annotation-like lines."""
+    out = []
+    for i in range(lines):
+        block = i % 50
+        if block in (10, 20):
+            out.append("```python")
+        elif block == 15:
+            out.append("# spec: specs/fenced.md")
+        elif block == 30:
+            out.append(f"<!-- spec: not a match {i} -->")
+        elif block == 0:
+            out.append(f"# spec: specs/doc{i // 50 % 5}.md")
+        else:
+            out.append(f"Paragraph line {i} mentioning a spec: and `inline code`.")
+    return "\n".join(out) + "\n"
+
+
+def _best(func, content: str, is_markdown: bool, repeat: int) -> float:
+    timer = timeit.Timer(lambda: func(content, is_markdown))
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    cases = [
+        ("source", generate_source(lines), False),
+        ("markdown", generate_markdown(lines), True),
+    ]
+    print(f"{'case':<10} {'lines':>9} {'line loop':>11} {'finditer':>11} {'speedup':>8}")
+    for name, content, is_markdown in cases:
+        expected = extract_by_line(content, is_markdown)
+        actual = _extract_annotations(content, is_markdown)
+        if (actual.spec_paths, actual.sections) != (expected.spec_paths, expected.sections):
+            sys.exit(f"{name}: engines disagree")
+
+        by_line = _best(extract_by_line, content, is_markdown, repeat)
+        whole = _best(_extract_annotations, content, is_markdown, repeat)
+        print(
+            f"{name:<10} {lines:>9} {by_line * 1000:>9.1f}ms {whole * 1000:>9.1f}ms"
+            f" {by_line / whole:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
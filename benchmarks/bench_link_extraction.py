@@ -0,0 +1,119 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Link extraction
+
+"""Compare single-pass link extraction with the previous per-line loop.
+
+Usage: python benchmarks/bench_link_extraction.py [LINES] [REPEAT]
+
+Generates large markdown files (link-dense prose, and docs heavy with code
+fences and inline code), checks both engines agree, and prints the
+best-of-REPEAT time for each.
+"""
+
+import re
+import sys
+import timeit
+
+from link_validator.validator import INLINE_CODE_PATTERN, _extract_links
+
+# The per-line patterns used before the single-pass tokenizer
+LINE_LINK_PATTERN = re.compile(r"!?\[(?:[^\]]*)\]\(([^)]*)\)")
+LINE_FENCE_PATTERN = re.compile(r"^(`{3,}|~{3,})")
+
+
+def extract_by_line(content: str) -> list[str]:
+    """The per-line loop: strip, fence match, inline code removal, and link match per line."""
+    targets: list[str] = []
+    in_fence = False
+    fence_char = ""
+    fence_len = 0
+
+    for line in content.splitlines():
+        stripped = line.strip()
+        fence_match = LINE_FENCE_PATTERN.match(stripped)
+
+        if fence_match:
+            char = fence_match.group(1)[0]
+            length = len(fence_match.group(1))
+
+            if not in_fence:
+                in_fence = True
+                fence_char = char
+                fence_len = length
+                continue
+            elif char == fence_char and length >= fence_len and stripped == char * length:
+                in_fence = False
+                continue
+
+        if in_fence:
+            continue
+
+        line_without_code = INLINE_CODE_PATTERN.sub("", line)
+        for match in LINE_LINK_PATTERN.finditer(line_without_code):
+            target = match.group(1).strip()
+            if target:
+                targets.append(target)
+
+    return targets
+
+
+def generate_prose(lines: int) -> str:
+    """Paragraphs with a link on most lines and the occasional list or heading."""
+    out = []
+    for i in range(lines):
+        if i % 40 == 0:
+            out.append(f"## Section {i}")
+        elif i % 3 == 0:
+            out.append("")
+        else:
+            out.append(
+                f"- Line {i} refers to [doc {i % 97}](../area{i % 7}/doc{i % 97}.md#part-{i % 5})"
+                f" and to ![figure](images/fig{i % 11}.png) in passing."
+            )
+    return "\n".join(out) + "\n"
+
+
+def generate_code_heavy(lines: int) -> str:
+    """Guides where a third of the lines sit in fences and prose has inline code."""
+    out = []
+    for i in range(lines):
+        block = i % 30
+        if block in (10, 20):
+            out.append("```markdown" if block == 10 else "```")
+        elif 10 < block < 20:
+            out.append(f"[example {i}](fake{i}.md) inside a fence")
+        elif block % 4 == 0:
+            out.append(f"Run `tool --flag [x](y.md)` then see [guide](guides/g{i % 13}.md).")
+        else:
+            out.append(f"Plain prose line {i} with no links at all, just words and punctuation.")
+    return "\n".join(out) + "\n"
+
+
+def _best(func, content: str, repeat: int) -> float:
+    timer = timeit.Timer(lambda: func(content))
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    cases = [
+        ("prose", generate_prose(lines)),
+        ("code", generate_code_heavy(lines)),
+    ]
+    print(f"{'case':<10} {'lines':>9} {'line loop':>11} {'tokenizer':>11} {'speedup':>8}")
+    for name, content in cases:
+        if _extract_links(content) != extract_by_line(content):
+            sys.exit(f"{name}: engines disagree")
+
+        by_line = _best(extract_by_line, content, repeat)
+        single = _best(_extract_links, content, repeat)
+        print(
+            f"{name:<10} {lines:>9} {by_line * 1000:>9.1f}ms {single * 1000:>9.1f}ms"
+            f" {by_line / single:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
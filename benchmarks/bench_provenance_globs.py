@@ -0,0 +1,76 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Provenance validation
+
+"""Compare the compiled provenance matcher with trying each pattern in turn.
+
+Usage: python benchmarks/bench_provenance_globs.py [FILES] [REPEAT]
+
+Generates canonical-path rules for many imported KBs (mostly `kb/docs/**`,
+some with wildcards and alternatives) and FILES paths across them, checks both
+engines agree, and prints the best-of-REPEAT time for each pattern count.
+"""
+
+import re
+import sys
+import timeit
+
+from kb_linter.globs import GlobMatcher, _split_top_level, translate
+
+
+def per_pattern_matcher(patterns: list[str]):
+    """One compiled regex per pattern, tried in turn for every path."""
+    regexes = [re.compile(translate(_split_top_level(p, "/"))) for p in patterns]
+
+    def matches(path: str) -> bool:
+        return any(regex.fullmatch(path) for regex in regexes)
+
+    return matches
+
+
+def generate_patterns(count: int) -> list[str]:
+    patterns = []
+    for i in range(count):
+        if i % 10 == 0:
+            patterns.append(f"kb{i}/{{docs,policies}}/*.md")
+        elif i % 10 == 5:
+            patterns.append(f"kb{i}/guides/**/index.md")
+        else:
+            patterns.append(f"kb{i}/docs/**")
+    return patterns
+
+
+def generate_paths(files: int, kbs: int) -> list[str]:
+    return [
+        f"kb{i % (kbs + 50)}/{('docs', 'notes', 'guides')[i % 3]}/area{i % 7}/page{i}.md"
+        for i in range(files)
+    ]
+
+
+def _best(matches, paths: list[str], repeat: int) -> float:
+    timer = timeit.Timer(lambda: [matches(path) for path in paths])
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"{'patterns':>8} {'files':>7} {'per pattern':>12} {'compiled':>10} {'speedup':>8}")
+    for count in (10, 100, 1000):
+        patterns = generate_patterns(count)
+        paths = generate_paths(files, count)
+        naive = per_pattern_matcher(patterns)
+        compiled = GlobMatcher(patterns).matches
+        if [naive(p) for p in paths] != [compiled(p) for p in paths]:
+            sys.exit(f"{count} patterns: engines disagree")
+
+        slow = _best(naive, paths, repeat)
+        fast = _best(compiled, paths, repeat)
+        print(
+            f"{count:>8} {files:>7} {slow * 1000:>10.1f}ms {fast * 1000:>8.1f}ms"
+            f" {slow / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
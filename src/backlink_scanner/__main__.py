@@ -3,8 +3,39 @@
 
 """CLI entry point for the backlink scanner."""
 
-from backlink_scanner.scanner import ScanResult, scan
-from tool_cli import run_tool
+import json
+import os
+import sys
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+
+from backlink_scanner.cache import DEFAULT_CACHE_DIR
+from backlink_scanner.changes import changed_since
+from backlink_scanner.scanner import (
+    DEFAULT_MAX_FILE_SIZE,
+    ScanResult,
+    scan,
+    scan_changed,
+    scan_changed_records,
+    scan_records,
+)
+from backlink_scanner.sqlite_index import DEFAULT_INDEX_FILE, TraceabilityIndex
+from backlink_scanner.watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, watch
+from tool_cli import (
+    Option,
+    Records,
+    UsageError,
+    parse_args,
+    positive_float,
+    positive_int,
+    run_tool,
+)
+from tool_cli.changes import normalize_changed, read_changed
+
+JOBS_OPTION = Option("--jobs", "jobs", parse=positive_int)
+MAX_FILE_SIZE_OPTION = Option("--max-file-size", "max_file_size", parse=positive_int)
+INDEX_PATH_OPTION = Option("--index-path", "index_path", parse=str)
 
 
 def _serialize(result: ScanResult) -> dict:
@@ -15,18 +46,203 @@ def _serialize(result: ScanResult) -> dict:
             "implementors": entry.implementors,
             "sections": entry.sections,
         }
-    return {
+    output: dict = {
         "specs": specs,
         "dangling": result.dangling,
         "orphans": result.orphans,
+        "skipped": result.skipped,
     }
+    if result.cache is not None:
+        output["cache"] = {"hits": result.cache.hits, "misses": result.cache.misses}
+    return output
+
+
+def _run(
+    root_dir: str,
+    jobs: int = 1,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    use_git_index: bool = False,
+    changed_stdin: bool = False,
+    since: str | None = None,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+    use_index: bool = False,
+    index_path: str | None = None,
+    records: bool = False,
+) -> ScanResult | Iterator[dict]:
+    """Scan with the CLI's defaults: caching on, stored under the scanned root.
+
+    With --changed (paths on stdin) or --since REV, only the changed files are
+    re-parsed and patched into the baseline from the previous scan. With --index
+    (or --index-path), the results are also written to the SQLite traceability index.
+    With records, returns the --ndjson record stream instead of a ScanResult.
+    """
+    full, changed_only = (scan_records, scan_changed_records) if records else (scan, scan_changed)
+    if use_index and index_path is None:
+        index_path = os.path.join(root_dir, DEFAULT_INDEX_FILE)
+
+    if not use_cache:
+        cache_dir = None
+    elif cache_dir is None:
+        cache_dir = os.path.join(root_dir, DEFAULT_CACHE_DIR)
+
+    if changed_stdin or since is not None:
+        if cache_dir is None:
+            raise UsageError("--changed and --since need the cache (remove --no-cache)")
+        if use_git_index:
+            raise UsageError("--changed and --since can't be combined with --git-index")
+        changed = read_changed(sys.stdin) if changed_stdin else []
+        if since is not None:
+            changed += changed_since(Path(root_dir), since)
+        return changed_only(
+            root_dir,
+            changed,
+            cache_dir=cache_dir,
+            jobs=jobs,
+            max_file_size=max_file_size,
+            index_path=index_path,
+        )
+
+    return full(
+        root_dir,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        use_git_index=use_git_index,
+        max_file_size=max_file_size,
+        index_path=index_path,
+    )
+
+
+def _emit_snapshot(result: ScanResult) -> None:
+    """Print one compact JSON snapshot per line so consumers can read line by line."""
+    print(json.dumps(_serialize(result)), flush=True)
+
+
+def _watch_main() -> None:
+    """Run --watch: print a snapshot now and after every change, until interrupted."""
+    options = [
+        JOBS_OPTION,
+        MAX_FILE_SIZE_OPTION,
+        Option("--watch", "watch"),
+        Option("--poll", "poll"),
+        Option("--interval", "interval", parse=positive_float),
+        Option("--debounce", "debounce", parse=positive_float),
+    ]
+    try:
+        args, kwargs = parse_args(sys.argv[1:], options)
+    except UsageError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    kwargs.pop("watch")
+
+    try:
+        watch(
+            args[0] if args else ".",
+            emit=_emit_snapshot,
+            interval=kwargs.pop("interval", DEFAULT_INTERVAL),
+            debounce=kwargs.pop("debounce", DEFAULT_DEBOUNCE),
+            **kwargs,
+        )
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+def _query_path(root: Path, value: str, flag: str) -> str:
+    """Turn a --file or --spec value into the root-relative form the index stores.
+
+    Absolute paths are made relative to the root. Relative paths are taken from
+    the current directory when it's inside the root (as git does with
+    pathspecs), and from the root otherwise.
+
+    Raises:
+        UsageError: If the path is outside the root.
+    """
+    path = Path(value)
+    if not path.is_absolute():
+        cwd = Path.cwd().resolve()
+        path = (cwd if cwd == root or root in cwd.parents else root) / path
+    # Resolve the directories (root is resolved) but not a symlinked file itself
+    path = Path(os.path.abspath(path))
+    normalized = normalize_changed(root, str(path.parent.resolve() / path.name))
+    if normalized is None:
+        raise UsageError(f"{flag} {value} is outside {root}")
+    return normalized
+
+
+def _query(
+    root_dir: str,
+    index_path: str | None = None,
+    file: str | None = None,
+    spec: str | None = None,
+    section: str | None = None,
+) -> dict:
+    """Answer one --file, --spec, or --section lookup from the traceability index."""
+    lookups = [
+        (name, value)
+        for name, value in (("file", file), ("spec", spec), ("section", section))
+        if value is not None
+    ]
+    if len(lookups) != 1:
+        raise UsageError("query needs exactly one of --file, --spec, or --section")
+
+    root = Path(root_dir).resolve()
+    path = Path(index_path) if index_path is not None else root / DEFAULT_INDEX_FILE
+    with TraceabilityIndex.open_existing(path, root) as db:
+        kind, value = lookups[0]
+        if kind == "file":
+            return db.query_file(_query_path(root, value, "--file"))
+        if kind == "spec":
+            return db.query_spec(_query_path(root, value, "--spec"))
+        return db.query_section(value)
+
+
+def _query_main() -> None:
+    """Run `query`: print the index's answer for one file, spec, or section as JSON."""
+    options = [
+        INDEX_PATH_OPTION,
+        Option("--file", "file", parse=str),
+        Option("--spec", "spec", parse=str),
+        Option("--section", "section", parse=str),
+    ]
+    try:
+        args, kwargs = parse_args(sys.argv[2:], options)
+        answer = _query(args[0] if args else ".", **kwargs)
+    except (FileNotFoundError, UsageError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(answer, indent=2))
 
 
 def main() -> None:
+    if sys.argv[1:2] == ["query"]:
+        _query_main()
+        return
+    if "--watch" in sys.argv[1:]:
+        _watch_main()
+        return
+
     run_tool(
-        runner=scan,
+        runner=_run,
         serializer=_serialize,
         has_failures=lambda r: bool(r.dangling or r.orphans),
+        records=Records(
+            runner=partial(_run, records=True),
+            is_failure=lambda record: record["type"] in ("dangling", "orphan"),
+        ),
+        options=[
+            JOBS_OPTION,
+            MAX_FILE_SIZE_OPTION,
+            Option("--no-cache", "use_cache", value=False),
+            Option("--cache-dir", "cache_dir", parse=str),
+            Option("--git-index", "use_git_index"),
+            Option("--changed", "changed_stdin"),
+            Option("--since", "since", parse=str),
+            Option("--index", "use_index"),
+            INDEX_PATH_OPTION,
+        ],
     )
 
 
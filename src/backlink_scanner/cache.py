@@ -0,0 +1,140 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Annotation cache
+
+"""Persistent per-file annotation cache keyed by file stat, plus the scan baseline."""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tool_cli.cache import StatKey, cache_file, is_racy, read_json, write_json_atomic
+
+CACHE_VERSION = 2
+
+DEFAULT_CACHE_DIR = ".cache/backlink-scanner"
+
+# (spec_paths, sections, skip reason or None)
+CachedAnnotations = tuple[list[str], dict[str, list[str]], str | None]
+Baseline = tuple[list[str], dict[str, CachedAnnotations]]
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss counters for one scan."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+def _read_json(path: Path, root: Path, settings: dict) -> dict | None:
+    """Read a cache file, returning None if missing, corrupt, or for another version/root.
+
+    Files written with different scan settings (e.g. size cap) are also rejected,
+    since their skip verdicts no longer apply.
+    """
+    data = read_json(path)
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_VERSION
+        or data.get("root") != str(root)
+        or data.get("settings") != settings
+    ):
+        return None
+    return data
+
+
+def _write_json(path: Path, root: Path, settings: dict, payload: dict) -> None:
+    """Atomically replace a cache file; failures are ignored (the cache is best-effort)."""
+    data = {"version": CACHE_VERSION, "root": str(root), "settings": settings, **payload}
+    write_json_atomic(path, data)
+
+
+def load_baseline(cache_dir: Path, root: Path, settings: dict) -> Baseline | None:
+    """Load the file list and per-file annotations from the last scan of root."""
+    data = _read_json(cache_file(cache_dir, root, "baseline"), root, settings)
+    if data is None:
+        return None
+    files = data.get("files")
+    annotations = data.get("annotations")
+    if not isinstance(files, list) or not isinstance(annotations, dict):
+        return None
+    return files, {file: (entry[0], entry[1], entry[2]) for file, entry in annotations.items()}
+
+
+def save_baseline(
+    cache_dir: Path,
+    root: Path,
+    settings: dict,
+    files: list[str],
+    annotations: dict[str, CachedAnnotations],
+) -> None:
+    """Store the file list and annotated or skipped files of a scan for incremental runs."""
+    payload = {
+        "files": files,
+        "annotations": {file: list(entry) for file, entry in annotations.items()},
+    }
+    _write_json(cache_file(cache_dir, root, "baseline"), root, settings, payload)
+
+
+class AnnotationCache:
+    """On-disk store of per-file annotations for a single scan root.
+
+    Entries are keyed by relative path and validated against the file's
+    (size, mtime_ns, inode). The cache is best-effort: unreadable or
+    incompatible cache files are treated as empty, and write failures are ignored.
+    """
+
+    def __init__(self, cache_dir: Path, root: Path, settings: dict) -> None:
+        self.path = cache_file(cache_dir, root, "annotations")
+        self.root = root
+        self.settings = settings
+        self.stats = CacheStats()
+        self._entries: dict[str, list] = {}
+        self._started_ns = time.time_ns()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        data = _read_json(self.path, self.root, self.settings)
+        if data is not None and isinstance(data.get("entries"), dict):
+            self._entries = data["entries"]
+
+    def get(self, file: str, key: StatKey | None) -> CachedAnnotations | None:
+        """Return cached (spec_paths, sections, skipped) if the file's stat key still matches."""
+        entry = self._entries.get(file)
+        if key is not None and entry is not None and tuple(entry[:3]) == key:
+            self.stats.hits += 1
+            return entry[3], entry[4], entry[5]
+        self.stats.misses += 1
+        return None
+
+    def put(
+        self,
+        file: str,
+        key: StatKey | None,
+        spec_paths: list[str],
+        sections: dict[str, list[str]],
+        skipped: str | None = None,
+    ) -> None:
+        """Store annotations (or the reason the file was skipped) under its stat key."""
+        if is_racy(key, self._started_ns):
+            self._entries.pop(file, None)
+        else:
+            self._entries[file] = [*key, spec_paths, sections, skipped]
+        self._dirty = True
+
+    def retain(self, files: list[str]) -> None:
+        """Drop entries for files that no longer exist in the scan."""
+        keep = set(files)
+        stale = [file for file in self._entries if file not in keep]
+        for file in stale:
+            del self._entries[file]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache file if anything changed."""
+        if not self._dirty:
+            return
+        _write_json(self.path, self.root, self.settings, {"entries": self._entries})
+        self._dirty = False
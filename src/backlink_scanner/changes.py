@@ -0,0 +1,42 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Changed-files mode
+
+"""Collect changed-file lists for incremental scans."""
+
+import subprocess
+from pathlib import Path
+
+from tool_cli import UsageError
+
+
+def _git_paths(root: Path, *args: str) -> list[str]:
+    proc = subprocess.run(
+        ["git", *args],
+        cwd=root,
+        capture_output=True,
+        check=True,
+    )
+    return [path.decode("utf-8", "surrogateescape") for path in proc.stdout.split(b"\0") if path]
+
+
+def changed_since(root: Path, rev: str) -> list[str]:
+    """List files changed in the working tree since a git revision, relative to root.
+
+    Includes modified, added, and deleted tracked files (renames count as a
+    delete plus an add) and untracked files that aren't ignored. Runs local git
+    commands only.
+
+    Raises:
+        UsageError: If git isn't available or the revision can't be resolved.
+    """
+    try:
+        diff = _git_paths(
+            root, "diff", "--name-only", "--no-renames", "--relative", "-z", rev, "--"
+        )
+        untracked = _git_paths(root, "ls-files", "--others", "--exclude-standard", "-z")
+    except OSError as e:
+        raise UsageError(f"cannot run git: {e}") from None
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode("utf-8", "replace").strip()
+        raise UsageError(f"cannot list changes since {rev}: {message}") from None
+    return diff + untracked
@@ -3,14 +3,45 @@
 
 """Core scanning logic for finding spec backlink annotations in source files."""
 
+import codecs
+import mmap
 import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import BinaryIO
+
+from backlink_scanner.cache import AnnotationCache, CacheStats, load_baseline, save_baseline
+from backlink_scanner.sqlite_index import TraceabilityIndex
+from tool_cli.cache import stat_key
+from tool_cli.changes import normalize_changed
+from tool_cli.git_index import tracked_files
+
+# Both annotation kinds in one pattern, run over the whole file with finditer.
+# [^\S\n] is whitespace that can't cross a line break, so every match is one
+# standalone line; the named group that matched tells the kinds apart.
+_ANNOTATION_LINE = (
+    r"[^\S\n]*(?://|#)[^\S\n]*spec"
+    r"(?::[^\S\n]*(?P<spec>[\w./\-]+)|-section:[^\S\n]*(?P<section>.+?))"
+    r"[^\S\n]*$"
+)
+_FENCE_LINE = r"[^\S\n]*```.*$"
+
+# Patterns start with a literal newline so the regex engine scans for it instead
+# of attempting a match at every offset (what a MULTILINE ^ costs). The first
+# line has no newline before it and is matched with the FIRST_LINE variants.
+ANNOTATION_PATTERN = re.compile(r"\n" + _ANNOTATION_LINE, re.MULTILINE)
+FENCE_PATTERN = re.compile(r"\n" + _FENCE_LINE, re.MULTILINE)
+FIRST_LINE_ANNOTATION_PATTERN = re.compile(_ANNOTATION_LINE, re.MULTILINE)
+FIRST_LINE_FENCE_PATTERN = re.compile(_FENCE_LINE, re.MULTILINE)
 
-SPEC_PATTERN = re.compile(r"^\s*(?://|#)\s*spec:\s*([\w./\-]+)\s*$")
-SPEC_SECTION_PATTERN = re.compile(r"^\s*(?://|#)\s*spec-section:\s*(.+?)\s*$")
-FENCE_PATTERN = re.compile(r"^\s*```")
+# Line breaks str.splitlines() honors besides \n and \r (the patterns above only
+# break lines at \n), split by whether they can occur in an ASCII-only buffer
+OTHER_ASCII_LINE_BREAKS = ("\v", "\f", "\x1c", "\x1d", "\x1e")
+OTHER_UNICODE_LINE_BREAKS = ("\x85", "\u2028", "\u2029")
 
 BINARY_EXTENSIONS = frozenset(
     {
@@ -38,6 +69,32 @@ BINARY_EXTENSIONS = frozenset(
 
 SKIP_DIRS = frozenset({".git", ".graft", ".venv", "node_modules", "__pycache__"})
 
+# Every spec annotation contains this marker; files without it can't contribute
+ANNOTATION_MARKER = b"spec:"
+
+# Files at least this large are searched through mmap instead of being read into memory
+MMAP_THRESHOLD = 1 << 20
+
+# Files larger than a configured cap are skipped (and reported under "skipped"); no cap by default
+DEFAULT_MAX_FILE_SIZE: int | None = None
+
+# Binary detection reads at most this many bytes from the start of a file
+SNIFF_SIZE = 8192
+
+# A file head with more than this fraction of invalid UTF-8 is treated as binary
+MAX_INVALID_UTF8_RATIO = 0.1
+
+# Skip reasons reported in ScanResult.skipped
+SKIP_BINARY = "binary"
+SKIP_TOO_LARGE = "too_large"
+SKIP_REASONS = (SKIP_BINARY, SKIP_TOO_LARGE)
+
+# Upper bound on remembered binary verdicts (cleared when exceeded)
+VERDICT_CACHE_LIMIT = 100_000
+
+# Target number of chunks handed to each worker; more chunks balance uneven file sizes
+CHUNKS_PER_WORKER = 4
+
 
 @dataclass
 class SpecEntry:
@@ -54,14 +111,158 @@ class ScanResult:
     specs: dict[str, SpecEntry] = field(default_factory=dict)
     dangling: list[str] = field(default_factory=list)
     orphans: list[str] = field(default_factory=list)
+    skipped: dict[str, int] = field(default_factory=dict)
+    cache: CacheStats | None = None
 
 
 @dataclass
 class _FileAnnotations:
-    """Annotations found in a single file."""
+    """Annotations found in a single file, or the reason it was skipped."""
 
     spec_paths: list[str] = field(default_factory=list)
     sections: dict[str, list[str]] = field(default_factory=dict)
+    skipped: str | None = None
+
+
+def _is_spec_file(path: str) -> bool:
+    """Spec files live in specs/; README files there are navigational and excluded."""
+    return (
+        path.startswith("specs/")
+        and path.endswith(".md")
+        and not path.endswith("/README.md")
+        and path != "specs/README.md"
+    )
+
+
+class SpecIndex:
+    """Spec-to-implementor and spec-to-section maps built from per-file annotations.
+
+    Files are added, replaced, or removed individually, so a baseline can be
+    patched with a few changed files instead of rescanning the whole tree.
+    """
+
+    def __init__(self) -> None:
+        self.files: set[str] = set()
+        self.annotations: dict[str, _FileAnnotations] = {}
+        self.skipped: dict[str, str] = {}
+        self._implementors: dict[str, set[str]] = {}
+        self._sections: dict[str, dict[str, set[str]]] = {}
+
+    def set_file(self, file: str, annotations: _FileAnnotations) -> None:
+        """Record a file, replacing any annotations it previously contributed."""
+        if file in self.annotations or file in self.skipped:
+            self.remove_file(file)
+        self.files.add(file)
+        if annotations.skipped is not None:
+            self.skipped[file] = annotations.skipped
+        if not annotations.spec_paths:
+            return
+
+        self.annotations[file] = annotations
+        for spec_path in annotations.spec_paths:
+            self._implementors.setdefault(spec_path, set()).add(file)
+        for spec_path, section_names in annotations.sections.items():
+            spec_sections = self._sections.setdefault(spec_path, {})
+            for section_name in section_names:
+                spec_sections.setdefault(section_name, set()).add(file)
+
+    def remove_file(self, file: str) -> None:
+        """Forget a file and every implementor and section entry it contributed."""
+        self.files.discard(file)
+        self.skipped.pop(file, None)
+        annotations = self.annotations.pop(file, None)
+        if annotations is None:
+            return
+
+        for spec_path in annotations.spec_paths:
+            implementors = self._implementors.get(spec_path)
+            if implementors is not None:
+                implementors.discard(file)
+                if not implementors:
+                    del self._implementors[spec_path]
+        for spec_path, section_names in annotations.sections.items():
+            spec_sections = self._sections.get(spec_path, {})
+            for section_name in section_names:
+                section_files = spec_sections.get(section_name)
+                if section_files is not None:
+                    section_files.discard(file)
+                    if not section_files:
+                        del spec_sections[section_name]
+            if not spec_sections:
+                self._sections.pop(spec_path, None)
+
+    def _entry(self, spec_path: str) -> SpecEntry:
+        spec_sections = self._sections.get(spec_path, {})
+        sections = {name: sorted(spec_sections[name]) for name in sorted(spec_sections)}
+        return SpecEntry(implementors=sorted(self._implementors[spec_path]), sections=sections)
+
+    def _orphans(self) -> list[str]:
+        """Spec files with no references, sorted."""
+        return sorted(f for f in self.files if _is_spec_file(f) and f not in self._implementors)
+
+    def _skip_counts(self) -> dict[str, int]:
+        skip_counts = dict.fromkeys(SKIP_REASONS, 0)
+        for reason in self.skipped.values():
+            skip_counts[reason] = skip_counts.get(reason, 0) + 1
+        return skip_counts
+
+    def result(self, root: Path) -> ScanResult:
+        """Build a ScanResult with sorted specs, implementors, sections, and findings."""
+        # Identify dangling references (referenced specs that don't exist)
+        dangling = sorted(sp for sp in self._implementors if not (root / sp).exists())
+
+        specs = {sp: self._entry(sp) for sp in sorted(self._implementors)}
+        return ScanResult(
+            specs=specs, dangling=dangling, orphans=self._orphans(), skipped=self._skip_counts()
+        )
+
+    def records(self, root: Path) -> Iterator[dict]:
+        """Yield the result as records, building each spec's entry only when it's yielded.
+
+        One record per spec (sorted), then per dangling reference and orphan
+        spec, then the skip counts; see `scan_records`.
+        """
+        dangling: list[str] = []
+        for spec_path in sorted(self._implementors):
+            entry = self._entry(spec_path)
+            yield {
+                "type": "spec",
+                "spec": spec_path,
+                "implementors": entry.implementors,
+                "sections": entry.sections,
+            }
+            if not (root / spec_path).exists():
+                dangling.append(spec_path)
+        for spec_path in dangling:
+            yield {"type": "dangling", "spec": spec_path}
+        for spec_path in self._orphans():
+            yield {"type": "orphan", "spec": spec_path}
+        yield {"type": "skipped", **self._skip_counts()}
+
+    def save_baseline(self, cache_dir: Path, root: Path, settings: dict) -> None:
+        """Persist the index so later runs can patch it with changed files."""
+        annotations = {
+            file: (entry.spec_paths, entry.sections, None)
+            for file, entry in self.annotations.items()
+        }
+        for file, reason in self.skipped.items():
+            annotations[file] = ([], {}, reason)
+        save_baseline(cache_dir, root, settings, sorted(self.files), annotations)
+
+    @classmethod
+    def load_baseline(cls, cache_dir: Path, root: Path, settings: dict) -> "SpecIndex | None":
+        """Rebuild an index from a stored baseline, or None if there isn't a usable one."""
+        baseline = load_baseline(cache_dir, root, settings)
+        if baseline is None:
+            return None
+        files, annotations = baseline
+        index = cls()
+        index.files.update(files)
+        for file, (spec_paths, sections, skipped) in annotations.items():
+            index.set_file(
+                file, _FileAnnotations(spec_paths=spec_paths, sections=sections, skipped=skipped)
+            )
+        return index
 
 
 def _is_binary(path: str) -> bool:
@@ -69,59 +270,285 @@ def _is_binary(path: str) -> bool:
     return ext in BINARY_EXTENSIONS
 
 
-def _get_files(root: Path) -> list[str]:
-    """Recursively collect file paths relative to root, skipping hidden/ignored dirs."""
+def _is_skipped_dir(name: str) -> bool:
+    return name in SKIP_DIRS or name.startswith(".")
+
+
+def _get_files(root: Path, use_git_index: bool = False) -> list[str]:
+    """Recursively collect file paths relative to root, skipping hidden/ignored dirs.
+
+    With use_git_index, candidates come from the tracked files in .git/index
+    (falling back to walking the tree outside a repository).
+    """
+    if use_git_index:
+        tracked = tracked_files(root)
+        if tracked is not None:
+            return [f for f in tracked if not any(_is_skipped_dir(d) for d in f.split("/")[:-1])]
+
     files: list[str] = []
     for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+        dirnames[:] = [d for d in dirnames if not _is_skipped_dir(d)]
         for filename in filenames:
             full_path = os.path.join(dirpath, filename)
             rel_path = os.path.relpath(full_path, root)
             files.append(rel_path)
-    return files
+    return sorted(files)
+
+
+# Binary verdicts keyed by (path, size, mtime_ns), so unchanged binaries are never reopened
+_binary_verdicts: dict[tuple[str, int, int], bool] = {}
+
+
+def _looks_binary(head: bytes) -> bool:
+    """Sniff a file head: NUL bytes or a high ratio of invalid UTF-8 mean binary."""
+    if b"\0" in head:
+        return True
+    if not head:
+        return False
+    # An incremental decoder leaves a multi-byte sequence cut off at the end undecoded
+    text = codecs.getincrementaldecoder("utf-8")("replace").decode(head)
+    return text.count("\ufffd") > len(head) * MAX_INVALID_UTF8_RATIO
 
 
-def _scan_file(root: Path, file: str) -> _FileAnnotations:
+def _remember_verdict(key: tuple[str, int, int], is_binary: bool) -> None:
+    if len(_binary_verdicts) >= VERDICT_CACHE_LIMIT:
+        _binary_verdicts.clear()
+    _binary_verdicts[key] = is_binary
+
+
+def _read_if_annotated(f: BinaryIO, head: bytes, size: int) -> bytes | None:
+    """Return a file's bytes, or None if they don't contain the annotation marker.
+
+    Files that fit in the sniffed head aren't read again. Large files are searched
+    through mmap, so files without annotations are never copied into memory.
+    """
+    if len(head) >= size:
+        data = head
+    elif size >= MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(ANNOTATION_MARKER) == -1:
+                return None
+            return mapped[:]
+    else:
+        data = head + f.read()
+    return data if ANNOTATION_MARKER in data else None
+
+
+def _read_text_file(full_path: Path, max_file_size: int | None) -> str | _FileAnnotations:
+    """Read a candidate file's text, or return empty annotations saying why it was skipped.
+
+    Applies, in order: the size cap, the remembered binary verdict, content
+    sniffing of the first SNIFF_SIZE bytes, and the `spec:` prefilter.
+    """
+    st = os.stat(full_path)
+    if max_file_size is not None and st.st_size > max_file_size:
+        return _FileAnnotations(skipped=SKIP_TOO_LARGE)
+
+    verdict_key = (str(full_path), st.st_size, st.st_mtime_ns)
+    if _binary_verdicts.get(verdict_key):
+        return _FileAnnotations(skipped=SKIP_BINARY)
+
+    with open(full_path, "rb") as f:
+        head = f.read(SNIFF_SIZE)
+        is_binary = _looks_binary(head)
+        _remember_verdict(verdict_key, is_binary)
+        if is_binary:
+            return _FileAnnotations(skipped=SKIP_BINARY)
+        data = _read_if_annotated(f, head, st.st_size)
+
+    if data is None:
+        return _FileAnnotations()
+    return data.decode("utf-8")
+
+
+def _scan_file(
+    root: Path, file: str, max_file_size: int | None = DEFAULT_MAX_FILE_SIZE
+) -> _FileAnnotations:
     """Extract spec paths and section references from annotations in a file."""
     if _is_binary(file):
-        return _FileAnnotations()
+        return _FileAnnotations(skipped=SKIP_BINARY)
 
-    full_path = root / file
     try:
-        content = full_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+        content = _read_text_file(root / file, max_file_size)
+    except (OSError, UnicodeDecodeError, ValueError):
+        # ValueError: mmap of a file truncated to empty after it was stat'ed
         return _FileAnnotations()
+    if isinstance(content, _FileAnnotations):
+        return content
+
+    return _extract_annotations(content, file.endswith(".md"))
+
+
+def _line_matches(
+    first_line: re.Pattern[str], rest: re.Pattern[str], content: str
+) -> Iterator[re.Match[str]]:
+    """Matches of a line pattern over the whole buffer, in order."""
+    match = first_line.match(content)
+    if match is not None:
+        yield match
+    yield from rest.finditer(content)
+
+
+def _fence_ranges(content: str) -> list[tuple[int, int]]:
+    """Line-end offsets of each markdown code fence block's opening and closing fence.
+
+    An annotation line lies inside a block when its end falls strictly between
+    the two. An unclosed fence runs past the end of the content.
+    """
+    ranges: list[tuple[int, int]] = []
+    opening: int | None = None
+    for match in _line_matches(FIRST_LINE_FENCE_PATTERN, FENCE_PATTERN, content):
+        if opening is None:
+            opening = match.end()
+        else:
+            ranges.append((opening, match.end()))
+            opening = None
+    if opening is not None:
+        ranges.append((opening, len(content) + 1))
+    return ranges
+
+
+def _has_other_line_breaks(content: str) -> bool:
+    """Whether content breaks lines anywhere other than at \\n (or \\r\\n).
+
+    Substring checks rather than a regex: they run at memchr speed, where a
+    character-class search costs as much as the extraction itself.
+    """
+    if "\r" in content and content.count("\r") != content.count("\r\n"):
+        return True
+    if any(brk in content for brk in OTHER_ASCII_LINE_BREAKS):
+        return True
+    return not content.isascii() and any(brk in content for brk in OTHER_UNICODE_LINE_BREAKS)
 
-    is_markdown = file.endswith(".md")
-    in_code_fence = False
+
+def _extract_annotations(content: str, is_markdown: bool) -> _FileAnnotations:
+    """Collect spec and section annotations in one pass over the whole buffer.
+
+    Lines are those of str.splitlines(). Matches inside markdown code fences
+    are dropped by walking the precomputed fence ranges alongside the (ordered)
+    matches. Section annotations attach to the most recent spec annotation.
+    """
+    if _has_other_line_breaks(content):
+        content = "\n".join(content.splitlines())
+    fences = _fence_ranges(content) if is_markdown and "```" in content else []
+    fence_index = 0
     annotations = _FileAnnotations()
     current_spec: str | None = None
 
-    for line in content.splitlines():
-        if is_markdown and FENCE_PATTERN.match(line):
-            in_code_fence = not in_code_fence
-            continue
-        if in_code_fence:
-            continue
-
-        spec_match = SPEC_PATTERN.match(line)
-        if spec_match:
-            spec_path = spec_match.group(1)
-            annotations.spec_paths.append(spec_path)
-            current_spec = spec_path
-            continue
-
-        section_match = SPEC_SECTION_PATTERN.match(line)
-        if section_match and current_spec is not None:
-            section_name = section_match.group(1)
-            if current_spec not in annotations.sections:
-                annotations.sections[current_spec] = []
-            annotations.sections[current_spec].append(section_name)
+    for match in _line_matches(FIRST_LINE_ANNOTATION_PATTERN, ANNOTATION_PATTERN, content):
+        if fences:
+            end = match.end()
+            while fence_index < len(fences) and fences[fence_index][1] < end:
+                fence_index += 1
+            if fence_index < len(fences) and fences[fence_index][0] < end:
+                continue
+
+        if match.lastgroup == "spec":
+            current_spec = match.group("spec")
+            annotations.spec_paths.append(current_spec)
+        elif current_spec is not None:
+            annotations.sections.setdefault(current_spec, []).append(match.group("section"))
 
     return annotations
 
 
-def scan(root_dir: str) -> ScanResult:
+def _scan_files(
+    root: Path,
+    files: list[str],
+    jobs: int,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+) -> list[_FileAnnotations]:
+    """Scan files, fanning out over a process pool when jobs > 1.
+
+    Results are returned in the same order as files, so merging is identical
+    to the serial path.
+    """
+    scan_one = partial(_scan_file, root, max_file_size=max_file_size)
+    if jobs <= 1 or len(files) < 2:
+        return [scan_one(file) for file in files]
+
+    workers = min(jobs, len(files))
+    chunksize = max(1, len(files) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan_one, files, chunksize=chunksize))
+
+
+def _scan_files_cached(
+    root: Path,
+    files: list[str],
+    jobs: int,
+    max_file_size: int | None,
+    cache: AnnotationCache,
+) -> list[_FileAnnotations]:
+    """Scan only files whose stat changed since the cache was written."""
+    results: list[_FileAnnotations | None] = []
+    keys = [stat_key(root / file) for file in files]
+    missing: list[int] = []
+
+    for index, (file, key) in enumerate(zip(files, keys, strict=True)):
+        cached = cache.get(file, key)
+        if cached is None:
+            results.append(None)
+            missing.append(index)
+        else:
+            spec_paths, sections, skipped = cached
+            results.append(
+                _FileAnnotations(spec_paths=spec_paths, sections=sections, skipped=skipped)
+            )
+
+    scanned = _scan_files(root, [files[i] for i in missing], jobs, max_file_size)
+    for index, annotations in zip(missing, scanned, strict=True):
+        results[index] = annotations
+        cache.put(
+            files[index],
+            keys[index],
+            annotations.spec_paths,
+            annotations.sections,
+            annotations.skipped,
+        )
+
+    cache.retain(files)
+    cache.save()
+    return results
+
+
+def _index_files(
+    root: Path,
+    files: list[str],
+    jobs: int,
+    max_file_size: int | None,
+    cache: AnnotationCache | None,
+) -> SpecIndex:
+    """Scan files (through the cache when given) into a fresh SpecIndex."""
+    if cache is None:
+        file_annotations = _scan_files(root, files, jobs, max_file_size)
+    else:
+        file_annotations = _scan_files_cached(root, files, jobs, max_file_size, cache)
+
+    index = SpecIndex()
+    for file, annotations in zip(files, file_annotations, strict=True):
+        index.set_file(file, annotations)
+    return index
+
+
+def _persist(
+    index: SpecIndex, root: Path, settings: dict, cache_dir: str | None, index_path: str | None
+) -> None:
+    """Store the scan baseline and update the traceability index, when enabled."""
+    if cache_dir is not None:
+        index.save_baseline(Path(cache_dir), root, settings)
+    if index_path is not None:
+        _sync_traceability_index(Path(index_path), root, index)
+
+
+def scan(
+    root_dir: str,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    use_git_index: bool = False,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+    index_path: str | None = None,
+) -> ScanResult:
     """Scan a directory for spec backlink annotations.
 
     Finds files containing annotations like `// spec: path/to/spec.md`
@@ -129,52 +556,153 @@ def scan(root_dir: str) -> ScanResult:
 
     Args:
         root_dir: The directory to scan.
+        jobs: Number of worker processes for file scanning (1 scans serially).
+        cache_dir: Directory for the persistent annotation cache and scan baseline
+            (None disables caching).
+        use_git_index: Enumerate files from .git/index instead of walking the tree.
+        max_file_size: Skip files larger than this many bytes (None for no limit).
+        index_path: SQLite traceability index to update with the results (None skips it).
 
     Returns:
-        ScanResult with specs, dangling references, and orphan specs.
+        ScanResult with specs, dangling references, orphan specs, and skipped file counts.
+    """
+    root = Path(root_dir).resolve()
+    settings = _cache_settings(max_file_size)
+    cache = AnnotationCache(Path(cache_dir), root, settings) if cache_dir is not None else None
+    index = _index_files(root, _get_files(root, use_git_index), jobs, max_file_size, cache)
+    _persist(index, root, settings, cache_dir, index_path)
+
+    result = index.result(root)
+    result.cache = cache.stats if cache is not None else None
+    return result
+
+
+def scan_records(
+    root_dir: str,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    use_git_index: bool = False,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+    index_path: str | None = None,
+) -> Iterator[dict]:
+    """Scan like `scan`, yielding the result as records as soon as each is final.
+
+    Records are one {"type": "spec", "spec", "implementors", "sections"} per
+    spec in sorted order, then {"type": "dangling", "spec"} and {"type":
+    "orphan", "spec"} findings, then {"type": "skipped", ...} counts and, with
+    a cache, {"type": "cache", "hits", "misses"}. Any file can add to any
+    spec, so the first record follows the last parsed file; but no ScanResult
+    is built, each spec's entry exists only while it's yielded, and the
+    baseline and traceability index are written after the findings.
     """
     root = Path(root_dir).resolve()
-    files = _get_files(root)
-    spec_implementors: dict[str, set[str]] = {}
-    spec_sections: dict[str, dict[str, set[str]]] = {}
+    settings = _cache_settings(max_file_size)
+    cache = AnnotationCache(Path(cache_dir), root, settings) if cache_dir is not None else None
+    index = _index_files(root, _get_files(root, use_git_index), jobs, max_file_size, cache)
+    yield from index.records(root)
+    _persist(index, root, settings, cache_dir, index_path)
+    if cache is not None:
+        yield {"type": "cache", "hits": cache.stats.hits, "misses": cache.stats.misses}
+
+
+def _sync_traceability_index(path: Path, root: Path, index: SpecIndex) -> None:
+    """Upsert the files whose annotations changed into the SQLite traceability index."""
+    with TraceabilityIndex(path, root) as db:
+        db.sync(index.annotations)
+
+
+def _cache_settings(max_file_size: int | None) -> dict:
+    """Scan settings that invalidate cached skip verdicts when they change."""
+    return {"max_file_size": max_file_size}
+
+
+def _normalize_changed(root: Path, path: str) -> str | None:
+    """Convert a changed-file path to a scan-relative path, or None if it's out of scope."""
+    normalized = normalize_changed(root, path)
+    if normalized is None or any(_is_skipped_dir(d) for d in normalized.split("/")[:-1]):
+        return None
+    return normalized
+
+
+def _patched_index(
+    root: Path, changed: list[str], cache_dir: str, jobs: int, max_file_size: int | None
+) -> SpecIndex | None:
+    """The stored baseline with changed files re-parsed, or None without a baseline."""
+    index = SpecIndex.load_baseline(Path(cache_dir), root, _cache_settings(max_file_size))
+    if index is None:
+        return None
+
+    paths = sorted({p for p in (_normalize_changed(root, c) for c in changed) if p is not None})
+    present = [p for p in paths if (root / p).is_file()]
+    for path in paths:
+        index.remove_file(path)
+    scanned = _scan_files(root, present, jobs, max_file_size)
+    for path, annotations in zip(present, scanned, strict=True):
+        index.set_file(path, annotations)
+    return index
+
+
+def scan_changed(
+    root_dir: str,
+    changed: list[str],
+    cache_dir: str,
+    jobs: int = 1,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+    index_path: str | None = None,
+) -> ScanResult:
+    """Re-scan only changed files and patch them into the stored baseline.
+
+    Changed paths that no longer exist are removed from the baseline; existing
+    ones are re-parsed. The result matches a full scan as long as every file
+    changed since the baseline was written is listed. Without a baseline, this
+    falls back to a full scan (which writes one).
 
-    for file in files:
-        annotations = _scan_file(root, file)
-        for spec_path in annotations.spec_paths:
-            if spec_path not in spec_implementors:
-                spec_implementors[spec_path] = set()
-            spec_implementors[spec_path].add(file)
+    Args:
+        root_dir: The directory to scan.
+        changed: Paths of added, modified, or deleted files (relative to root_dir or absolute).
+        cache_dir: Directory holding the baseline written by a previous scan.
+        jobs: Number of worker processes for re-parsing changed files.
+        max_file_size: Skip files larger than this many bytes (None for no limit).
+        index_path: SQLite traceability index to update with the results (None skips it).
 
-        for spec_path, section_names in annotations.sections.items():
-            if spec_path not in spec_sections:
-                spec_sections[spec_path] = {}
-            for section_name in section_names:
-                if section_name not in spec_sections[spec_path]:
-                    spec_sections[spec_path][section_name] = set()
-                spec_sections[spec_path][section_name].add(file)
-
-    # Find spec files in the specs/ directory (excluding README/index navigation files)
-    spec_files = [
-        f
-        for f in files
-        if f.startswith("specs/")
-        and f.endswith(".md")
-        and not f.endswith("/README.md")
-        and f != "specs/README.md"
-    ]
-
-    # Identify dangling references (referenced specs that don't exist)
-    dangling = [sp for sp in spec_implementors if not (root / sp).exists()]
-
-    # Identify orphan specs (spec files with no references)
-    orphans = [f for f in spec_files if f not in spec_implementors]
-
-    # Build output with sorted implementors and sections
-    specs: dict[str, SpecEntry] = {}
-    for sp, implementors in spec_implementors.items():
-        sections: dict[str, list[str]] = {}
-        if sp in spec_sections:
-            sections = {name: sorted(files) for name, files in spec_sections[sp].items()}
-        specs[sp] = SpecEntry(implementors=sorted(implementors), sections=sections)
-
-    return ScanResult(specs=specs, dangling=dangling, orphans=orphans)
+    Returns:
+        ScanResult with specs, dangling references, orphan specs, and skipped file counts.
+    """
+    root = Path(root_dir).resolve()
+    index = _patched_index(root, changed, cache_dir, jobs, max_file_size)
+    if index is None:
+        return scan(
+            root_dir,
+            jobs=jobs,
+            cache_dir=cache_dir,
+            max_file_size=max_file_size,
+            index_path=index_path,
+        )
+
+    _persist(index, root, _cache_settings(max_file_size), cache_dir, index_path)
+    return index.result(root)
+
+
+def scan_changed_records(
+    root_dir: str,
+    changed: list[str],
+    cache_dir: str,
+    jobs: int = 1,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+    index_path: str | None = None,
+) -> Iterator[dict]:
+    """Patch the baseline like `scan_changed`, yielding records like `scan_records`."""
+    root = Path(root_dir).resolve()
+    index = _patched_index(root, changed, cache_dir, jobs, max_file_size)
+    if index is None:
+        yield from scan_records(
+            root_dir,
+            jobs=jobs,
+            cache_dir=cache_dir,
+            max_file_size=max_file_size,
+            index_path=index_path,
+        )
+        return
+
+    yield from index.records(root)
+    _persist(index, root, _cache_settings(max_file_size), cache_dir, index_path)
@@ -0,0 +1,264 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Traceability index
+
+"""SQLite-backed traceability index answering spec/file/section queries."""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from tool_cli import UsageError
+
+SCHEMA_VERSION = "1"
+
+DEFAULT_INDEX_FILE = ".cache/backlink-scanner/traceability.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS specs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS implementors (
+    spec_id INTEGER NOT NULL REFERENCES specs(id),
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    PRIMARY KEY (spec_id, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS implementors_by_file ON implementors (file_id, spec_id);
+CREATE TABLE IF NOT EXISTS sections (
+    spec_id INTEGER NOT NULL REFERENCES specs(id),
+    name TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    PRIMARY KEY (spec_id, name, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sections_by_name ON sections (name, spec_id, file_id);
+CREATE INDEX IF NOT EXISTS sections_by_file ON sections (file_id, spec_id, name);
+"""
+
+
+class FileAnnotations(Protocol):
+    """Per-file annotations as produced by the scanner."""
+
+    spec_paths: list[str]
+    sections: dict[str, list[str]]
+
+
+@dataclass
+class SyncStats:
+    """How many files an index sync wrote or deleted."""
+
+    upserted: int = 0
+    removed: int = 0
+
+
+def _digest(annotations: FileAnnotations) -> str:
+    payload = json.dumps([annotations.spec_paths, annotations.sections], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class TraceabilityIndex:
+    """Specs, files, and sections tables with indexes in each direction.
+
+    Syncing compares a digest of each file's annotations with the stored one,
+    so only files whose annotations changed are rewritten.
+    """
+
+    def __init__(self, path: Path, root: Path, read_only: bool = False) -> None:
+        self.path = path
+        self.root = root
+        if read_only:
+            self._conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+            self._check_meta()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.executescript(SCHEMA)
+            self._reset_if_stale()
+
+    @classmethod
+    def open_existing(cls, path: Path, root: Path) -> "TraceabilityIndex":
+        """Open an index written by a previous scan, read-only.
+
+        Raises:
+            FileNotFoundError: If no index exists at path.
+            UsageError: If the index was built for another root or schema version,
+                or isn't a traceability index.
+        """
+        if not path.is_file():
+            raise FileNotFoundError(
+                f"Traceability index not found: {path} (run a scan with --index)"
+            )
+        return cls(path, root, read_only=True)
+
+    def _check_meta(self) -> None:
+        """Refuse (rather than clear) an index built for another root or schema version."""
+        try:
+            meta = self._meta()
+        except sqlite3.DatabaseError:
+            self.close()
+            raise UsageError(f"{self.path} is not a traceability index") from None
+        if meta != self._expected_meta():
+            self.close()
+            raise UsageError(
+                f"{self.path} indexes {meta.get('root', 'another root')} "
+                f"(schema {meta.get('schema', '?')}), not {self.root} "
+                f"(schema {SCHEMA_VERSION}); query that root or re-run a scan with --index"
+            )
+
+    def _meta(self) -> dict[str, str]:
+        return dict(self._conn.execute("SELECT key, value FROM meta"))
+
+    def _expected_meta(self) -> dict[str, str]:
+        return {"schema": SCHEMA_VERSION, "root": str(self.root)}
+
+    def _reset_if_stale(self) -> None:
+        """Clear the index if it was built for another root or schema version."""
+        expected = self._expected_meta()
+        if self._meta() == expected:
+            return
+        with self._conn:
+            for table in ("sections", "implementors", "specs", "files", "meta"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", expected.items())
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "TraceabilityIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _spec_id(self, spec_path: str) -> int:
+        self._conn.execute("INSERT OR IGNORE INTO specs (path) VALUES (?)", (spec_path,))
+        row = self._conn.execute("SELECT id FROM specs WHERE path = ?", (spec_path,)).fetchone()
+        return row[0]
+
+    def _delete_file(self, file_id: int) -> None:
+        self._conn.execute("DELETE FROM implementors WHERE file_id = ?", (file_id,))
+        self._conn.execute("DELETE FROM sections WHERE file_id = ?", (file_id,))
+
+    def sync(self, annotations: Mapping[str, FileAnnotations]) -> SyncStats:
+        """Make the index match the given annotated files, upserting only changed ones."""
+        stats = SyncStats()
+        stored = {
+            path: (file_id, digest)
+            for file_id, path, digest in self._conn.execute("SELECT id, path, digest FROM files")
+        }
+
+        with self._conn:
+            for path, (file_id, _digest_value) in stored.items():
+                if path not in annotations:
+                    self._delete_file(file_id)
+                    self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                    stats.removed += 1
+
+            for path, file_annotations in annotations.items():
+                digest = _digest(file_annotations)
+                existing = stored.get(path)
+                if existing is not None and existing[1] == digest:
+                    continue
+                self.upsert_file(path, file_annotations, digest)
+                stats.upserted += 1
+
+            if stats.removed or stats.upserted:
+                self._conn.execute(
+                    "DELETE FROM specs WHERE id NOT IN (SELECT spec_id FROM implementors)"
+                )
+        return stats
+
+    def upsert_file(
+        self, path: str, annotations: FileAnnotations, digest: str | None = None
+    ) -> None:
+        """Replace one file's implementor and section rows."""
+        digest = digest or _digest(annotations)
+        self._conn.execute(
+            "INSERT INTO files (path, digest) VALUES (?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET digest = excluded.digest",
+            (path, digest),
+        )
+        file_id = self._conn.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()[0]
+        self._delete_file(file_id)
+
+        for spec_path in dict.fromkeys(annotations.spec_paths):
+            self._conn.execute(
+                "INSERT OR IGNORE INTO implementors (spec_id, file_id) VALUES (?, ?)",
+                (self._spec_id(spec_path), file_id),
+            )
+        for spec_path, names in annotations.sections.items():
+            spec_id = self._spec_id(spec_path)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sections (spec_id, name, file_id) VALUES (?, ?, ?)",
+                [(spec_id, name, file_id) for name in names],
+            )
+
+    def query_file(self, path: str) -> dict:
+        """Specs a file implements, with the sections it references for each."""
+        specs: dict[str, list[str]] = {
+            spec: []
+            for (spec,) in self._conn.execute(
+                "SELECT s.path FROM files f "
+                "JOIN implementors i ON i.file_id = f.id "
+                "JOIN specs s ON s.id = i.spec_id "
+                "WHERE f.path = ? ORDER BY s.path",
+                (path,),
+            )
+        }
+        for spec, name in self._conn.execute(
+            "SELECT s.path, x.name FROM files f "
+            "JOIN sections x ON x.file_id = f.id "
+            "JOIN specs s ON s.id = x.spec_id "
+            "WHERE f.path = ? ORDER BY s.path, x.name",
+            (path,),
+        ):
+            specs.setdefault(spec, []).append(name)
+        return {"file": path, "specs": specs}
+
+    def query_spec(self, path: str) -> dict:
+        """Implementors of a spec and the files covering each of its sections."""
+        implementors = [
+            file
+            for (file,) in self._conn.execute(
+                "SELECT f.path FROM specs s "
+                "JOIN implementors i ON i.spec_id = s.id "
+                "JOIN files f ON f.id = i.file_id "
+                "WHERE s.path = ? ORDER BY f.path",
+                (path,),
+            )
+        ]
+        sections: dict[str, list[str]] = {}
+        for name, file in self._conn.execute(
+            "SELECT x.name, f.path FROM specs s "
+            "JOIN sections x ON x.spec_id = s.id "
+            "JOIN files f ON f.id = x.file_id "
+            "WHERE s.path = ? ORDER BY x.name, f.path",
+            (path,),
+        ):
+            sections.setdefault(name, []).append(file)
+        return {"spec": path, "implementors": implementors, "sections": sections}
+
+    def query_section(self, name: str) -> dict:
+        """Files covering a section name, grouped by spec."""
+        specs: dict[str, list[str]] = {}
+        for spec, file in self._conn.execute(
+            "SELECT s.path, f.path FROM sections x "
+            "JOIN specs s ON s.id = x.spec_id "
+            "JOIN files f ON f.id = x.file_id "
+            "WHERE x.name = ? ORDER BY s.path, f.path",
+            (name,),
+        ):
+            specs.setdefault(spec, []).append(file)
+        return {"section": name, "specs": specs}
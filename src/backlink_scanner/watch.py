@@ -0,0 +1,331 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Watch mode
+
+"""Watch mode: keep a live scan result and update it from file change events."""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol
+
+from backlink_scanner.scanner import (
+    DEFAULT_MAX_FILE_SIZE,
+    ScanResult,
+    SpecIndex,
+    _get_files,
+    _is_skipped_dir,
+    _normalize_changed,
+    _scan_files,
+)
+from tool_cli.cache import StatKey, stat_key
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 0.2
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class ChangeSource(Protocol):
+    """Source of file change notifications for a scan root.
+
+    Any class implementing these methods satisfies this protocol.
+    """
+
+    def wait(self, timeout: float) -> set[str] | None:
+        """Wait up to timeout seconds for changes.
+
+        Returns:
+            Changed paths (files or directories) relative to the root, empty if
+            nothing changed, or None if changes were lost and a full rescan is needed.
+        """
+        ...  # pragma: no cover
+
+    def close(self) -> None:
+        """Release any resources held by the source."""
+        ...  # pragma: no cover
+
+
+class PollingChangeSource:
+    """Detects changes by re-listing the tree and comparing file stat keys."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> dict[str, StatKey | None]:
+        return {file: stat_key(self.root / file) for file in _get_files(self.root)}
+
+    def wait(self, timeout: float) -> set[str] | None:
+        time.sleep(timeout)
+        previous = self._snapshot
+        self._snapshot = self._take_snapshot()
+        changed = {f for f, key in self._snapshot.items() if previous.get(f) != key}
+        changed.update(f for f in previous if f not in self._snapshot)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyChangeSource:
+    """Linux inotify watches on every scanned directory.
+
+    Raises OSError from the constructor when inotify isn't available or a
+    directory can't be watched (e.g. ENOSPC once max_user_watches is used up),
+    and from wait() when a new directory can't be, so callers can fall back to
+    polling instead of missing changes under it.
+    """
+
+    def __init__(self, root: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        self._fd = fd
+        self._dirs: dict[int, str] = {}
+        try:
+            self._add_tree("")
+        except OSError:
+            os.close(fd)
+            raise
+
+    def _add_watch(self, rel_dir: str) -> None:
+        path = self.root / rel_dir if rel_dir else self.root
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = rel_dir
+            return
+        code = ctypes.get_errno()
+        # A directory removed since it was listed has nothing left to watch
+        if code != errno.ENOENT:
+            raise OSError(code, f"can't watch {path}: {os.strerror(code)}")
+
+    def _add_tree(self, rel_dir: str) -> set[str]:
+        """Watch a directory and its subdirectories; return the files found in them."""
+        found: set[str] = set()
+        top = self.root / rel_dir if rel_dir else self.root
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not _is_skipped_dir(d)]
+            rel = os.path.relpath(dirpath, self.root)
+            rel = "" if rel == "." else rel.replace(os.sep, "/")
+            self._add_watch(rel)
+            found.update(f"{rel}/{name}" if rel else name for name in filenames)
+        return found
+
+    def wait(self, timeout: float) -> set[str] | None:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[str] = set()
+        overflow = False
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, pos)
+                pos += _EVENT_HEADER.size
+                name = os.fsdecode(data[pos : pos + length].rstrip(b"\0"))
+                pos += length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                rel_dir = self._dirs.get(wd)
+                if rel_dir is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._dirs[wd]
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF) or not name:
+                    continue
+
+                path = f"{rel_dir}/{name}" if rel_dir else name
+                if mask & IN_ISDIR:
+                    if _is_skipped_dir(name):
+                        continue
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        changed.update(self._add_tree(path))
+                changed.add(path)
+
+        return None if overflow else changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def default_change_source(root: Path, poll: bool = False) -> ChangeSource:
+    """Use inotify where available, otherwise poll."""
+    if not poll:
+        try:
+            return InotifyChangeSource(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingChangeSource(root)
+
+
+class LiveScan:
+    """An in-memory scan result patched incrementally as files change."""
+
+    def __init__(
+        self, root: Path, jobs: int = 1, max_file_size: int | None = DEFAULT_MAX_FILE_SIZE
+    ) -> None:
+        self.root = root
+        self.jobs = jobs
+        self.max_file_size = max_file_size
+        self.index = self._full_index()
+        self.result = self.index.result(root)
+
+    def _full_index(self) -> SpecIndex:
+        files = _get_files(self.root)
+        index = SpecIndex()
+        scanned = _scan_files(self.root, files, self.jobs, self.max_file_size)
+        for file, annotations in zip(files, scanned, strict=True):
+            index.set_file(file, annotations)
+        return index
+
+    def _expand(self, changed: set[str]) -> list[str]:
+        """Expand changed directories to the files under them (known and on disk)."""
+        paths: set[str] = set()
+        for raw in changed:
+            path = _normalize_changed(self.root, raw)
+            if path is None:
+                continue
+            paths.add(path)
+            prefix = path + "/"
+            paths.update(f for f in self.index.files if f.startswith(prefix))
+            if (self.root / path).is_dir():
+                paths.update(prefix + f for f in _get_files(self.root / path))
+        return sorted(paths)
+
+    def apply(self, changed: set[str] | None) -> bool:
+        """Apply changed paths (None means rescan everything).
+
+        Returns:
+            True if the scan result changed.
+        """
+        if changed is None:
+            self.index = self._full_index()
+        else:
+            paths = self._expand(changed)
+            present = [p for p in paths if (self.root / p).is_file()]
+            for path in paths:
+                self.index.remove_file(path)
+            scanned = _scan_files(self.root, present, self.jobs, self.max_file_size)
+            for path, annotations in zip(present, scanned, strict=True):
+                self.index.set_file(path, annotations)
+
+        result = self.index.result(self.root)
+        if result == self.result:
+            return False
+        self.result = result
+        return True
+
+
+def watch(
+    root_dir: str,
+    emit: Callable[[ScanResult], None],
+    source: ChangeSource | None = None,
+    interval: float = DEFAULT_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    jobs: int = 1,
+    max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+    poll: bool = False,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Emit a scan result, then a fresh one each time the result changes.
+
+    Bursts of events are debounced: updates are applied once no new change
+    has arrived for `debounce` seconds.
+
+    Args:
+        root_dir: The directory to watch.
+        emit: Called with the initial result and each changed result.
+        source: Change notifications (defaults to inotify, falling back to polling).
+            A source whose wait() raises OSError is replaced by polling, with a rescan.
+        interval: Seconds to wait for changes per loop iteration (the polling period).
+        debounce: Quiet period that ends a burst of changes.
+        jobs: Number of worker processes for re-parsing.
+        max_file_size: Skip files larger than this many bytes (None for no limit).
+        poll: Force polling even where inotify is available.
+        should_stop: Checked once per loop iteration; True ends the watch.
+    """
+    root = Path(root_dir).resolve()
+    if not root.is_dir():
+        raise FileNotFoundError(f"Directory not found: {root_dir}")
+
+    # Start watching before the initial scan so no change falls between the two
+    if source is None:
+        source = default_change_source(root, poll)
+    live = LiveScan(root, jobs, max_file_size)
+    emit(live.result)
+
+    def wait(timeout: float) -> set[str] | None:
+        nonlocal source
+        try:
+            return source.wait(timeout)
+        except OSError:
+            # The source can't follow the tree any more (e.g. out of inotify
+            # watches); poll from now on, and rescan since changes were missed
+            source.close()
+            source = PollingChangeSource(root)
+            return None
+
+    try:
+        while not should_stop():
+            changed = wait(interval)
+            if changed is not None and not changed:
+                continue
+            while changed is not None:
+                more = wait(debounce)
+                if more is None:
+                    changed = None
+                elif not more:
+                    break
+                else:
+                    changed |= more
+            if live.apply(changed):
+                emit(live.result)
+    finally:
+        source.close()
@@ -3,29 +3,57 @@
 
 """CLI entry point for the KB linter."""
 
+import os
+
+from kb_linter.cache import DEFAULT_CACHE_DIR
 from kb_linter.linter import LintResult, lint
-from tool_cli import run_tool
+from tool_cli import Option, positive_int, run_tool
 
 
 def _serialize(result: LintResult) -> dict:
     """Convert LintResult to a JSON-serializable dict."""
+    summary = {
+        "files_checked": result.files_checked,
+        "files_passing": result.files_checked - len({v.file for v in result.violations}),
+        "violations": len(result.violations),
+    }
+    if result.cache_hits is not None:
+        summary["cache_hits"] = result.cache_hits
+        summary["cache_misses"] = result.cache_misses
     return {
         "violations": [
             {"file": v.file, "rule": v.rule, "message": v.message} for v in result.violations
         ],
-        "summary": {
-            "files_checked": result.files_checked,
-            "files_passing": result.files_checked - len({v.file for v in result.violations}),
-            "violations": len(result.violations),
-        },
+        "summary": summary,
     }
 
 
+def _run(
+    root_dir: str,
+    use_git_index: bool = False,
+    jobs: int = 1,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+) -> LintResult:
+    """Lint with the CLI's defaults: the result cache is stored under the linted root."""
+    if not use_cache:
+        cache_dir = None
+    elif cache_dir is None:
+        cache_dir = os.path.join(root_dir, DEFAULT_CACHE_DIR)
+    return lint(root_dir, use_git_index=use_git_index, jobs=jobs, cache_dir=cache_dir)
+
+
 def main() -> None:
     run_tool(
-        runner=lint,
+        runner=_run,
         serializer=_serialize,
         has_failures=lambda r: bool(r.violations),
+        options=[
+            Option("--git-index", "use_git_index"),
+            Option("--jobs", "jobs", parse=positive_int),
+            Option("--no-cache", "use_cache", value=False),
+            Option("--cache-dir", "cache_dir", parse=str),
+        ],
     )
 
 
@@ -0,0 +1,123 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Result cache
+
+"""Persistent per-file lint results keyed by content hash, under a hash of the rules."""
+
+import hashlib
+import time
+from pathlib import Path
+
+from tool_cli.cache import StatKey, is_racy, read_json, write_json_atomic
+
+LINT_CACHE_VERSION = 2
+
+DEFAULT_CACHE_DIR = ".cache/kb-linter"
+
+# A file's violations as (rule, message) pairs
+CachedViolations = list[tuple[str, str]]
+
+
+def content_digest(path: Path) -> str | None:
+    """BLAKE2b digest of a file's bytes, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "blake2b").hexdigest()[:32]
+    except OSError:
+        return None
+
+
+def lint_cache_file(cache_dir: Path, rules_key: str) -> Path:
+    """Cache file for one rules key, whichever root (or checkout path) is linted."""
+    return cache_dir / f"lint-{rules_key}.json"
+
+
+class LintCache:
+    """On-disk store of per-file violations under one rules key.
+
+    Entries are keyed by relative path and valid while the file's content
+    digest matches, so fresh checkouts (new mtimes and inodes) still hit. A
+    file whose (size, mtime_ns, inode) also matches isn't even hashed. The
+    whole cache belongs to one rules key (a hash of the effective config);
+    a different key uses a different file. The file is named by the rules key
+    alone, so copies of a tree at different paths (CI workspaces, worktrees)
+    share it. It's compact JSON replaced atomically, so concurrent runs
+    sharing it never see a partial write.
+    """
+
+    def __init__(self, cache_dir: Path, rules_key: str) -> None:
+        self.path = lint_cache_file(cache_dir, rules_key)
+        self.rules_key = rules_key
+        self.hits = 0
+        self.misses = 0
+        # file -> [digest, stat key or None, violations]
+        self._entries: dict[str, list] = {}
+        self._started_ns = time.time_ns()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        data = read_json(self.path)
+        if (
+            isinstance(data, dict)
+            and data.get("version") == LINT_CACHE_VERSION
+            and data.get("rules") == self.rules_key
+            and isinstance(data.get("entries"), dict)
+        ):
+            self._entries = data["entries"]
+
+    def get(
+        self, file: str, path: Path, key: StatKey | None
+    ) -> tuple[str | None, CachedViolations | None]:
+        """Look a file up, hashing it unless its stat key matches.
+
+        Returns the file's digest (None if unreadable) and its cached
+        violations, or None for them on a miss.
+        """
+        entry = self._entries.get(file)
+        if (
+            entry is not None
+            and key is not None
+            and entry[1] is not None
+            and tuple(entry[1]) == key
+        ):
+            self.hits += 1
+            return entry[0], [(rule, message) for rule, message in entry[2]]
+
+        digest = content_digest(path)
+        if entry is not None and digest is not None and entry[0] == digest:
+            self.hits += 1
+            stat = None if is_racy(key, self._started_ns) else list(key)
+            if entry[1] != stat:
+                entry[1] = stat
+                self._dirty = True
+            return digest, [(rule, message) for rule, message in entry[2]]
+        self.misses += 1
+        return digest, None
+
+    def put(
+        self, file: str, key: StatKey | None, digest: str | None, violations: CachedViolations
+    ) -> None:
+        """Store a file's violations under its digest (unreadable files aren't stored)."""
+        if digest is None:
+            self._entries.pop(file, None)
+        else:
+            stat = None if is_racy(key, self._started_ns) else list(key)
+            self._entries[file] = [digest, stat, [list(v) for v in violations]]
+        self._dirty = True
+
+    def retain(self, files: list[str]) -> None:
+        """Drop entries for files that are no longer linted."""
+        keep = set(files)
+        stale = [file for file in self._entries if file not in keep]
+        for file in stale:
+            del self._entries[file]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache file if anything changed."""
+        if not self._dirty:
+            return
+        data = {"version": LINT_CACHE_VERSION, "rules": self.rules_key, "entries": self._entries}
+        write_json_atomic(self.path, data)
+        self._dirty = False
@@ -0,0 +1,211 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Rules
+
+"""A markdown file parsed lazily into the parts lint rules read."""
+
+import re
+from collections.abc import Collection, Iterator
+from typing import NamedTuple, TextIO
+
+# Parts of a document a rule can declare it needs
+FRONTMATTER = "frontmatter"
+HEADINGS = "headings"
+BODY = "body"
+PARTS = frozenset({FRONTMATTER, HEADINGS, BODY})
+
+# Frontmatter without a closing `---` within this many characters is treated as
+# missing, so a file with an unterminated fence isn't read to the end for it
+MAX_FRONTMATTER_CHARS = 64 * 1024
+
+# ATX headings: up to three spaces of indentation, 1-6 `#`, then a space or the line end
+HEADING_PATTERN = re.compile(r" {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*")
+
+# Code fence lines (leading whitespace allowed), capturing the fence run
+FENCE_PATTERN = re.compile(r"[^\S\n]*(`{3,}|~{3,})")
+
+
+class Heading(NamedTuple):
+    """An ATX heading outside code fences."""
+
+    level: int
+    title: str
+    line: int  # 1-based
+
+
+def _is_fence(line: str) -> bool:
+    """Whether a line opens or closes frontmatter: `---` and optional trailing whitespace."""
+    return line.startswith("---") and line.endswith("\n") and not line[3:].strip()
+
+
+def _read_frontmatter(stream: TextIO) -> tuple[str | None, list[str]]:
+    """Read a frontmatter block from the top of a file, stopping at its closing fence.
+
+    Returns the text between the fences (None if the file doesn't open with a
+    fence or none closes it within MAX_FRONTMATTER_CHARS) and the lines read,
+    the last of which may be cut short by the limit.
+    """
+    first = stream.readline(MAX_FRONTMATTER_CHARS)
+    head = [first] if first else []
+    if not _is_fence(first):
+        return None, head
+    size = len(first)
+    while size < MAX_FRONTMATTER_CHARS:
+        line = stream.readline(MAX_FRONTMATTER_CHARS - size)
+        if not line:
+            break
+        head.append(line)
+        size += len(line)
+        if _is_fence(line):
+            return "".join(head[1:-1]), head
+    return None, head
+
+
+def parse_frontmatter(text: str) -> dict[str, str]:
+    """Top-level `key: value` pairs of frontmatter text.
+
+    Targeted extraction, not a YAML parser: indented lines, list items, and
+    comments are skipped, values keep their raw text (minus surrounding quotes),
+    and the first occurrence of a key wins.
+    """
+    mapping: dict[str, str] = {}
+    for line in text.splitlines():
+        if not line or line[0] in " \t#-":
+            continue
+        key, sep, value = line.partition(":")
+        if not sep or key != key.strip():
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        mapping.setdefault(key, value)
+    return mapping
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split on newlines only, keeping them (unlike str.splitlines, which also splits on \\f etc.)."""
+    lines = [line + "\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+class Document:
+    """One markdown file, read and parsed only as far as rules ask.
+
+    The frontmatter is read first, with a bounded read. Headings are parsed
+    line by line as a rule iterates them, so a rule that stops at the first
+    match stops the reading too; every part is parsed at most once and shared
+    by all rules. When some rule needs the whole body, the rest of the file is
+    read in one call instead of line by line.
+
+    Args:
+        path: The file's root-relative path.
+        stream: The file, opened as text at its start.
+        needs: The parts the rules that will read this document declared.
+    """
+
+    def __init__(self, path: str, stream: TextIO, needs: Collection[str] = PARTS) -> None:
+        self.path = path
+        self._stream = stream
+        self._read_whole = BODY in needs
+        self._lines: list[str] | None = None
+        self._eof = False
+        self._frontmatter_text: str | None = None
+        self._frontmatter: dict[str, str] | None = None
+        self._body_start = 0
+        self._headings: list[Heading] = []
+        self._scanned = 0  # Lines examined for headings
+        self._open_fence: str | None = None
+
+    def _head(self) -> list[str]:
+        if self._lines is None:
+            self._frontmatter_text, self._lines = _read_frontmatter(self._stream)
+            if self._frontmatter_text is not None:
+                self._body_start = self._scanned = len(self._lines)
+        return self._lines
+
+    def _read_more(self) -> bool:
+        """Read further into the file; False once it's exhausted."""
+        lines = self._head()
+        if self._eof:
+            return False
+        if self._read_whole:
+            more = _split_lines(self._stream.read())
+            self._eof = True
+        else:
+            line = self._stream.readline()
+            more = [line] if line else []
+            self._eof = not line
+        if not more:
+            return False
+        if lines and not lines[-1].endswith("\n"):
+            # The bounded frontmatter read stopped mid-line
+            lines[-1] += more.pop(0)
+        lines.extend(more)
+        return True
+
+    @property
+    def frontmatter(self) -> dict[str, str] | None:
+        """Top-level frontmatter fields, or None if the file has no (closed) frontmatter."""
+        self._head()
+        if self._frontmatter is None and self._frontmatter_text is not None:
+            self._frontmatter = parse_frontmatter(self._frontmatter_text)
+        return self._frontmatter
+
+    def iter_headings(self) -> Iterator[Heading]:
+        """Headings in document order, parsed only as far as the caller iterates."""
+        index = 0
+        while True:
+            while index < len(self._headings):
+                yield self._headings[index]
+                index += 1
+            if not self._parse_next_heading():
+                return
+
+    @property
+    def headings(self) -> list[Heading]:
+        """Every heading (reads the whole file)."""
+        return list(self.iter_headings())
+
+    @property
+    def body(self) -> str:
+        """The text after the frontmatter (the whole file without frontmatter)."""
+        while self._read_more():
+            pass
+        return "".join(self._head()[self._body_start :])
+
+    def _parse_next_heading(self) -> bool:
+        """Examine lines until one is a heading (recorded); False at the end of the file."""
+        lines = self._head()
+        while True:
+            if self._scanned == len(lines) or not lines[self._scanned].endswith("\n"):
+                if self._read_more():
+                    continue
+                if self._scanned == len(lines):
+                    return False
+            line = lines[self._scanned].rstrip("\n")
+            self._scanned += 1
+            heading = self._parse_line(line)
+            if heading is not None:
+                self._headings.append(heading)
+                return True
+
+    def _parse_line(self, line: str) -> Heading | None:
+        fence = FENCE_PATTERN.match(line)
+        if self._open_fence is not None:
+            if (
+                fence is not None
+                and fence.group(1)[0] == self._open_fence[0]
+                and len(fence.group(1)) >= len(self._open_fence)
+                and not line[fence.end() :].strip()
+            ):
+                self._open_fence = None
+            return None
+        if fence is not None:
+            self._open_fence = fence.group(1)
+            return None
+        match = HEADING_PATTERN.fullmatch(line)
+        if match is None:
+            return None
+        return Heading(len(match.group(1)), match.group(2) or "", self._scanned)
@@ -0,0 +1,162 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Provenance validation
+
+"""Canonical-path globs compiled once into a segment trie with combined regexes."""
+
+import re
+from collections.abc import Iterable
+
+# Characters that make a path segment a pattern rather than a literal name
+_WILDCARDS = frozenset("*?{")
+
+
+def _split_top_level(text: str, separator: str) -> list[str]:
+    """Split on a separator outside {...} groups (unbalanced braces are literal)."""
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(text):
+        if char == "{" and text.find("}", index) != -1:
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+        elif char == separator and not depth:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _closing_brace(text: str, start: int) -> int:
+    """Index of the brace closing the one at start, or -1 if it isn't closed."""
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return -1
+
+
+def _translate_segment(segment: str) -> str:
+    """Regex for part of one segment: `*`, `?`, `{a,b}` (`/` and `**` allowed inside braces)."""
+    out: list[str] = []
+    index = 0
+    while index < len(segment):
+        char = segment[index]
+        if char == "*":
+            if segment.startswith("**", index):
+                out.append(".*")
+                index += 2
+                continue
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "{" and (end := _closing_brace(segment, index)) != -1:
+            options = _split_top_level(segment[index + 1 : end], ",")
+            out.append("(?:" + "|".join(_translate_segment(o) for o in options) + ")")
+            index = end + 1
+            continue
+        else:
+            out.append(re.escape(char))
+        index += 1
+    return "".join(out)
+
+
+def translate(segments: list[str]) -> str:
+    """Regex matching paths for pattern segments.
+
+    A whole-segment `**` matches zero or more directories (`a/**/b` matches
+    `a/b`), and a trailing one matches the directory itself and everything
+    below it (`a/**` matches `a` and `a/x/y`).
+    """
+    if segments == ["**"]:
+        return ".*"
+    out: list[str] = []
+    last = len(segments) - 1
+    for index, segment in enumerate(segments):
+        if segment == "**":
+            out.append("(?:/.*)?" if index == last and index else "(?:.*/)?")
+            continue
+        if index and segments[index - 1] != "**":
+            out.append("/")
+        out.append(_translate_segment(segment))
+    return "".join(out)
+
+
+class _Node:
+    __slots__ = ("children", "exact", "subtree", "suffixes", "regex")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.exact = False  # A pattern names this path exactly
+        self.subtree = False  # A `prefix/**` pattern covers this path and everything below
+        self.suffixes: list[str] = []
+        self.regex: re.Pattern[str] | None = None
+
+
+class GlobMatcher:
+    """Matches paths against many globs at a cost independent of their number.
+
+    Each pattern is split into its leading literal directories and the rest.
+    The literal part becomes a path in a trie of segments; a remaining `**`
+    marks the node as covering its subtree, and any other remainder joins the
+    node's single combined regex. A path walks the trie one segment at a time,
+    so only the few patterns sharing its literal prefix are ever tried.
+
+    Supported syntax: `*` and `?` (within a segment), `**` (any number of
+    segments), and `{a,b}` alternatives (which may nest and contain `/`).
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = list(patterns)
+        self._root = _Node()
+        for pattern in self.patterns:
+            self._add(pattern)
+        self._compile(self._root)
+
+    def _add(self, pattern: str) -> None:
+        segments = [s for s in _split_top_level(pattern.strip().strip("/"), "/") if s != "."]
+        node = self._root
+        index = 0
+        while index < len(segments) and not _WILDCARDS.intersection(segments[index]):
+            node = node.children.setdefault(segments[index], _Node())
+            index += 1
+        rest = segments[index:]
+        if not rest:
+            node.exact = True
+        elif rest == ["**"]:
+            node.subtree = True
+        else:
+            node.suffixes.append(translate(rest))
+
+    def _compile(self, node: _Node) -> None:
+        if node.suffixes:
+            node.regex = re.compile("|".join(f"(?:{s})" for s in node.suffixes))
+        for child in node.children.values():
+            self._compile(child)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def matches(self, path: str) -> bool:
+        """Whether a root-relative path matches any of the patterns."""
+        node = self._root
+        start = 0
+        while True:
+            if node.subtree:
+                return True
+            if node.regex is not None and start < len(path) and node.regex.fullmatch(path, start):
+                return True
+            if start >= len(path):
+                return node.exact
+            end = path.find("/", start)
+            if end == -1:
+                end = len(path)
+            child = node.children.get(path[start:end])
+            if child is None:
+                return False
+            node = child
+            start = end + 1
@@ -4,20 +4,34 @@
 """Core linting logic for validating KB content against declared rules."""
 
 import contextlib
+import hashlib
 import json
-import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
-FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)^---\s*\n", re.DOTALL | re.MULTILINE)
-STATUS_PATTERN = re.compile(r"^status:\s*(.+?)\s*$", re.MULTILINE)
-SOURCES_HEADING_PATTERN = re.compile(r"^## Sources\s*$", re.MULTILINE)
+from kb_linter.cache import LintCache
+from kb_linter.document import MAX_FRONTMATTER_CHARS, Document
+from kb_linter.globs import GlobMatcher
+from kb_linter.rules import RULES, needed_parts
+from tool_cli.cache import stat_key
+from tool_cli.content import content_roots, in_roots, parse_content_paths, walk_markdown
+from tool_cli.git_index import tracked_files
 
 SKIP_DIRS = frozenset({".git", ".graft", ".venv", "node_modules", "__pycache__"})
 
+# Linted when knowledge-base.yaml declares no `paths:`
 CONTENT_DIRS = ("docs", "policies", "playbooks")
 
+# `paths:` entries that aren't linted (notes are ephemeral explorations)
+UNLINTED_PATHS = frozenset({"notes"})
+
+# Tasks per worker when parallel: small enough to balance uneven file sizes,
+# large enough to amortize inter-process overhead
+CHUNKS_PER_WORKER = 4
+
 
 @dataclass
 class Violation:
@@ -34,6 +48,22 @@ class LintConfig:
 
     valid_statuses: list[str] = field(default_factory=list)
     provenance_paths: list[str] = field(default_factory=list)
+    content_dirs: tuple[str, ...] = CONTENT_DIRS
+
+    @cached_property
+    def provenance_matcher(self) -> GlobMatcher:
+        """provenance_paths compiled into one matcher (built on first use)."""
+        return GlobMatcher(self.provenance_paths)
+
+    def rules_key(self) -> str:
+        """Hash of the settings a file's violations depend on (besides its path and content)."""
+        settings = {
+            "statuses": self.valid_statuses,
+            "provenance": self.provenance_paths,
+            "max_frontmatter": MAX_FRONTMATTER_CHARS,
+            "rules": [registered.name for registered in RULES],
+        }
+        return hashlib.sha256(json.dumps(settings).encode("utf-8")).hexdigest()[:32]
 
 
 @dataclass
@@ -42,6 +72,9 @@ class LintResult:
 
     violations: list[Violation] = field(default_factory=list)
     files_checked: int = 0
+    # Result cache counters (None when caching is off)
+    cache_hits: int | None = field(default=None, compare=False)
+    cache_misses: int | None = field(default=None, compare=False)
 
 
 def parse_config(root: Path) -> LintConfig:
@@ -80,93 +113,123 @@ def parse_config(root: Path) -> LintConfig:
             elif not line.startswith(" ") and not line.startswith("\t"):
                 break  # Exited the canonical block
 
-    return LintConfig(valid_statuses=valid_statuses, provenance_paths=provenance_paths)
+    content_dirs = content_roots(parse_content_paths(content), CONTENT_DIRS, exclude=UNLINTED_PATHS)
 
+    return LintConfig(
+        valid_statuses=valid_statuses,
+        provenance_paths=provenance_paths,
+        content_dirs=content_dirs,
+    )
 
-def _get_content_files(root: Path) -> list[str]:
-    """Collect markdown files in content directories."""
-    files: list[str] = []
-    for content_dir in CONTENT_DIRS:
-        dir_path = root / content_dir
-        if not dir_path.exists():
-            continue
-        for dirpath, dirnames, filenames in os.walk(dir_path):
-            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-            for filename in filenames:
-                if filename.endswith(".md"):
-                    full_path = os.path.join(dirpath, filename)
-                    rel_path = os.path.relpath(full_path, root)
-                    files.append(rel_path)
-    return sorted(files)
 
+def _get_content_files(
+    root: Path, use_git_index: bool = False, content_dirs: tuple[str, ...] = CONTENT_DIRS
+) -> list[str]:
+    """Collect markdown files in content directories.
 
-def _path_matches_glob(path: str, pattern: str) -> bool:
-    """Check if a path matches a simple glob pattern (supports trailing /**)."""
-    if pattern.endswith("/**"):
-        prefix = pattern[:-3]
-        return path.startswith(prefix + "/") or path == prefix
-    return path == pattern
+    With use_git_index, candidates come from the tracked files in .git/index
+    (falling back to walking the tree outside a repository).
+    """
+    if use_git_index:
+        tracked = tracked_files(root)
+        if tracked is not None:
+            return [
+                f
+                for f in tracked
+                if f.endswith(".md")
+                and in_roots(f, content_dirs)
+                and not any(d in SKIP_DIRS for d in f.split("/")[:-1])
+            ]
+    return walk_markdown(root, content_dirs, SKIP_DIRS)
 
 
 def _check_file(root: Path, file: str, config: LintConfig) -> list[Violation]:
-    """Check a single file for violations."""
-    violations: list[Violation] = []
-    full_path = root / file
+    """Check a single file against every registered rule.
 
+    The file is parsed once, lazily, into a Document the rules share, so it's
+    read only as far as they look (the frontmatter, and for canonical content
+    the headings up to the Sources heading). Undecodable files are skipped (as
+    far as they're read).
+    """
     try:
-        content = full_path.read_text(encoding="utf-8")
+        with open(root / file, encoding="utf-8") as stream:
+            document = Document(file, stream, needed_parts(RULES))
+            return [
+                Violation(file=file, rule=violation_rule, message=message)
+                for registered in RULES
+                for violation_rule, message in registered.check(document, config)
+            ]
     except (OSError, UnicodeDecodeError):
-        return violations
-
-    # Check frontmatter presence
-    fm_match = FRONTMATTER_PATTERN.match(content)
-    if not fm_match:
-        violations.append(
-            Violation(
-                file=file,
-                rule="missing-frontmatter",
-                message="No YAML frontmatter found",
-            )
-        )
-    else:
-        frontmatter = fm_match.group(1)
-        status_match = STATUS_PATTERN.search(frontmatter)
-        if not status_match:
-            violations.append(
-                Violation(
-                    file=file,
-                    rule="missing-status",
-                    message="No status field in frontmatter",
-                )
-            )
-        elif config.valid_statuses:
-            status_value = status_match.group(1)
-            if status_value not in config.valid_statuses:
-                violations.append(
-                    Violation(
-                        file=file,
-                        rule="invalid-status",
-                        message=(
-                            f"Invalid status '{status_value}', allowed: {config.valid_statuses}"
-                        ),
-                    )
-                )
-
-    # Check provenance for canonical paths
-    needs_provenance = any(_path_matches_glob(file, pattern) for pattern in config.provenance_paths)
-    if needs_provenance and not SOURCES_HEADING_PATTERN.search(content):
-        violations.append(
-            Violation(
-                file=file,
-                rule="missing-provenance",
-                message="No Sources section found (required for canonical content)",
-            )
+        return []
+
+
+# A worker process's root and config, set once by _init_worker rather than
+# pickled with every task
+_worker_state: tuple[Path, LintConfig] | None = None
+
+
+def _init_worker(root: Path, config: LintConfig) -> None:
+    global _worker_state
+    _worker_state = (root, config)
+
+
+def _check_in_worker(file: str) -> list[Violation]:
+    assert _worker_state is not None
+    root, config = _worker_state
+    return _check_file(root, file, config)
+
+
+def _check_files(
+    root: Path, files: list[str], config: LintConfig, jobs: int
+) -> list[list[Violation]]:
+    """Check files, fanning out over a process pool when jobs > 1.
+
+    Results are returned in input order, so parallelism never changes output.
+    """
+    if jobs <= 1 or len(files) < 2:
+        return [_check_file(root, file, config) for file in files]
+
+    workers = min(jobs, len(files))
+    chunksize = max(1, len(files) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(root, config)
+    ) as pool:
+        return list(pool.map(_check_in_worker, files, chunksize=chunksize))
+
+
+def _check_files_cached(
+    root: Path, files: list[str], config: LintConfig, jobs: int, cache: LintCache
+) -> list[list[Violation]]:
+    """Check only files whose content (or the rules) changed since the cache was written."""
+    results: list[list[Violation] | None] = []
+    keys = [stat_key(root / file) for file in files]
+    digests: list[str | None] = []
+    missing: list[int] = []
+
+    for index, (file, key) in enumerate(zip(files, keys, strict=True)):
+        digest, cached = cache.get(file, root / file, key)
+        digests.append(digest)
+        if cached is None:
+            results.append(None)
+            missing.append(index)
+        else:
+            results.append([Violation(file, rule, message) for rule, message in cached])
+
+    checked = _check_files(root, [files[i] for i in missing], config, jobs)
+    for index, violations in zip(missing, checked, strict=True):
+        results[index] = violations
+        cache.put(
+            files[index], keys[index], digests[index], [(v.rule, v.message) for v in violations]
         )
 
-    return violations
+    cache.retain(files)
+    cache.save()
+    return results
 
 
-def lint(root_dir: str) -> LintResult:
+def lint(
+    root_dir: str, use_git_index: bool = False, jobs: int = 1, cache_dir: str | None = None
+) -> LintResult:
     """Lint a KB directory against its declared rules.
 
     Reads configuration from knowledge-base.yaml and validates content files
@@ -174,17 +237,30 @@ def lint(root_dir: str) -> LintResult:
 
     Args:
         root_dir: The KB root directory.
+        use_git_index: Enumerate files from .git/index instead of walking the tree.
+        jobs: Number of worker processes for checking files (1 runs serially).
+        cache_dir: Directory for the persistent result cache; only files whose
+            content or rules changed are re-checked (None disables it).
 
     Returns:
         LintResult with violations and file count.
     """
     root = Path(root_dir).resolve()
     config = parse_config(root)
-    files = _get_content_files(root)
+    files = _get_content_files(root, use_git_index, config.content_dirs)
+    cache = None
+    if cache_dir is None:
+        checked = _check_files(root, files, config, jobs)
+    else:
+        cache = LintCache(Path(cache_dir), config.rules_key())
+        checked = _check_files_cached(root, files, config, jobs, cache)
     all_violations: list[Violation] = []
 
-    for file in files:
-        file_violations = _check_file(root, file, config)
+    for file_violations in checked:
         all_violations.extend(file_violations)
 
-    return LintResult(violations=all_violations, files_checked=len(files))
+    result = LintResult(violations=all_violations, files_checked=len(files))
+    if cache is not None:
+        result.cache_hits = cache.hits
+        result.cache_misses = cache.misses
+    return result
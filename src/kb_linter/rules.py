@@ -0,0 +1,79 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Rules
+
+"""The lint rule registry and the built-in rules."""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from kb_linter.document import FRONTMATTER, HEADINGS, PARTS, Document
+
+if TYPE_CHECKING:
+    from kb_linter.linter import LintConfig
+
+# A rule's findings for one document, as (violation rule, message) pairs
+Check = Callable[[Document, "LintConfig"], Iterable[tuple[str, str]]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A registered check and the document parts it reads."""
+
+    name: str
+    needs: frozenset[str]
+    check: Check
+
+
+# Every registered rule, run in registration order (which orders a file's violations)
+RULES: list[Rule] = []
+
+
+def rule(name: str, needs: Iterable[str]) -> Callable[[Check], Check]:
+    """Register a check under a name, declaring the document parts it needs.
+
+    Raises:
+        ValueError: If a needed part isn't one a Document provides, or the name is taken.
+    """
+    parts = frozenset(needs)
+    if not parts <= PARTS:
+        raise ValueError(f"rule {name!r} needs unknown parts: {sorted(parts - PARTS)}")
+    if any(existing.name == name for existing in RULES):
+        raise ValueError(f"rule {name!r} is already registered")
+
+    def register(check: Check) -> Check:
+        RULES.append(Rule(name, parts, check))
+        return check
+
+    return register
+
+
+def needed_parts(rules: Iterable[Rule]) -> frozenset[str]:
+    """Every part some rule needs."""
+    return frozenset().union(*(r.needs for r in rules))
+
+
+@rule("status", needs={FRONTMATTER})
+def check_status(document: Document, config: "LintConfig") -> Iterator[tuple[str, str]]:
+    """Frontmatter is present, with a status from rules.lifecycle.statuses."""
+    frontmatter = document.frontmatter
+    if frontmatter is None:
+        yield "missing-frontmatter", "No YAML frontmatter found"
+        return
+    status = frontmatter.get("status")
+    if not status:
+        yield "missing-status", "No status field in frontmatter"
+    elif config.valid_statuses and status not in config.valid_statuses:
+        yield (
+            "invalid-status",
+            f"Invalid status '{status}', allowed: {config.valid_statuses}",
+        )
+
+
+@rule("provenance", needs={HEADINGS})
+def check_provenance(document: Document, config: "LintConfig") -> Iterator[tuple[str, str]]:
+    """Files under sources.canonical paths have a `## Sources` heading."""
+    if not config.provenance_matcher.matches(document.path):
+        return
+    if not any(h.level == 2 and h.title == "Sources" for h in document.iter_headings()):
+        yield "missing-provenance", "No Sources section found (required for canonical content)"
@@ -3,8 +3,15 @@
 
 """CLI entry point for the link validator."""
 
-from link_validator.validator import ValidateResult, validate
-from tool_cli import run_tool
+import os
+import sys
+
+from link_validator.analysis import GraphReport, analyze
+from link_validator.external import DEFAULT_TTL
+from link_validator.graph import DEFAULT_CACHE_DIR
+from link_validator.validator import ValidateResult, validate, validate_changed
+from tool_cli import Option, UsageError, positive_float, positive_int, run_tool
+from tool_cli.changes import read_changed
 
 
 def _serialize(result: ValidateResult) -> dict:
@@ -17,6 +24,7 @@ def _serialize(result: ValidateResult) -> dict:
                 "resolved": v.resolved,
                 "rule": v.rule,
                 "message": v.message,
+                "suggestions": v.suggestions,
             }
             for v in result.violations
         ],
@@ -24,15 +32,123 @@ def _serialize(result: ValidateResult) -> dict:
             "files_checked": result.files_checked,
             "links_checked": result.links_checked,
             "broken": len(result.violations),
+            "resolve_cache_hits": result.resolve_cache_hits,
+            **(
+                {
+                    "external_urls": result.external_urls,
+                    "external_cache_hits": result.external_cache_hits,
+                }
+                if result.external_urls is not None
+                else {}
+            ),
         },
     }
 
 
+def _run(
+    root_dir: str,
+    use_git_index: bool = False,
+    jobs: int = 1,
+    check_anchors: bool = False,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    changed_stdin: bool = False,
+    check_external: bool = False,
+    external_ttl: float = DEFAULT_TTL,
+) -> ValidateResult:
+    """Validate with the CLI's defaults: the link graph is stored under the root.
+
+    With --changed (paths on stdin), only changed sources are re-parsed and only
+    links affected by the changed paths are re-checked, against the stored graph.
+    """
+    if not use_cache:
+        cache_dir = None
+    elif cache_dir is None:
+        cache_dir = os.path.join(root_dir, DEFAULT_CACHE_DIR)
+
+    if changed_stdin:
+        if cache_dir is None:
+            raise UsageError("--changed needs the link graph cache (remove --no-cache)")
+        if use_git_index:
+            raise UsageError("--changed can't be combined with --git-index")
+        changed = read_changed(sys.stdin)
+        return validate_changed(
+            root_dir,
+            changed,
+            cache_dir=cache_dir,
+            jobs=jobs,
+            check_anchors=check_anchors,
+            check_external=check_external,
+            external_ttl=external_ttl,
+        )
+
+    return validate(
+        root_dir,
+        use_git_index=use_git_index,
+        jobs=jobs,
+        check_anchors=check_anchors,
+        cache_dir=cache_dir,
+        check_external=check_external,
+        external_ttl=external_ttl,
+    )
+
+
+def _serialize_graph(report: GraphReport) -> dict:
+    """Convert GraphReport to a compact JSON-serializable dict."""
+    return {
+        "nodes": report.nodes,
+        "edges": [list(edge) for edge in report.edges],
+        "entrypoints": report.entrypoints,
+        "unreachable": report.unreachable,
+        "in_degree": report.in_degree,
+        "out_degree": report.out_degree,
+        "components": report.components,
+        "summary": {
+            "nodes": len(report.nodes),
+            "edges": len(report.edges),
+            "unreachable": len(report.unreachable),
+            "components": len(report.components),
+        },
+    }
+
+
+def _graph_main() -> None:
+    """Run `graph`: export the link graph and report docs unreachable from the entrypoint.
+
+    An export, not a check: unreachable docs are reported but don't fail the run.
+    """
+    run_tool(
+        runner=analyze,
+        serializer=_serialize_graph,
+        has_failures=lambda r: False,
+        options=[
+            Option("--entrypoint", "entrypoint", parse=str),
+            Option("--git-index", "use_git_index"),
+            Option("--jobs", "jobs", parse=positive_int),
+        ],
+        argv=sys.argv[2:],
+    )
+
+
 def main() -> None:
+    if sys.argv[1:2] == ["graph"]:
+        _graph_main()
+        return
+
     run_tool(
-        runner=validate,
+        runner=_run,
         serializer=_serialize,
         has_failures=lambda r: bool(r.violations),
+        options=[
+            Option("--git-index", "use_git_index"),
+            Option("--jobs", "jobs", parse=positive_int),
+            Option("--anchors", "check_anchors"),
+            Option("--no-cache", "use_cache", value=False),
+            Option("--cache-dir", "cache_dir", parse=str),
+            Option("--changed", "changed_stdin"),
+            Option("--external", "check_external"),
+            Option("--external-ttl", "external_ttl", parse=positive_float),
+        ],
     )
 
 
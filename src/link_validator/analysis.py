@@ -0,0 +1,203 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Graph mode
+
+"""Link graph export and reachability analysis from the KB's human entrypoint."""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from link_validator.validator import _collect_links, _get_content_files
+from tool_cli import UsageError
+from tool_cli.git_index import tracked_files
+
+# Targeted extraction of entrypoints.human from knowledge-base.yaml (not a YAML parser)
+ENTRYPOINTS_BLOCK_PATTERN = re.compile(r"^entrypoints:[ \t]*\n((?:[ \t]+\S.*(?:\n|$))+)", re.M)
+HUMAN_ENTRYPOINT_PATTERN = re.compile(r"^[ \t]+human:[ \t]*[\"']?([^\"'\s#]+)", re.M)
+
+# Files a directory link lands on, in the order they're tried
+DIRECTORY_INDEX_FILES = ("README.md", "index.md")
+
+
+@dataclass
+class GraphReport:
+    """The internal link graph between markdown files, with reachability findings.
+
+    Nodes are referenced by their index in `nodes` everywhere except `unreachable`.
+    """
+
+    nodes: list[str] = field(default_factory=list)
+    edges: list[tuple[int, int]] = field(default_factory=list)
+    entrypoints: list[int] = field(default_factory=list)
+    unreachable: list[str] = field(default_factory=list)
+    in_degree: list[int] = field(default_factory=list)
+    out_degree: list[int] = field(default_factory=list)
+    components: list[list[int]] = field(default_factory=list)
+
+
+def human_entrypoint(root: Path) -> str:
+    """Read entrypoints.human from knowledge-base.yaml.
+
+    Raises:
+        FileNotFoundError: If knowledge-base.yaml doesn't exist.
+        UsageError: If it doesn't declare entrypoints.human.
+    """
+    config_path = root / "knowledge-base.yaml"
+    if not config_path.exists():
+        raise FileNotFoundError(f"knowledge-base.yaml not found in {root}")
+    content = config_path.read_text(encoding="utf-8")
+    block = ENTRYPOINTS_BLOCK_PATTERN.search(content)
+    human = HUMAN_ENTRYPOINT_PATTERN.search(block.group(1)) if block else None
+    if human is None:
+        raise UsageError("knowledge-base.yaml has no entrypoints.human (pass --entrypoint)")
+    return human.group(1)
+
+
+def reachable_from(adjacency: list[list[int]], starts: list[int]) -> list[bool]:
+    """Mark every node reachable from the start nodes (iterative depth-first search)."""
+    seen = [False] * len(adjacency)
+    stack = list(starts)
+    for start in starts:
+        seen[start] = True
+    while stack:
+        for neighbor in adjacency[stack.pop()]:
+            if not seen[neighbor]:
+                seen[neighbor] = True
+                stack.append(neighbor)
+    return seen
+
+
+def strongly_connected_components(adjacency: list[list[int]]) -> list[list[int]]:
+    """Tarjan's algorithm with an explicit work stack (no recursion limit).
+
+    Components come out in reverse topological order, each listing its nodes
+    in the order they were popped.
+    """
+    count = len(adjacency)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(adjacency[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if index[neighbor] == -1:
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work.append((neighbor, iter(adjacency[neighbor])))
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[node]:
+                    low[node] = index[neighbor]
+            else:
+                # All neighbors done: fold into the parent and close a component if rooted here
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _edge_target(resolved: str, node_ids: dict[str, int]) -> int | None:
+    """Node a resolved link lands on; directory links land on their README/index file."""
+    target = node_ids.get(resolved)
+    if target is not None:
+        return target
+    for name in DIRECTORY_INDEX_FILES:
+        target = node_ids.get(f"{resolved}/{name}" if resolved != "." else name)
+        if target is not None:
+            return target
+    return None
+
+
+def analyze(
+    root_dir: str,
+    entrypoint: str | None = None,
+    use_git_index: bool = False,
+    jobs: int = 1,
+) -> GraphReport:
+    """Build the link graph between markdown files once and analyze it.
+
+    Args:
+        root_dir: The KB root directory.
+        entrypoint: Root-relative start file (defaults to entrypoints.human
+            from knowledge-base.yaml).
+        use_git_index: Enumerate files from .git/index instead of walking the tree.
+        jobs: Number of worker processes for reading and parsing files.
+
+    Returns:
+        GraphReport with an integer-indexed edge list, unreachable files,
+        degrees, and the strongly connected components with more than one node.
+
+    Raises:
+        FileNotFoundError: If the entrypoint (or knowledge-base.yaml) doesn't exist.
+        UsageError: If the entrypoint is outside the root.
+    """
+    root = Path(root_dir).resolve()
+    if entrypoint is None:
+        entrypoint = human_entrypoint(root)
+    entrypoint = os.path.normpath(entrypoint.lstrip("/"))
+    if entrypoint.split(os.sep, 1)[0] == "..":
+        raise UsageError(f"Entrypoint is outside the root: {entrypoint}")
+    if not (root / entrypoint).is_file():
+        raise FileNotFoundError(f"Entrypoint not found: {entrypoint}")
+
+    nodes = _get_content_files(root, tracked_files(root) if use_git_index else None)
+    if entrypoint not in nodes:
+        nodes = sorted([*nodes, entrypoint])
+    node_ids = {node: position for position, node in enumerate(nodes)}
+
+    adjacency: list[list[int]] = [[] for _ in nodes]
+    for source, links in enumerate(_collect_links(root, nodes, jobs)):
+        targets = {_edge_target(resolved, node_ids) for _target, resolved in links}
+        targets.discard(None)
+        targets.discard(source)
+        adjacency[source] = sorted(targets)
+
+    edges = [(source, target) for source, targets in enumerate(adjacency) for target in targets]
+    in_degree = [0] * len(nodes)
+    for _source, target in edges:
+        in_degree[target] += 1
+
+    start = node_ids[entrypoint]
+    seen = reachable_from(adjacency, [start])
+    components = [
+        sorted(component)
+        for component in strongly_connected_components(adjacency)
+        if len(component) > 1
+    ]
+
+    return GraphReport(
+        nodes=nodes,
+        edges=edges,
+        entrypoints=[start],
+        unreachable=[node for node, reached in zip(nodes, seen, strict=True) if not reached],
+        in_degree=in_degree,
+        out_degree=[len(targets) for targets in adjacency],
+        components=sorted(components),
+    )
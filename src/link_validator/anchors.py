@@ -0,0 +1,126 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Anchor validation
+
+"""GitHub-style heading slugs and a lazily built per-file anchor index."""
+
+import re
+import unicodedata
+from pathlib import Path
+from urllib.parse import unquote
+
+ATX_HEADING_PATTERN = re.compile(r"^ {0,3}#{1,6}(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+SETEXT_UNDERLINE_PATTERN = re.compile(r"^ {0,3}(?:=+|-+)[ \t]*$")
+HEADING_FENCE_PATTERN = re.compile(r"^(`{3,}|~{3,})")
+HTML_ANCHOR_PATTERN = re.compile(r"""<[a-zA-Z][^>]*?\s(?:name|id)\s*=\s*["']([^"']+)["']""")
+
+# Inline markup whose text GitHub keeps while dropping the syntax
+_INLINE_LINK_PATTERN = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+# GitHub drops everything except letters, digits, marks, underscores, hyphens, and spaces;
+# \w doesn't cover combining marks (category M), so matches are checked for those
+_SLUG_DROP_PATTERN = re.compile(r"[^\w\- ]")
+
+
+def _keep_marks(match: re.Match[str]) -> str:
+    char = match.group()
+    return char if unicodedata.category(char).startswith("M") else ""
+
+
+def github_slug(text: str) -> str:
+    """Slug for one heading's text, as GitHub renders it (before de-duplication)."""
+    text = _INLINE_LINK_PATTERN.sub(r"\1", text)
+    text = _HTML_TAG_PATTERN.sub("", text)
+    return _SLUG_DROP_PATTERN.sub(_keep_marks, text.strip().lower()).replace(" ", "-")
+
+
+def _heading_texts(content: str) -> list[str]:
+    """ATX and setext heading texts in document order, outside code fences and frontmatter."""
+    lines = content.splitlines()
+    start = 0
+    if lines and lines[0].strip() == "---":
+        for index in range(1, len(lines)):
+            if lines[index].strip() in ("---", "..."):
+                start = index + 1
+                break
+
+    texts: list[str] = []
+    in_fence = False
+    fence_char = ""
+    fence_len = 0
+    previous = ""
+    for line in lines[start:]:
+        stripped = line.strip()
+        fence_match = HEADING_FENCE_PATTERN.match(stripped)
+        if fence_match:
+            marker = fence_match.group(1)
+            if not in_fence:
+                in_fence, fence_char, fence_len = True, marker[0], len(marker)
+                previous = ""
+                continue
+            if marker[0] == fence_char and len(marker) >= fence_len and stripped == marker:
+                in_fence = False
+                continue
+        if in_fence:
+            continue
+
+        atx = ATX_HEADING_PATTERN.match(line)
+        if atx:
+            texts.append(atx.group(1) or "")
+            previous = ""
+        elif previous and SETEXT_UNDERLINE_PATTERN.match(line):
+            texts.append(previous)
+            previous = ""
+        else:
+            previous = stripped
+    return texts
+
+
+def heading_slugs(content: str) -> frozenset[str]:
+    """Every anchor a markdown document defines.
+
+    Repeated headings get GitHub's `-1`, `-2`, ... suffixes. Explicit HTML
+    anchors (`<a name="...">` or any tag's `id="..."`) count too.
+    """
+    slugs: set[str] = set()
+    for text in _heading_texts(content):
+        base = github_slug(text)
+        slug = base
+        count = 0
+        while slug in slugs:
+            count += 1
+            slug = f"{base}-{count}"
+        slugs.add(slug)
+    slugs.update(HTML_ANCHOR_PATTERN.findall(content))
+    return frozenset(slugs)
+
+
+class AnchorIndex:
+    """Heading slugs per target file, parsed on first use and memoized for the run.
+
+    Only files that some link points into are ever read, and each at most once,
+    however many links target it.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._slugs: dict[str, frozenset[str] | None] = {}
+
+    def slugs(self, path: str) -> frozenset[str] | None:
+        """Anchors defined by a root-relative markdown file, or None if it can't be read."""
+        if path not in self._slugs:
+            try:
+                content = (self.root / path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                self._slugs[path] = None
+            else:
+                self._slugs[path] = heading_slugs(content)
+        return self._slugs[path]
+
+    def has_anchor(self, path: str, fragment: str) -> bool:
+        """Whether a fragment names an anchor in the file (unreadable files pass)."""
+        slugs = self.slugs(path)
+        return slugs is None or unquote(fragment) in slugs
+
+    @property
+    def files_parsed(self) -> int:
+        return len(self._slugs)
@@ -0,0 +1,360 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/External links
+
+"""Asynchronous external URL checks with per-host keep-alive pools and a TTL result cache."""
+
+import asyncio
+import contextlib
+import ssl
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, urljoin, urlsplit
+
+from tool_cli.cache import cache_file, read_json, write_json_atomic
+
+EXTERNAL_CACHE_VERSION = 1
+
+# How long a checked URL's status is reused before it's fetched again (seconds)
+DEFAULT_TTL = 86_400
+
+# Requests in flight at once across all hosts, and connections in use per host
+MAX_CONCURRENCY = 16
+MAX_PER_HOST = 2
+
+# Seconds of request time allowed for one URL, redirects and the GET fallback
+# included (time spent waiting for a free connection slot doesn't count)
+REQUEST_TIMEOUT = 10.0
+
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+CHECKED_SCHEMES = ("http://", "https://")
+
+# Characters left as-is when a URL's path is percent-encoded for the request line
+_PATH_SAFE = "/%:@!$&'()*+,;=~-._"
+
+
+def external_url(target: str) -> str | None:
+    """The URL to check for a link target, or None if it isn't an http(s) link.
+
+    A link title (`[a](https://x.org "Title")`) and the fragment are dropped.
+    """
+    if not target.startswith(CHECKED_SCHEMES):
+        return None
+    url = target.split(maxsplit=1)[0]
+    return url.partition("#")[0]
+
+
+@dataclass
+class UrlResult:
+    """The outcome of checking one URL."""
+
+    url: str
+    status: int | None = None  # Final HTTP status (after redirects); None without a response
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+    def describe(self) -> str:
+        """Short reason the URL is considered broken."""
+        if self.status is not None:
+            return f"External URL returned HTTP {self.status}"
+        return f"External URL could not be fetched ({self.error})"
+
+
+class UrlCache:
+    """Checked URL statuses with the time they were checked.
+
+    Only HTTP responses are stored; connection errors and timeouts are retried
+    on the next run rather than remembered as broken.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[float, int]] = {}
+
+    def fresh(self, url: str, ttl: float, now: float) -> int | None:
+        """The stored status for a URL if it was checked within ttl seconds."""
+        entry = self.entries.get(url)
+        if entry is None or now - entry[0] >= ttl:
+            return None
+        return entry[1]
+
+    def record(self, url: str, status: int, now: float) -> None:
+        self.entries[url] = (now, status)
+
+    def prune(self, ttl: float, now: float) -> None:
+        """Drop expired entries so the file doesn't grow with links that were removed."""
+        self.entries = {url: e for url, e in self.entries.items() if now - e[0] < ttl}
+
+    def save(self, cache_dir: Path, root: Path) -> None:
+        data = {
+            "version": EXTERNAL_CACHE_VERSION,
+            "urls": {url: list(entry) for url, entry in self.entries.items()},
+        }
+        write_json_atomic(cache_file(cache_dir, root, "external"), data)
+
+    @classmethod
+    def load(cls, cache_dir: Path, root: Path) -> "UrlCache":
+        """Load the stored statuses, or an empty cache if there isn't a usable file."""
+        cache = cls()
+        data = read_json(cache_file(cache_dir, root, "external"))
+        if not isinstance(data, dict) or data.get("version") != EXTERNAL_CACHE_VERSION:
+            return cache
+        try:
+            cache.entries = {
+                url: (float(checked), int(status))
+                for url, (checked, status) in data["urls"].items()
+            }
+        except (KeyError, TypeError, ValueError, AttributeError):
+            cache.entries = {}
+        return cache
+
+
+@dataclass
+class _Budget:
+    """Request time a URL has left, spent only while one of its requests runs."""
+
+    remaining: float
+
+
+class _HostPool:
+    """Keep-alive connections to one host, at most `limit` in use at a time."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = asyncio.Semaphore(limit)
+        self.idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    def take_idle(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter] | None:
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return None
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[str, int, dict[str, str]]:
+    """Read a response's status line and headers (lowercased names)."""
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("connection closed before a response")
+    parts = line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise ValueError(f"malformed status line {line[:40]!r}")
+
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return parts[0], int(parts[1]), headers
+
+
+class ExternalChecker:
+    """Checks URLs concurrently over asyncio streams (HTTP/1.1, stdlib only).
+
+    At most `concurrency` requests are in flight overall and `per_host`
+    connections per host are in use; HEAD connections are kept alive and reused
+    for later URLs on the same host. A request takes its host's slot before a
+    global one, so URLs queued behind a busy host never hold global slots that
+    other hosts could use, and a URL's timeout only runs while its requests do.
+    A URL is requested with HEAD, and with GET if HEAD gets an error status
+    (some servers don't implement HEAD). Redirects are followed.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = MAX_CONCURRENCY,
+        per_host: int = MAX_PER_HOST,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> None:
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+        self._limit = asyncio.Semaphore(concurrency)
+        self._ssl: ssl.SSLContext | None = None
+
+    def check(self, urls: Collection[str]) -> dict[str, UrlResult]:
+        """Check each URL once; returns results keyed by URL."""
+        return asyncio.run(self.check_async(urls))
+
+    async def check_async(self, urls: Collection[str]) -> dict[str, UrlResult]:
+        self._limit = asyncio.Semaphore(self.concurrency)
+        self._pools = {}
+        try:
+            results = await asyncio.gather(*(self._check_one(url) for url in urls))
+        finally:
+            await self._close_idle()
+        return {result.url: result for result in results}
+
+    async def _check_one(self, url: str) -> UrlResult:
+        try:
+            status = await self._status(url, _Budget(self.timeout))
+        except TimeoutError:
+            return UrlResult(url, error="timed out")
+        except (OSError, ValueError, asyncio.IncompleteReadError) as exc:
+            return UrlResult(url, error=str(exc) or type(exc).__name__)
+        return UrlResult(url, status=status)
+
+    async def _status(self, url: str, budget: _Budget) -> int:
+        status = await self._follow(url, "HEAD", budget)
+        if status >= 400:
+            status = await self._follow(url, "GET", budget)
+        return status
+
+    async def _follow(self, url: str, method: str, budget: _Budget) -> int:
+        for _ in range(MAX_REDIRECTS):
+            status, location = await self._request(url, method, budget)
+            if status not in REDIRECT_STATUSES or not location:
+                return status
+            url = urljoin(url, location)
+        status, _location = await self._request(url, method, budget)
+        return status
+
+    async def _request(self, url: str, method: str, budget: _Budget) -> tuple[int, str | None]:
+        """Send one request, charging its time to the URL's budget.
+
+        Returns the status and any Location header.
+
+        Raises:
+            TimeoutError: If the budget runs out before the response head arrives.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported URL {url!r}")
+        default_port = 443 if parts.scheme == "https" else 80
+        port = parts.port or default_port
+        host = parts.hostname
+        path = quote(parts.path or "/", safe=_PATH_SAFE)
+        if parts.query:
+            path += "?" + parts.query
+        # GET responses have bodies; rather than drain them, those connections are closed
+        persistent = method == "HEAD"
+        request = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {host if port == default_port else f'{host}:{port}'}\r\n"
+            "User-Agent: link-validator\r\n"
+            "Accept: */*\r\n"
+            f"Connection: {'keep-alive' if persistent else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+
+        pool = self._pools.setdefault((parts.scheme, host, port), _HostPool(self.per_host))
+        loop = asyncio.get_running_loop()
+        # The host's slot first: waiting for a busy host mustn't hold a global slot
+        async with pool.limit, self._limit:
+            started = loop.time()
+            try:
+                return await asyncio.wait_for(
+                    self._exchange(pool, parts.scheme, host, port, request, persistent),
+                    budget.remaining,
+                )
+            finally:
+                budget.remaining -= loop.time() - started
+
+    async def _exchange(
+        self, pool: _HostPool, scheme: str, host: str, port: int, request: bytes, persistent: bool
+    ) -> tuple[int, str | None]:
+        """Send a request over an idle or new connection and read the response head."""
+        while True:
+            idle = pool.take_idle()
+            if idle is None:
+                reader, writer = await self._connect(scheme, host, port)
+            else:
+                reader, writer = idle
+            try:
+                writer.write(request)
+                await writer.drain()
+                version, status, headers = await _read_head(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if idle is not None:
+                    continue  # The server closed the idle connection; use a new one
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            break
+
+        if (
+            persistent
+            and version == "HTTP/1.1"
+            and headers.get("connection", "").lower() != "close"
+        ):
+            pool.idle.append((reader, writer))
+        else:
+            writer.close()
+        return status, headers.get("location")
+
+    async def _connect(
+        self, scheme: str, host: str, port: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        context = None
+        if scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            context = self._ssl
+        self.connections_opened += 1
+        return await asyncio.open_connection(host, port, ssl=context)
+
+    async def _close_idle(self) -> None:
+        writers = [writer for pool in self._pools.values() for _reader, writer in pool.idle]
+        for pool in self._pools.values():
+            pool.idle.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+
+def check_urls(
+    urls: Collection[str],
+    cache_dir: Path | None,
+    root: Path,
+    ttl: float = DEFAULT_TTL,
+    checker: ExternalChecker | None = None,
+) -> dict[str, UrlResult]:
+    """Check URLs, reusing statuses checked within ttl seconds.
+
+    Args:
+        urls: URLs to check (each is fetched at most once).
+        cache_dir: Directory for the persistent result cache (None disables it).
+        root: The KB root the cache file belongs to.
+        ttl: Seconds a stored status stays valid.
+        checker: The checker to fetch with (a default one if not given).
+
+    Returns:
+        Results keyed by URL; ones answered from the cache have `cached` set.
+    """
+    cache = UrlCache.load(cache_dir, root) if cache_dir is not None else UrlCache()
+    now = time.time()
+    results: dict[str, UrlResult] = {}
+    expired: list[str] = []
+    for url in sorted(set(urls)):
+        status = cache.fresh(url, ttl, now)
+        if status is None:
+            expired.append(url)
+        else:
+            results[url] = UrlResult(url, status=status, cached=True)
+
+    if expired:
+        fetched = (checker or ExternalChecker()).check(expired)
+        for url in expired:
+            result = fetched[url]
+            results[url] = result
+            if result.status is not None:
+                cache.record(url, result.status, now)
+
+    if cache_dir is not None and expired:
+        cache.prune(ttl, now)
+        cache.save(cache_dir, root)
+    return results
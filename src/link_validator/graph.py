@@ -0,0 +1,124 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Incremental validation
+
+"""Persistent link graph: links per source file, a reverse index, and target existence."""
+
+import time
+from pathlib import Path
+
+from tool_cli.cache import StatKey, cache_file, is_racy, read_json, write_json_atomic
+
+GRAPH_VERSION = 2
+
+DEFAULT_CACHE_DIR = ".cache/link-validator"
+
+# (target as written, resolved root-relative path)
+Link = tuple[str, str]
+
+
+class LinkGraph:
+    """Links per source file, a reverse index of referrers, and target existence.
+
+    Sources carry the stat key they were parsed at, so unchanged files are reused
+    across runs. The reverse index finds the links to re-check when a path is
+    added or removed.
+    """
+
+    def __init__(self) -> None:
+        self.links: dict[str, list[Link]] = {}
+        # http(s) link targets per source, as written (for external checks)
+        self.external: dict[str, list[str]] = {}
+        self.keys: dict[str, StatKey | None] = {}
+        self.exists: dict[str, bool] = {}
+        self.referrers: dict[str, set[str]] = {}
+        self._started_ns = time.time_ns()
+
+    def set_source(
+        self, file: str, key: StatKey | None, links: list[Link], external: list[str] | None = None
+    ) -> None:
+        """Record a source file's links, replacing any it had before."""
+        self.remove_source(file)
+        self.links[file] = links
+        self.keys[file] = key
+        if external:
+            self.external[file] = external
+        for _target, resolved in links:
+            self.referrers.setdefault(resolved, set()).add(file)
+
+    def remove_source(self, file: str) -> None:
+        """Forget a source file and its reverse index entries."""
+        self.keys.pop(file, None)
+        self.external.pop(file, None)
+        for _target, resolved in self.links.pop(file, []):
+            sources = self.referrers.get(resolved)
+            if sources is not None:
+                sources.discard(file)
+                if not sources:
+                    del self.referrers[resolved]
+
+    def is_current(self, file: str, key: StatKey | None) -> bool:
+        """Whether a source's stored links were parsed from the file as it is now."""
+        return key is not None and file in self.links and self.keys.get(file) == key
+
+    def targets_affected_by(self, path: str) -> set[str]:
+        """Linked paths whose existence may change when path is added or removed.
+
+        That is the path itself, anything under it (if it's a directory), and
+        its ancestor directories (which appear or vanish with their contents).
+        """
+        affected = {path} & self.referrers.keys()
+        prefix = path + "/"
+        affected.update(t for t in self.referrers if t.startswith(prefix))
+        parts = path.split("/")
+        for depth in range(1, len(parts)):
+            ancestor = "/".join(parts[:depth])
+            if ancestor in self.referrers:
+                affected.add(ancestor)
+        return affected
+
+    def prune_exists(self) -> None:
+        """Drop existence entries for paths no longer linked from anywhere."""
+        for target in [t for t in self.exists if t not in self.referrers]:
+            del self.exists[target]
+
+    def save(self, cache_dir: Path, root: Path) -> None:
+        """Persist the graph; sources modified too recently to trust are stored without a key."""
+        sources = {
+            file: [
+                None if is_racy(self.keys.get(file), self._started_ns) else self.keys[file],
+                links,
+                self.external.get(file, []),
+            ]
+            for file, links in self.links.items()
+        }
+        data = {
+            "version": GRAPH_VERSION,
+            "root": str(root),
+            "sources": sources,
+            "referrers": {target: sorted(files) for target, files in self.referrers.items()},
+            "exists": self.exists,
+        }
+        write_json_atomic(cache_file(cache_dir, root, "graph"), data)
+
+    @classmethod
+    def load(cls, cache_dir: Path, root: Path) -> "LinkGraph | None":
+        """Load the graph stored for root, or None if there isn't a usable one."""
+        data = read_json(cache_file(cache_dir, root, "graph"))
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != GRAPH_VERSION
+            or data.get("root") != str(root)
+        ):
+            return None
+        graph = cls()
+        try:
+            for file, (key, links, external) in data["sources"].items():
+                graph.links[file] = [(target, resolved) for target, resolved in links]
+                graph.keys[file] = tuple(key) if key is not None else None
+                if external:
+                    graph.external[file] = list(external)
+            graph.referrers = {target: set(files) for target, files in data["referrers"].items()}
+            graph.exists = dict(data["exists"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return graph
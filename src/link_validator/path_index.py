@@ -0,0 +1,116 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Path index
+
+"""Existence checks for link targets, listing each target directory at most once."""
+
+import os
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+
+
+def path_exists(root: Path, path: str) -> bool:
+    """Check one root-relative path on disk, with the same answer PathIndex would give."""
+    return not path.startswith("..") and os.path.exists(root / path)
+
+
+class PathIndex:
+    """Which root-relative paths exist, answered from cached directory listings.
+
+    A lookup lists the directory the path would be in (one scandir, kept for
+    later lookups), so a run costs one listing per distinct target directory
+    instead of one stat per link, and the rest of the tree is never visited.
+    Paths known up front (tracked files from .git/index, with their ancestor
+    directories) answer without touching the disk; anything else falls back to
+    a listing, so results always match `Path.exists()` for paths inside the root.
+
+    Iterating (for fix suggestions) needs every path: it yields the known paths
+    when given, and otherwise walks the tree once, not descending into skipped
+    or symlinked directories.
+
+    Build one per run and share it between callers that check the same tree.
+    """
+
+    def __init__(
+        self, root: Path, skip_dirs: Collection[str] = (), known: Iterable[str] | None = None
+    ) -> None:
+        self.root = root
+        self._skip_dirs = skip_dirs
+        self._listings: dict[str, frozenset[str] | None] = {}
+        self._known: set[str] = {"."}
+        self._all: list[str] | None = None
+        if known is not None:
+            for path in known:
+                parts = path.split("/")
+                if any(part in skip_dirs for part in parts[:-1]):
+                    continue
+                while parts and "/".join(parts) not in self._known:
+                    self._known.add("/".join(parts))
+                    parts.pop()
+            self._all = [path for path in self._known if path != "."]
+
+    def _listing(self, rel_dir: str) -> frozenset[str] | None:
+        """Names in a root-relative directory (None if it isn't one), listed once."""
+        if rel_dir in self._listings:
+            return self._listings[rel_dir]
+        names: frozenset[str] | None
+        try:
+            with os.scandir(self.root / rel_dir if rel_dir else self.root) as entries:
+                names = frozenset(
+                    entry.name
+                    for entry in entries
+                    # Dangling symlinks don't exist as far as links are concerned
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                )
+        except OSError:
+            names = None
+        self._listings[rel_dir] = names
+        return names
+
+    def _walk(self) -> list[str]:
+        paths: list[str] = []
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(self.root / rel_dir if rel_dir else self.root)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        paths.append(rel)
+                        if entry.name not in self._skip_dirs and not entry.is_symlink():
+                            stack.append(rel)
+                    elif not entry.is_symlink() or os.path.exists(entry.path):
+                        paths.append(rel)
+        return paths
+
+    def _every_path(self) -> list[str]:
+        if self._all is None:
+            self._all = self._walk()
+        return self._all
+
+    def __len__(self) -> int:
+        """Indexed paths, counting the root (walks the tree unless paths were given)."""
+        return len(self._every_path()) + 1
+
+    def __iter__(self) -> Iterator[str]:
+        """Every indexed path (not the root itself, nor anything under skipped directories)."""
+        return iter(self._every_path())
+
+    def exists(self, path: str) -> bool:
+        """Whether a normalized root-relative path names an existing file or directory."""
+        if os.sep != "/":
+            path = path.replace(os.sep, "/")
+        if path in self._known:
+            return True
+        if path.split("/", 1)[0] == "..":
+            return False
+        parent, _, name = path.rpartition("/")
+        names = self._listing(parent)
+        return names is not None and name in names
@@ -0,0 +1,160 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Fix suggestions
+
+"""Fix suggestions for broken links ("did you mean"), from a basename and trigram index."""
+
+import heapq
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+
+# Candidates attached to each broken link
+MAX_SUGGESTIONS = 3
+
+# Trailing path components compared when ranking same-name candidates
+TAIL_DEPTH = 3
+
+# Minimum Dice similarity between two names' trigram sets for a fuzzy candidate
+MIN_SIMILARITY = 0.5
+
+
+def _stem(name: str) -> str:
+    """A lowercased file name without its extension (dotfiles keep their name)."""
+    stem, dot, _extension = name.rpartition(".")
+    return stem if dot and stem else name
+
+
+def _extension(path: str) -> str:
+    name = path.rsplit("/", 1)[-1]
+    stem, dot, extension = name.rpartition(".")
+    return extension if dot and stem else ""
+
+
+def name_trigrams(stem: str) -> frozenset[str]:
+    """Trigrams of a name stem, padded so short names and word ends still count."""
+    padded = f" {stem} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class SuggestionIndex:
+    """Existing paths indexed by name, with a trigram index over name stems.
+
+    A missing path's candidates are, first, paths with the same name (a move),
+    preferring ones that also share its trailing directories (a directory move
+    keeps `area/guide.md` intact under a new root). Only when nothing has the
+    same name are similarly named paths looked for (a rename): a name sharing
+    none of the missing name's rarest trigrams can't reach MIN_SIMILARITY, so
+    common trigrams never have their long posting lists scanned. The trigram
+    index is built on the first rename lookup, and results are memoized per
+    missing path, since broken links after a move share targets.
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        self._by_name: dict[str, list[str]] = {}
+        for path in paths:
+            self._by_name.setdefault(path.rsplit("/", 1)[-1].lower(), []).append(path)
+        self._stem_grams: list[frozenset[str]] = []
+        self._stem_paths: list[list[str]] = []
+        self._postings: dict[str, list[int]] | None = None
+        self._buckets: dict[str, tuple[list[str], dict[str, list[str]]]] = {}
+        self._memo: dict[tuple[str, int], list[str]] = {}
+
+    def suggest(self, missing: str, limit: int = MAX_SUGGESTIONS) -> list[str]:
+        """Up to `limit` existing paths the missing one most likely moved to."""
+        key = (missing, limit)
+        cached = self._memo.get(key)
+        if cached is None:
+            cached = self._memo[key] = self._moved(missing, limit) or self._renamed(missing, limit)
+        return list(cached)
+
+    def _moved(self, missing: str, limit: int) -> list[str]:
+        """Same-name paths, longest shared trailing directories first."""
+        parts = missing.lower().split("/")
+        bucket = self._bucket(parts[-1])
+        if bucket is None:
+            return []
+        ordered, by_tail = bucket
+        tiers = [by_tail.get("/".join(parts[-depth:]), ()) for depth in range(TAIL_DEPTH, 1, -1)]
+        chosen: list[str] = []
+        for tier in [*tiers, ordered]:
+            for path in tier:
+                if path != missing and path not in chosen:
+                    chosen.append(path)
+                    if len(chosen) == limit:
+                        return chosen
+        return chosen
+
+    def _bucket(self, name: str) -> tuple[list[str], dict[str, list[str]]] | None:
+        """Paths with a name, in suggestion order and grouped by trailing components."""
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            paths = self._by_name.get(name)
+            if paths is None:
+                return None
+            ordered = sorted(paths, key=_path_order)
+            by_tail: dict[str, list[str]] = {}
+            for path in ordered:
+                parts = path.lower().split("/")
+                for depth in range(2, min(TAIL_DEPTH, len(parts)) + 1):
+                    by_tail.setdefault("/".join(parts[-depth:]), []).append(path)
+            bucket = self._buckets[name] = (ordered, by_tail)
+        return bucket
+
+    def _build_trigrams(self) -> dict[str, list[int]]:
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        stem_ids: dict[str, int] = {}
+        for name, paths in self._by_name.items():
+            stem = _stem(name)
+            stem_id = stem_ids.get(stem)
+            if stem_id is None:
+                stem_id = stem_ids[stem] = len(self._stem_paths)
+                grams = name_trigrams(stem)
+                self._stem_grams.append(grams)
+                self._stem_paths.append([])
+                for gram in grams:
+                    postings[gram].append(stem_id)
+            self._stem_paths[stem_id].extend(paths)
+        return dict(postings)
+
+    def _renamed(self, missing: str, limit: int) -> list[str]:
+        """Paths whose name stem is similar, most similar first."""
+        if self._postings is None:
+            self._postings = self._build_trigrams()
+        postings = self._postings
+        name = missing.rsplit("/", 1)[-1].lower()
+        grams = name_trigrams(_stem(name))
+        size = len(grams)
+        # Dice >= s needs an overlap of at least s * |grams| / (2 - s) trigrams,
+        # so every match shares one of the |grams| - required + 1 rarest ones,
+        # and its own trigram count lies within the same factor of |grams|
+        factor = MIN_SIMILARITY / (2 - MIN_SIMILARITY)
+        required = math.ceil(factor * size)
+        smallest, largest = factor * size, size / factor
+        rarest = sorted(grams, key=lambda gram: len(postings.get(gram, ())))
+        candidates: set[int] = set()
+        for gram in rarest[: size - required + 1]:
+            candidates.update(postings.get(gram, ()))
+
+        scores: dict[str, float] = {}
+        stem_grams = self._stem_grams
+        for stem_id in candidates:
+            other = stem_grams[stem_id]
+            if not smallest <= len(other) <= largest:
+                continue
+            score = 2 * len(grams & other) / (size + len(other))
+            if score >= MIN_SIMILARITY:
+                for path in self._stem_paths[stem_id]:
+                    scores[path] = score
+        scores.pop(missing, None)
+
+        extension = _extension(name)
+
+        def rank(path: str) -> tuple[float, bool, int, str]:
+            return (-scores[path], _extension(path.lower()) != extension, len(path), path)
+
+        return heapq.nsmallest(limit, scores, key=rank)
+
+
+def _path_order(path: str) -> tuple[int, str]:
+    """Order among equally good candidates: shortest path first, then alphabetical."""
+    return (len(path), path)
@@ -5,24 +5,53 @@
 
 import os
 import re
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
 from pathlib import Path
 
-# Matches [text](target) and ![alt](target)
-LINK_PATTERN = re.compile(r"!?\[(?:[^\]]*)\]\(([^)]*)\)")
-
-# Matches opening/closing code fences
-FENCE_PATTERN = re.compile(r"^(`{3,}|~{3,})")
-
-# Matches inline code spans (backtick-wrapped)
-INLINE_CODE_PATTERN = re.compile(r"(`+)(.+?)\1")
+from link_validator.anchors import AnchorIndex
+from link_validator.external import CHECKED_SCHEMES, DEFAULT_TTL, check_urls, external_url
+from link_validator.graph import LinkGraph
+from link_validator.path_index import PathIndex, path_exists
+from link_validator.suggest import SuggestionIndex
+from tool_cli.cache import stat_key
+from tool_cli.changes import normalize_changed
+from tool_cli.content import content_roots, in_roots, read_content_paths, walk_markdown
+from tool_cli.git_index import tracked_files
+
+# Matches [text](target) within one line (the "!" of an image link isn't needed:
+# a leading literal lets the regex engine skip ahead to each "[")
+LINK_PATTERN = re.compile(r"\[(?:[^\]\n]*)\]\(([^)\n]*)\)")
+
+# Matches code fence lines (leading whitespace allowed), capturing the fence run
+# and the rest of the line; the leading newline keeps the whole-buffer search on
+# a literal prefix, so the first line is matched separately
+FENCE_PATTERN = re.compile(r"\n[^\S\n]*(`{3,}|~{3,})(.*)")
+FIRST_LINE_FENCE_PATTERN = re.compile(r"[^\S\n]*(`{3,}|~{3,})(.*)")
+
+# Matches inline code spans (backtick-wrapped), opening and closing runs of equal length
+INLINE_CODE_PATTERN = re.compile(r"`(`*)(.+?)`\1")
 
 SKIP_DIRS = frozenset({".git", ".graft", ".venv", "node_modules", "__pycache__"})
 
+# Scanned when knowledge-base.yaml declares no `paths:`
 CONTENT_DIRS = ("docs", "policies", "playbooks", "notes", "specs")
 
+# Scanned alongside the declared paths: specs aren't KB content, but their links rot too
+EXTRA_DIRS = ("specs",)
+
 EXTERNAL_PREFIXES = ("http://", "https://", "mailto:")
 
+# Distinct (file_dir, target) pairs a ResolutionCache remembers per run
+RESOLVE_CACHE_SIZE = 65_536
+
+# Tasks per worker when parallel: small enough to balance uneven file sizes,
+# large enough to amortize inter-process overhead
+CHUNKS_PER_WORKER = 4
+
 
 @dataclass
 class LinkViolation:
@@ -33,6 +62,8 @@ class LinkViolation:
     resolved: str
     rule: str = "broken-link"
     message: str = "Link target does not exist"
+    # Existing paths the target most likely moved to (broken-link only)
+    suggestions: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -42,43 +73,121 @@ class ValidateResult:
     violations: list[LinkViolation] = field(default_factory=list)
     files_checked: int = 0
     links_checked: int = 0
+    # Run statistic (files reused from the link graph aren't resolved again), so
+    # it doesn't take part in comparing results
+    resolve_cache_hits: int = field(default=0, compare=False)
+    # Unique external URLs checked (None when external links weren't checked)
+    external_urls: int | None = None
+    external_cache_hits: int = field(default=0, compare=False)
 
 
-def _extract_links(content: str) -> list[str]:
-    """Extract link targets from markdown, skipping fenced code blocks."""
-    targets: list[str] = []
-    in_fence = False
-    fence_char = ""
-    fence_len = 0
-
-    for line in content.splitlines():
-        stripped = line.strip()
-        fence_match = FENCE_PATTERN.match(stripped)
-
-        if fence_match:
-            char = fence_match.group(1)[0]
-            length = len(fence_match.group(1))
-
-            if not in_fence:
-                in_fence = True
-                fence_char = char
-                fence_len = length
-                continue
-            elif char == fence_char and length >= fence_len and stripped == char * length:
-                # Closing fence: same char, at least as long, nothing else on line
-                in_fence = False
+def _line_start(fence: re.Match[str]) -> int:
+    """Offset of a fence match's line (past the newline FENCE_PATTERN starts with)."""
+    return fence.start() + 1 if fence.re is FENCE_PATTERN else fence.start()
+
+
+def _code_ranges(content: str) -> list[tuple[int, int]]:
+    """Offsets of fenced code blocks and inline code spans, sorted and non-overlapping.
+
+    A fence block runs from the start of its opening line to the end of its
+    closing line (or the end of the content if unclosed). A closing fence uses
+    the opening character, is at least as long, and has nothing else on its
+    line. Inline spans are only matched between fence blocks.
+    """
+    fences: list[tuple[int, int]] = []
+    if "```" in content or "~~~" in content:
+        first = FIRST_LINE_FENCE_PATTERN.match(content)
+        matches = FENCE_PATTERN.finditer(content)
+        opening: re.Match[str] | None = None
+        for match in chain([first], matches) if first else matches:
+            if opening is None:
+                opening = match
                 continue
+            run, opening_run = match.group(1), opening.group(1)
+            if (
+                run[0] == opening_run[0]
+                and len(run) >= len(opening_run)
+                and not match.group(2).strip()
+            ):
+                fences.append((_line_start(opening), match.end()))
+                opening = None
+        if opening is not None:
+            fences.append((_line_start(opening), len(content)))
+
+    if "`" not in content:
+        return fences
+    ranges: list[tuple[int, int]] = []
+    gap_start = 0
+    for fence in [*fences, (len(content), len(content))]:
+        ranges.extend(
+            span.span() for span in INLINE_CODE_PATTERN.finditer(content, gap_start, fence[0])
+        )
+        ranges.append(fence)
+        gap_start = fence[1]
+    ranges.pop()
+    return ranges
+
+
+def _blank_inline_brackets(content: str, code: list[tuple[int, int]]) -> str:
+    """Blank out inline code spans containing `]`, keeping every offset.
+
+    LINK_PATTERN can't match link text across such a span (`[a `]` b](t.md)`).
+    A span is one line, so fence blocks (which end in a newline or run to the
+    end of the content) are left alone; the buffer is only copied if needed.
+    """
+    parts: list[str] = []
+    previous = 0
+    for start, end in code:
+        span = content[start:end]
+        if "]" in span and "\n" not in span:
+            parts.append(content[previous:start])
+            parts.append(" " * (end - start))
+            previous = end
+    if not parts:
+        return content
+    parts.append(content[previous:])
+    return "".join(parts)
+
 
-        if in_fence:
+def _extract_links(content: str) -> list[str]:
+    """Extract link targets from markdown, skipping code fences and inline code.
+
+    Links are matched on the original buffer in one pass alongside the
+    precomputed code ranges: a link starting inside code is dropped (and the
+    search resumes after the code), as is one whose target contains code.
+    Code spans in link text are kept, even ones containing `]`.
+    """
+    if "](" not in content:
+        return []
+    code = _code_ranges(content)
+    if not code:
+        return [target for match in LINK_PATTERN.finditer(content) if (target := match[1].strip())]
+    content = _blank_inline_brackets(content, code)
+
+    targets: list[str] = []
+    position = 0
+    index = 0
+    count = len(code)
+
+    while (match := LINK_PATTERN.search(content, position)) is not None:
+        start = match.start()
+        while index < count and code[index][1] <= start:
+            index += 1
+        if index < count and code[index][0] <= start:
+            position = code[index][1]
             continue
+        position = match.end()
 
-        # Remove inline code spans before extracting links
-        line_without_code = INLINE_CODE_PATTERN.sub("", line)
+        target_start, target_end = match.span(1)
+        ahead = index
+        while ahead < count and code[ahead][0] < target_start:
+            ahead += 1
+        if ahead < count and code[ahead][0] < target_end:
+            continue
 
-        for match in LINK_PATTERN.finditer(line_without_code):
-            target = match.group(1).strip()
-            if target:
-                targets.append(target)
+        target = match.group(1).strip()
+        if target:
+            targets.append(target)
 
     return targets
 
@@ -119,64 +228,164 @@ def _resolve_path(target: str, file_dir: str) -> str | None:
     return resolved
 
 
-def _get_content_files(root: Path) -> list[str]:
-    """Collect markdown files in content directories."""
-    files: list[str] = []
-    for content_dir in CONTENT_DIRS:
-        dir_path = root / content_dir
-        if not dir_path.exists():
-            continue
-        for dirpath, dirnames, filenames in os.walk(dir_path):
-            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-            for filename in filenames:
-                if filename.endswith(".md"):
-                    full_path = os.path.join(dirpath, filename)
-                    rel_path = os.path.relpath(full_path, root)
-                    files.append(rel_path)
-    return sorted(files)
+class ResolutionCache:
+    """Bounded memo of `_resolve_path` results keyed by (file_dir, target).
 
+    Files in one directory tend to link the same targets (every note linking
+    `../index.md`), so resolution cost follows the unique pairs rather than the
+    total number of links. When full, the oldest entry is evicted.
+    """
 
-def validate(root_dir: str) -> ValidateResult:
-    """Validate internal links across a KB directory.
+    def __init__(self, max_size: int = RESOLVE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self._memo: dict[tuple[str, str], str | None] = {}
 
-    Scans markdown files for links and checks that targets exist.
+    def resolve(self, target: str, file_dir: str) -> str | None:
+        """Resolve a link target like `_resolve_path`, reusing earlier results."""
+        key = (file_dir, target)
+        try:
+            resolved = self._memo[key]
+        except KeyError:
+            resolved = _resolve_path(target, file_dir)
+            if len(self._memo) >= self.max_size:
+                del self._memo[next(iter(self._memo))]
+            self._memo[key] = resolved
+            return resolved
+        self.hits += 1
+        return resolved
 
-    Args:
-        root_dir: The KB root directory.
 
-    Returns:
-        ValidateResult with violations, file count, and link count.
+def _has_broken_anchor(anchors: AnchorIndex, target: str, resolved: str) -> bool:
+    """Whether a link's #fragment is missing from its (existing) markdown target."""
+    fragment = target.partition("#")[2]
+    if not fragment or not resolved.endswith(".md"):
+        return False
+    return not anchors.has_anchor(resolved, fragment)
+
+
+def _content_roots(root: Path) -> tuple[str, ...]:
+    """The directories scanned for links: the declared `paths:` plus EXTRA_DIRS."""
+    return content_roots(read_content_paths(root), CONTENT_DIRS, extra=EXTRA_DIRS)
+
+
+def _is_content_file(path: str, roots: tuple[str, ...]) -> bool:
+    """Whether a root-relative path is a markdown file the validator scans."""
+    return (
+        path.endswith(".md")
+        and in_roots(path, roots)
+        and not any(d in SKIP_DIRS for d in path.split("/")[:-1])
+    )
+
+
+def _get_content_files(root: Path, tracked: list[str] | None = None) -> list[str]:
+    """Collect markdown files in content directories.
+
+    Candidates come from tracked (the files listed in .git/index) when given,
+    and from walking the content directories otherwise.
     """
-    root = Path(root_dir).resolve()
-    files = _get_content_files(root)
+    roots = _content_roots(root)
+    if tracked is not None:
+        return [f for f in tracked if _is_content_file(f, roots)]
+    return walk_markdown(root, roots, SKIP_DIRS)
+
+
+def _read_targets(root: Path, file: str) -> list[str]:
+    """Read a file and return the link targets in it (unreadable files have none)."""
+    try:
+        content = (root / file).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return []
+    return _extract_links(content)
+
+
+def _resolve_links(
+    file: str, targets: list[str], resolver: ResolutionCache, local_anchors: bool = False
+) -> list[tuple[str, str]]:
+    """Return (target, resolved) for each internal link target of a file.
+
+    With local_anchors, same-file links (`#heading`) are included, resolved to
+    the file itself.
+    """
+    file_dir = os.path.dirname(file)
+    links: list[tuple[str, str]] = []
+    for target in targets:
+        resolved = resolver.resolve(target, file_dir)
+        if resolved is not None:  # Skip external or empty
+            links.append((target, resolved))
+        elif local_anchors and target.startswith("#"):
+            links.append((target, file))
+    return links
+
+
+def _collect_targets(root: Path, files: list[str], jobs: int) -> list[list[str]]:
+    """Read and tokenize files, fanning out over a process pool when jobs > 1.
+
+    Results are returned in the same order as files, so the merged output is
+    identical to the serial path.
+    """
+    targets_of = partial(_read_targets, root)
+    if jobs <= 1 or len(files) < 2:
+        return [targets_of(file) for file in files]
+
+    workers = min(jobs, len(files))
+    chunksize = max(1, len(files) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(targets_of, files, chunksize=chunksize))
+
+
+def _collect_links(
+    root: Path,
+    files: list[str],
+    jobs: int,
+    local_anchors: bool = False,
+    resolver: ResolutionCache | None = None,
+) -> list[list[tuple[str, str]]]:
+    """Extract and resolve links per file, in the same order as files.
+
+    Workers only read and tokenize; targets are resolved here through one
+    shared ResolutionCache.
+    """
+    if resolver is None:
+        resolver = ResolutionCache()
+    collected = _collect_targets(root, files, jobs)
+    return [
+        _resolve_links(file, targets, resolver, local_anchors)
+        for file, targets in zip(files, collected, strict=True)
+    ]
+
+
+def _build_result(root: Path, graph: LinkGraph, check_anchors: bool) -> ValidateResult:
+    """Report violations for every source in the graph, in sorted file order."""
+    anchors = AnchorIndex(root) if check_anchors else None
     all_violations: list[LinkViolation] = []
     total_links = 0
 
+    files = sorted(graph.links)
     for file in files:
-        full_path = root / file
-        try:
-            content = full_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-
-        file_dir = os.path.dirname(file)
-        targets = _extract_links(content)
-
-        for target in targets:
-            resolved = _resolve_path(target, file_dir)
-            if resolved is None:
-                continue  # External or empty
+        for target, resolved in graph.links[file]:
+            if anchors is None and target.startswith("#"):
+                continue  # Same-file anchor, only checked with anchors on
 
             total_links += 1
-            resolved_full = root / resolved
 
             # Check if target exists as file or directory
-            if not resolved_full.exists():
+            if not graph.exists[resolved]:
+                all_violations.append(
+                    LinkViolation(
+                        file=file,
+                        target=target,
+                        resolved=resolved,
+                    )
+                )
+            elif anchors is not None and _has_broken_anchor(anchors, target, resolved):
                 all_violations.append(
                     LinkViolation(
                         file=file,
                         target=target,
                         resolved=resolved,
+                        rule="broken-anchor",
+                        message="Link fragment does not match a heading in the target",
                     )
                 )
 
@@ -185,3 +394,196 @@ def validate(root_dir: str) -> ValidateResult:
         files_checked=len(files),
         links_checked=total_links,
     )
+
+
+def _suggest_fixes(violations: list[LinkViolation], path_index: Callable[[], PathIndex]) -> None:
+    """Attach "did you mean" candidates to broken links (the index is only built if needed)."""
+    broken = [v for v in violations if v.rule == "broken-link"]
+    if not broken:
+        return
+    index = SuggestionIndex(path_index())
+    for violation in broken:
+        violation.suggestions = index.suggest(violation.resolved)
+
+
+def _check_external(
+    root: Path, graph: LinkGraph, result: ValidateResult, cache_dir: str | None, ttl: float
+) -> None:
+    """Check every http(s) link in the graph, adding a violation per broken occurrence."""
+    occurrences = [
+        (file, target, url)
+        for file in sorted(graph.external)
+        for target in graph.external[file]
+        if (url := external_url(target))
+    ]
+    statuses = check_urls(
+        {url for _file, _target, url in occurrences},
+        Path(cache_dir) if cache_dir is not None else None,
+        root,
+        ttl=ttl,
+    )
+    for file, target, url in occurrences:
+        status = statuses[url]
+        if not status.ok:
+            result.violations.append(
+                LinkViolation(
+                    file=file,
+                    target=target,
+                    resolved=url,
+                    rule="broken-external",
+                    message=status.describe(),
+                )
+            )
+    # Keep violations grouped by source file (sort is stable within a file)
+    result.violations.sort(key=lambda v: v.file)
+    result.external_urls = len(statuses)
+    result.external_cache_hits = sum(1 for status in statuses.values() if status.cached)
+
+
+def _parse_sources(
+    root: Path, graph: LinkGraph, files: list[str], jobs: int, use_stat: bool
+) -> int:
+    """(Re)parse source files into the graph, skipping ones whose stat key is unchanged.
+
+    Returns the number of link resolutions answered from the memo.
+    """
+    keys = {file: stat_key(root / file) if use_stat else None for file in files}
+    stale = [file for file in files if not graph.is_current(file, keys[file])]
+    resolver = ResolutionCache()
+    collected = _collect_targets(root, stale, jobs)
+    for file, targets in zip(stale, collected, strict=True):
+        links = _resolve_links(file, targets, resolver, local_anchors=True)
+        external = [t for t in targets if t.startswith(CHECKED_SCHEMES)]
+        graph.set_source(file, keys[file], links, external)
+    return resolver.hits
+
+
+def validate(
+    root_dir: str,
+    use_git_index: bool = False,
+    path_index: PathIndex | None = None,
+    jobs: int = 1,
+    check_anchors: bool = False,
+    cache_dir: str | None = None,
+    check_external: bool = False,
+    external_ttl: float = DEFAULT_TTL,
+) -> ValidateResult:
+    """Validate internal links across a KB directory.
+
+    Scans markdown files for links and checks that targets exist.
+
+    Args:
+        root_dir: The KB root directory.
+        use_git_index: Enumerate files from .git/index instead of walking the tree.
+        path_index: Existing paths under root_dir (built for this run if not given,
+            seeded from .git/index with use_git_index).
+        jobs: Number of worker processes for reading and parsing files (1 runs serially).
+        check_anchors: Also check that `#fragment`s name a heading in the target file.
+        cache_dir: Directory for the persistent link graph; unchanged files are
+            not re-parsed, and `validate_changed` can patch the stored graph
+            (None disables it). External URL statuses are cached there too.
+        check_external: Also fetch http(s) links, reporting `broken-external`
+            for ones that fail or return an error status.
+        external_ttl: Seconds a cached external URL status is reused.
+
+    Returns:
+        ValidateResult with violations, file count, and link count.
+    """
+    root = Path(root_dir).resolve()
+    tracked = tracked_files(root) if use_git_index else None
+    files = _get_content_files(root, tracked)
+    if path_index is None:
+        path_index = PathIndex(root, SKIP_DIRS, known=tracked)
+
+    graph = LinkGraph.load(Path(cache_dir), root) if cache_dir is not None else None
+    if graph is None:
+        graph = LinkGraph()
+    keep = set(files)
+    for file in [f for f in graph.links if f not in keep]:
+        graph.remove_source(file)
+    hits = _parse_sources(root, graph, files, jobs, use_stat=cache_dir is not None)
+    graph.exists = {target: path_index.exists(target) for target in graph.referrers}
+
+    if cache_dir is not None:
+        graph.save(Path(cache_dir), root)
+    result = _build_result(root, graph, check_anchors)
+    result.resolve_cache_hits = hits
+    _suggest_fixes(result.violations, lambda: path_index)
+    if check_external:
+        _check_external(root, graph, result, cache_dir, external_ttl)
+    return result
+
+
+def validate_changed(
+    root_dir: str,
+    changed: list[str],
+    cache_dir: str,
+    jobs: int = 1,
+    check_anchors: bool = False,
+    check_external: bool = False,
+    external_ttl: float = DEFAULT_TTL,
+) -> ValidateResult:
+    """Re-validate after a set of paths changed, patching the stored link graph.
+
+    Changed source files are re-parsed (or dropped if deleted), and only links
+    whose targets are affected by a changed path have their existence
+    re-checked. The result matches a full validation as long as every path
+    added, modified, or deleted since the graph was stored is listed. Without a
+    stored graph, this falls back to a full validation (which stores one).
+
+    Args:
+        root_dir: The KB root directory.
+        changed: Added, modified, or deleted paths (relative to root_dir or absolute).
+        cache_dir: Directory holding the graph stored by a previous validation.
+        jobs: Number of worker processes for re-parsing changed files.
+        check_anchors: Also check that `#fragment`s name a heading in the target file.
+        check_external: Also fetch http(s) links (statuses cached in cache_dir).
+        external_ttl: Seconds a cached external URL status is reused.
+
+    Returns:
+        ValidateResult with violations, file count, and link count.
+    """
+    root = Path(root_dir).resolve()
+    graph = LinkGraph.load(Path(cache_dir), root)
+    if graph is None:
+        return validate(
+            root_dir,
+            jobs=jobs,
+            check_anchors=check_anchors,
+            cache_dir=cache_dir,
+            check_external=check_external,
+            external_ttl=external_ttl,
+        )
+
+    paths = sorted({p for p in (normalize_changed(root, c) for c in changed) if p is not None})
+    roots = _content_roots(root)
+    sources: set[str] = set()
+    for path in paths:
+        prefix = path + "/"
+        sources.update(f for f in graph.links if f == path or f.startswith(prefix))
+        if _is_content_file(path, roots):
+            sources.add(path)
+        elif (root / path).is_dir():
+            sources.update(walk_markdown(root, [path], SKIP_DIRS))
+
+    # Changed sources are always re-parsed (the caller's list is trusted over stat keys)
+    for file in sources:
+        graph.remove_source(file)
+    present = sorted(f for f in sources if _is_content_file(f, roots) and (root / f).is_file())
+    hits = _parse_sources(root, graph, present, jobs, use_stat=True)
+
+    recheck: set[str] = set()
+    for path in paths:
+        recheck.update(graph.targets_affected_by(path))
+    recheck.update(t for t in graph.referrers if t not in graph.exists)
+    for target in recheck:
+        graph.exists[target] = path_exists(root, target)
+    graph.prune_exists()
+
+    graph.save(Path(cache_dir), root)
+    result = _build_result(root, graph, check_anchors)
+    result.resolve_cache_hits = hits
+    _suggest_fixes(result.violations, lambda: PathIndex(root, SKIP_DIRS))
+    if check_external:
+        _check_external(root, graph, result, cache_dir, external_ttl)
+    return result
@@ -6,16 +6,108 @@ Provides the common pattern: parse args, run tool, serialize, print JSON, exit.
 
 import json
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class Option:
+    """A tool-specific flag forwarded to the runner as a keyword argument.
+
+    Options with a `parse` callable take a value (`--jobs 4` or `--jobs=4`).
+    Options without one are switches that pass `value` when present.
+    """
+
+    flag: str
+    dest: str
+    parse: Callable[[str], Any] | None = None
+    value: Any = True
+
+
+@dataclass(frozen=True)
+class Records:
+    """How a tool streams `--ndjson` output, one record per line as it's produced.
+
+    `runner` takes the same arguments as the tool's runner and yields
+    JSON-serializable records; the run exits 1 if any record `is_failure`.
+    """
+
+    runner: Callable[..., Iterable[dict[str, Any]]]
+    is_failure: Callable[[dict[str, Any]], bool]
+
+
+class UsageError(Exception):
+    """Raised when a tool option is missing its value, invalid, or can't be honored."""
+
+
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer option value (e.g. `--jobs`)."""
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"expected a positive integer, got {value}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    """Parse a strictly positive number of seconds or similar (e.g. `--interval 0.5`)."""
+    number = float(value)
+    if number <= 0:
+        raise ValueError(f"expected a positive number, got {value}")
+    return number
+
+
+def parse_args(argv: list[str], options: Sequence[Option]) -> tuple[list[str], dict[str, Any]]:
+    """Split argv into positional arguments and runner keyword arguments.
+
+    Raises:
+        UsageError: If an option is missing its value or the value is invalid.
+    """
+    by_flag = {option.flag: option for option in options}
+    positional: list[str] = []
+    kwargs: dict[str, Any] = {}
+
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        index += 1
+        flag, has_inline, inline_value = arg.partition("=")
+        option = by_flag.get(flag) if flag.startswith("--") else None
+        if option is None:
+            positional.append(arg)
+            continue
+
+        if option.parse is None:
+            if has_inline:
+                raise UsageError(f"{flag} does not take a value")
+            kwargs[option.dest] = option.value
+            continue
+
+        if has_inline:
+            raw = inline_value
+        elif index < len(argv):
+            raw = argv[index]
+            index += 1
+        else:
+            raise UsageError(f"{flag} requires a value")
+
+        try:
+            kwargs[option.dest] = option.parse(raw)
+        except ValueError as e:
+            raise UsageError(f"invalid value for {flag}: {e}") from None
+
+    return positional, kwargs
+
+
 def run_tool(
-    runner: Callable[[str], T],
+    runner: Callable[..., T],
     serializer: Callable[[T], dict[str, Any]],
     has_failures: Callable[[T], bool],
+    options: Sequence[Option] = (),
+    records: Records | None = None,
+    argv: Sequence[str] | None = None,
 ) -> None:
     """Run a tool with standard CLI conventions.
 
@@ -23,24 +115,51 @@ def run_tool(
     JSON output, exit 0/1 based on findings, exit 2 on misconfiguration.
 
     Args:
-        runner: Function taking root_dir, returning a result object.
+        runner: Function taking root_dir (plus any option keywords), returning a result.
         serializer: Converts the result to a JSON-serializable dict.
         has_failures: Returns True if the result warrants exit code 1.
+        options: Tool-specific flags passed to the runner as keyword arguments.
+        records: Streams records for `--ndjson` output instead of running `runner`
+            (None means the tool doesn't support it).
+        argv: Arguments after the program (and any subcommand) name; defaults to sys.argv[1:].
     """
-    report_only = "--report-only" in sys.argv
-    args = [a for a in sys.argv[1:] if a != "--report-only"]
-    root_dir = args[0] if args else "."
+    if argv is None:
+        argv = sys.argv[1:]
+    report_only = "--report-only" in argv
+    ndjson = records is not None and "--ndjson" in argv
+    runner_flags = {"--report-only", "--ndjson"} if records is not None else {"--report-only"}
+    argv = [a for a in argv if a not in runner_flags]
 
     try:
-        result = runner(root_dir)
-    except FileNotFoundError as e:
+        args, kwargs = parse_args(argv, options)
+    except UsageError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(2)
 
-    print(json.dumps(serializer(result), indent=2))
+    root_dir = args[0] if args else "."
+
+    if ndjson:
+        failed = False
+        try:
+            # One compact object per line, written as soon as the tool yields it
+            for record in records.runner(root_dir, **kwargs):
+                sys.stdout.write(json.dumps(record) + "\n")
+                sys.stdout.flush()
+                failed = failed or records.is_failure(record)
+        except (FileNotFoundError, UsageError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+    else:
+        try:
+            result = runner(root_dir, **kwargs)
+        except (FileNotFoundError, UsageError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+        print(json.dumps(serializer(result), indent=2))
+        failed = has_failures(result)
 
     if report_only:
         sys.exit(0)
 
-    if has_failures(result):
+    if failed:
         sys.exit(1)
@@ -0,0 +1,60 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Cache files
+
+"""Helpers shared by the tools' on-disk caches: stat keys and atomic JSON files."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Files modified this close to the run start may change again within the same
+# mtime tick without a stat change, so entries for them are not stored ("racy" entries).
+RACY_WINDOW_NS = 2_000_000_000
+
+StatKey = tuple[int, int, int]
+
+
+def stat_key(path: Path) -> StatKey | None:
+    """Return the (size, mtime_ns, inode) cache key for a file, or None if it can't be stat'd."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def is_racy(key: StatKey | None, started_ns: int) -> bool:
+    """Whether a stat key is too close to the run start to be trusted later."""
+    return key is None or key[1] >= started_ns - RACY_WINDOW_NS
+
+
+def cache_file(cache_dir: Path, root: Path, kind: str) -> Path:
+    """Cache file for one root (roots can share a cache directory)."""
+    root_hash = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{kind}-{root_hash}.json"
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON cache file, returning None if it's missing or corrupt."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Atomically replace a JSON cache file; failures are ignored (caches are best-effort)."""
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except OSError:
+            os.unlink(tmp_name)
+            raise
@@ -0,0 +1,30 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Changed paths
+
+"""Changed-path lists for the tools' incremental (`--changed`) modes."""
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+
+def read_changed(lines: Iterable[str]) -> list[str]:
+    """Read one path per line (e.g. from stdin), ignoring blank lines."""
+    return [line.strip() for line in lines if line.strip()]
+
+
+def normalize_changed(root: Path, path: str) -> str | None:
+    """Convert a changed path to a normalized root-relative one.
+
+    Accepts paths relative to root or absolute. Returns None for blank paths,
+    the root itself, and paths outside the root.
+    """
+    path = path.strip()
+    if not path:
+        return None
+    if os.path.isabs(path):
+        path = os.path.relpath(path, root)
+    path = os.path.normpath(path).replace(os.sep, "/")
+    if path == "." or path.split("/")[0] == "..":
+        return None
+    return path
@@ -0,0 +1,146 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Content roots
+
+"""Content roots declared in knowledge-base.yaml, enumerated with one shared walk.
+
+The `paths:` section maps each kind of content to its directory:
+
+    paths:
+      docs: docs
+      notes: notes
+
+Extraction is targeted (the indented `key: value` lines under a top-level
+`paths:`), not a general YAML parser.
+"""
+
+import os
+from collections.abc import Collection, Iterable, Mapping
+from pathlib import Path
+
+CONFIG_FILE = "knowledge-base.yaml"
+
+
+def parse_content_paths(content: str) -> dict[str, str] | None:
+    """Extract the `paths:` mapping from knowledge-base.yaml text.
+
+    Returns None if there is no `paths:` section (callers use their defaults).
+    """
+    paths: dict[str, str] | None = None
+    for line in content.splitlines():
+        if paths is None:
+            if line.rstrip() == "paths:":
+                paths = {}
+            continue
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if not line[0].isspace():
+            break  # Exited the paths block
+        key, sep, value = stripped.partition(":")
+        value = value.split(" #", 1)[0].strip().strip("\"'")
+        if sep and value:
+            paths[key.strip()] = value
+    return paths
+
+
+def read_content_paths(root: Path) -> dict[str, str] | None:
+    """The `paths:` mapping of root's knowledge-base.yaml, or None if it has none."""
+    try:
+        content = (root / CONFIG_FILE).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return parse_content_paths(content)
+
+
+def content_roots(
+    paths: Mapping[str, str] | None,
+    default: Iterable[str],
+    exclude: Collection[str] = (),
+    extra: Iterable[str] = (),
+) -> tuple[str, ...]:
+    """The root-relative directories a tool scans.
+
+    Args:
+        paths: The declared `paths:` mapping (None uses `default` instead).
+        default: Directories scanned when nothing is declared.
+        exclude: `paths:` keys the tool doesn't scan (e.g. "notes").
+        extra: Directories scanned in addition to the declared ones.
+
+    Returns:
+        Sorted, normalized roots ("." for the whole tree). Absolute paths and ones
+        leaving the root are dropped, as are roots nested inside another root.
+    """
+    if paths is None:
+        declared = list(default)
+    else:
+        declared = [value for key, value in paths.items() if key not in exclude]
+    roots: set[str] = set()
+    for value in [*declared, *extra]:
+        normalized = os.path.normpath(value).replace(os.sep, "/")
+        if os.path.isabs(value) or normalized == ".." or normalized.startswith("../"):
+            continue
+        roots.add(normalized)
+    if "." in roots:
+        return (".",)
+    return tuple(
+        sorted(
+            root
+            for root in roots
+            if not any(root.startswith(other + "/") for other in roots if other != root)
+        )
+    )
+
+
+def in_roots(path: str, roots: Collection[str]) -> bool:
+    """Whether a root-relative path lies inside one of the roots."""
+    if "." in roots:
+        return True
+    prefix = path
+    while True:
+        prefix, sep, _name = prefix.rpartition("/")
+        if not sep:
+            return False
+        if prefix in roots:
+            return True
+
+
+def walk_markdown(root: Path, roots: Collection[str], skip_dirs: Collection[str]) -> list[str]:
+    """Sorted root-relative paths of markdown files under the roots, in one walk.
+
+    Directories between root and a content root are listed only to find the
+    next step down, so nothing outside the roots is descended into. Below a
+    root, directories named in skip_dirs are pruned before they're listed, and
+    symlinked directories aren't followed (as with os.walk). Roots that don't
+    exist are simply never reached.
+    """
+    inside = {""} if "." in roots else set(roots)
+    # Directories on the way down to a root (the top level included)
+    between: set[str] = set()
+    for root_path in inside:
+        parts = root_path.split("/")
+        between.update("/".join(parts[:depth]) for depth in range(len(parts)))
+
+    files: list[str] = []
+    stack = [("", "" in inside)]
+    while stack:
+        rel_dir, in_content = stack.pop()
+        try:
+            entries = os.scandir(root / rel_dir if rel_dir else root)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not in_content:
+                    if is_dir and (rel in between or rel in inside):
+                        stack.append((rel, rel in inside))
+                elif is_dir:
+                    if entry.name not in skip_dirs and not entry.is_symlink():
+                        stack.append((rel, True))
+                elif entry.name.endswith(".md"):
+                    files.append(rel)
+    return sorted(files)
@@ -0,0 +1,184 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Git index enumeration
+
+"""Read the tracked file list directly from a repository's .git/index.
+
+No subprocess, no network: the index file is parsed in-process. Supports index
+versions 2-4. Returns None whenever the index can't be used (outside a repository,
+unsupported layout such as split or sparse indexes), so callers fall back to os.walk.
+"""
+
+import contextlib
+import os
+import struct
+from pathlib import Path
+
+INDEX_SIGNATURE = b"DIRC"
+
+# Fixed-size entry prefix: ctime, mtime (sec, nsec each), dev, ino, mode, uid, gid, size
+_STAT_FIELDS = struct.Struct(">10I")
+
+_EXTENDED_FLAG = 0x4000
+_NAME_MASK = 0x0FFF
+_STAGE_MASK = 0x3000
+
+_MODE_TYPE_MASK = 0o170000
+_MODE_GITLINK = 0o160000
+_MODE_DIRECTORY = 0o040000
+
+# Extensions that mean the entry list is incomplete or contains directories
+_UNSUPPORTED_EXTENSIONS = frozenset({b"link", b"sdir"})
+
+
+def find_git_dir(root: Path) -> tuple[Path, Path] | None:
+    """Locate the repository containing root.
+
+    Returns (worktree_top, git_dir), or None if root is not inside a repository.
+    Handles `.git` files (worktrees and submodules) that point elsewhere.
+    """
+    for candidate in (root, *root.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return candidate, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except (OSError, UnicodeDecodeError):
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = Path(content.removeprefix("gitdir:").strip())
+            if not git_dir.is_absolute():
+                git_dir = candidate / git_dir
+            return candidate, git_dir
+    return None
+
+
+def _hash_size(git_dir: Path) -> int:
+    """Object id size in bytes: 32 for SHA-256 repositories, otherwise 20."""
+    config_dirs = [git_dir]
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        with contextlib.suppress(OSError, UnicodeDecodeError):
+            config_dirs.append(git_dir / commondir.read_text(encoding="utf-8").strip())
+    for config_dir in config_dirs:
+        try:
+            config = (config_dir / "config").read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        compact = config.replace(" ", "").replace("\t", "").lower()
+        if "objectformat=sha256" in compact:
+            return 32
+    return 20
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode git's offset varint (used for v4 path prefix lengths)."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def parse_index(data: bytes, hash_size: int = 20) -> list[bytes] | None:
+    """Parse index bytes into the list of tracked file paths (as bytes).
+
+    Skips submodule entries and collapses merge-conflict stages to one path.
+    Returns None for malformed or unsupported indexes.
+    """
+    if len(data) < 12 or data[:4] != INDEX_SIGNATURE:
+        return None
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        return None
+
+    paths: list[bytes] = []
+    previous = b""
+    pos = 12
+    entry_fixed = _STAT_FIELDS.size + hash_size
+    end = len(data) - hash_size
+
+    try:
+        for _ in range(count):
+            entry_start = pos
+            mode = _STAT_FIELDS.unpack_from(data, pos)[6]
+            pos += entry_fixed
+            (flags,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+            if flags & _EXTENDED_FLAG:
+                if version < 3:
+                    return None
+                pos += 2
+
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                nul = data.index(b"\0", pos)
+                if strip > len(previous):
+                    return None
+                path = previous[: len(previous) - strip] + data[pos:nul]
+                pos = nul + 1
+            else:
+                name_len = flags & _NAME_MASK
+                nul = data.index(b"\0", pos + name_len if name_len < _NAME_MASK else pos)
+                path = data[pos:nul]
+                # Entries are NUL-padded to a multiple of 8 bytes
+                pos = entry_start + ((nul + 1 - entry_start + 7) & ~7)
+
+            previous = path
+            mode_type = mode & _MODE_TYPE_MASK
+            if mode_type == _MODE_DIRECTORY:
+                return None  # Sparse index directory entry
+            if mode_type == _MODE_GITLINK:
+                continue
+            if flags & _STAGE_MASK and paths and paths[-1] == path:
+                continue
+            paths.append(path)
+
+        while pos + 8 <= end:
+            signature = data[pos : pos + 4]
+            (size,) = struct.unpack_from(">I", data, pos + 4)
+            if signature in _UNSUPPORTED_EXTENSIONS:
+                return None
+            pos += 8 + size
+    except (struct.error, ValueError, IndexError):
+        return None
+
+    return paths
+
+
+def tracked_files(root: Path) -> list[str] | None:
+    """Return files tracked by git under root, relative to root and sorted.
+
+    Files that are tracked but missing from the working tree are excluded.
+    Returns None when root isn't in a repository or the index can't be read.
+    """
+    root = root.resolve()
+    located = find_git_dir(root)
+    if located is None:
+        return None
+    top, git_dir = located
+
+    try:
+        data = (git_dir / "index").read_bytes()
+    except OSError:
+        return None
+    entries = parse_index(data, _hash_size(git_dir))
+    if entries is None:
+        return None
+
+    prefix = root.relative_to(top).as_posix()
+    prefix = "" if prefix == "." else prefix + "/"
+
+    files: list[str] = []
+    for entry in entries:
+        path = os.fsdecode(entry)
+        if not path.startswith(prefix):
+            continue
+        rel_path = path[len(prefix) :]
+        if os.path.lexists(os.path.join(root, rel_path)):
+            files.append(rel_path)
+    return sorted(files)
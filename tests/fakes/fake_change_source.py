@@ -0,0 +1,40 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Watch mode
+
+"""Fake change source for testing watch mode."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+Step = tuple[Callable[[], None] | None, set[str] | None]
+
+
+@dataclass
+class FakeChangeSource:
+    """Scripted fake for testing code that uses the ChangeSource protocol.
+
+    Each wait() runs the next step's action (e.g. writing a file), then returns
+    the step's changes. Once the script is exhausted, wait() reports no changes.
+    """
+
+    steps: list[Step] = field(default_factory=list)
+
+    # Track calls for verification
+    wait_calls: list[float] = field(default_factory=list)
+    closed: bool = False
+
+    def wait(self, timeout: float) -> set[str] | None:
+        self.wait_calls.append(timeout)
+        if not self.steps:
+            return set()
+        action, changes = self.steps.pop(0)
+        if action is not None:
+            action()
+        return changes
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def exhausted(self) -> bool:
+        return not self.steps
@@ -0,0 +1,114 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Anchor validation
+
+"""Tests for heading slugs and opt-in anchor validation."""
+
+from pathlib import Path
+
+import pytest
+
+from link_validator import anchors
+from link_validator.anchors import AnchorIndex, github_slug, heading_slugs
+from link_validator.validator import validate
+
+
+class TestGithubSlug:
+    @pytest.mark.parametrize(
+        ("text", "slug"),
+        [
+            ("Status Semantics", "status-semantics"),
+            ("Principle 2: Specs are living", "principle-2-specs-are-living"),
+            ("What's `new` in v1.2?", "whats-new-in-v12"),
+            ("snake_case and kebab-case", "snake_case-and-kebab-case"),
+            ("See [the guide](guide.md)", "see-the-guide"),
+            ("Ünïcode Héading", "ünïcode-héading"),
+            ("Cafe\u0301 Me\u0301nu", "cafe\u0301-me\u0301nu"),
+            ("  Spaced  out  ", "spaced--out"),
+        ],
+    )
+    def test_matches_github(self, text: str, slug: str) -> None:
+        assert github_slug(text) == slug
+
+
+class TestHeadingSlugs:
+    def test_atx_setext_and_duplicates(self) -> None:
+        content = (
+            "# Title\n\nIntro\n\n## Usage ##\n\nSetext\n======\n\n## Usage\n\nOther\n---\n"
+            "### Usage\n"
+        )
+
+        assert heading_slugs(content) == {"title", "usage", "setext", "usage-1", "other", "usage-2"}
+
+    def test_ignores_code_fences_frontmatter_and_hashtags(self) -> None:
+        content = (
+            "---\nstatus: working\n---\n\n#hashtag\n\n```bash\n# not a heading\n```\n\n"
+            "~~~~\n## Also not\n~~~~\n# Real\n"
+        )
+
+        assert heading_slugs(content) == {"real"}
+
+    def test_includes_html_anchors(self) -> None:
+        content = '<a name="custom-anchor"></a>\n<div id="block"></div>\n# Heading\n'
+
+        assert heading_slugs(content) == {"custom-anchor", "block", "heading"}
+
+
+class TestAnchorIndex:
+    def test_parses_each_file_once_and_only_on_demand(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "a.md").write_text("# Alpha\n")
+        (tmp_path / "b.md").write_text("# Beta\n")
+        calls: list[str] = []
+        original = anchors.heading_slugs
+
+        def counting(content: str) -> frozenset[str]:
+            calls.append(content)
+            return original(content)
+
+        monkeypatch.setattr(anchors, "heading_slugs", counting)
+        index = AnchorIndex(tmp_path)
+
+        for _ in range(100):
+            assert index.has_anchor("a.md", "alpha")
+        assert not index.has_anchor("a.md", "beta")
+        assert calls == ["# Alpha\n"]
+        assert index.files_parsed == 1
+
+    def test_fragment_is_url_decoded(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_text("# Café\n")
+
+        assert AnchorIndex(tmp_path).has_anchor("a.md", "caf%C3%A9")
+
+
+class TestAnchorValidation:
+    def _kb(self, tmp_path: Path) -> None:
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs/target.md").write_text("# Target\n\n## Known Section\n")
+
+    def test_off_by_default(self, tmp_path: Path) -> None:
+        self._kb(tmp_path)
+        (tmp_path / "docs/source.md").write_text("[x](target.md#renamed)\n[y](#nowhere)\n")
+
+        result = validate(str(tmp_path))
+
+        assert result.violations == []
+        assert result.links_checked == 1
+
+    def test_reports_missing_fragments(self, tmp_path: Path) -> None:
+        self._kb(tmp_path)
+        (tmp_path / "docs/source.md").write_text(
+            "# Source\n"
+            "[ok](target.md#known-section) [bad](target.md?raw=1#renamed)\n"
+            "[self](#source) [self-bad](#nowhere) [gone](missing.md#x) [dir](../docs/#x)\n"
+        )
+
+        result = validate(str(tmp_path), check_anchors=True)
+
+        assert [(v.target, v.rule) for v in result.violations] == [
+            ("target.md?raw=1#renamed", "broken-anchor"),
+            ("#nowhere", "broken-anchor"),
+            ("missing.md#x", "broken-link"),
+        ]
+        assert result.violations[1].resolved == "docs/source.md"
+        assert result.links_checked == 6
@@ -0,0 +1,25 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Changed paths
+
+"""Tests for the changed-path helpers shared by the tools' --changed modes."""
+
+from pathlib import Path
+
+from tool_cli.changes import normalize_changed, read_changed
+
+
+class TestChangedPaths:
+    def test_reads_one_path_per_line(self) -> None:
+        assert read_changed(["docs/a.md\n", "\n", "  specs/b.md  \n"]) == [
+            "docs/a.md",
+            "specs/b.md",
+        ]
+
+    def test_normalizes_relative_and_absolute_paths(self, tmp_path: Path) -> None:
+        assert normalize_changed(tmp_path, "docs/./sub/../a.md") == "docs/a.md"
+        assert normalize_changed(tmp_path, str(tmp_path / "docs/a.md")) == "docs/a.md"
+        assert normalize_changed(tmp_path, "docs/\n") == "docs"
+
+    def test_rejects_paths_outside_the_root(self, tmp_path: Path) -> None:
+        for path in ("", "  ", ".", "docs/..", "../other/a.md", str(tmp_path.parent / "x.md")):
+            assert normalize_changed(tmp_path, path) is None
@@ -4,10 +4,17 @@
 """Integration tests for the backlink scanner CLI."""
 
 import json
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+import pytest
+
+from backlink_scanner import __main__ as cli
+from backlink_scanner import scanner
+
 
 def _run_scanner(tmp_path: Path, *extra_args: str) -> subprocess.CompletedProcess:
     """Run the backlink scanner CLI on a temp directory."""
@@ -94,3 +101,146 @@ class TestExitCodes:
         output = json.loads(proc.stdout)
 
         assert "specs/nonexistent.md" in output["dangling"]
+
+
+class TestJobsOption:
+    def test_jobs_output_identical_to_serial(self, tmp_path: Path) -> None:
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs/auth.md").write_text("# Auth")
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("# spec: specs/auth.md\n# spec-section: Behavior/Login")
+
+        serial = _run_scanner(tmp_path, "--no-cache")
+        parallel = _run_scanner(tmp_path, "--jobs", "2", "--no-cache")
+
+        assert parallel.returncode == 0
+        assert parallel.stdout == serial.stdout
+
+    def test_jobs_accepts_inline_value(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_text("x = 1")
+
+        proc = _run_scanner(tmp_path, "--jobs=2")
+
+        assert proc.returncode == 0
+
+    def test_invalid_jobs_exits_2(self, tmp_path: Path) -> None:
+        proc = _run_scanner(tmp_path, "--jobs", "0")
+
+        assert proc.returncode == 2
+        assert "--jobs" in proc.stderr
+
+    def test_missing_jobs_value_exits_2(self, tmp_path: Path) -> None:
+        proc = _run_scanner(tmp_path, "--jobs")
+
+        assert proc.returncode == 2
+
+
+class TestCacheOptions:
+    def test_reports_cache_counters(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_text("x = 1")
+
+        proc = _run_scanner(tmp_path)
+        output = json.loads(proc.stdout)
+
+        assert output["cache"] == {"hits": 0, "misses": 1}
+        assert (tmp_path / ".cache/backlink-scanner").is_dir()
+
+    def test_no_cache_omits_counters(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_text("x = 1")
+
+        proc = _run_scanner(tmp_path, "--no-cache")
+        output = json.loads(proc.stdout)
+
+        assert "cache" not in output
+        assert not (tmp_path / ".cache").exists()
+
+    def test_cache_dir_option(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        (root / "src.py").write_text("x = 1")
+        old = time.time() - 60
+        os.utime(root / "src.py", (old, old))
+        cache_dir = tmp_path / "cache"
+
+        _run_scanner(root, "--cache-dir", str(cache_dir))
+        proc = _run_scanner(root, "--cache-dir", str(cache_dir))
+        output = json.loads(proc.stdout)
+
+        assert output["cache"] == {"hits": 1, "misses": 0}
+        assert not (root / ".cache").exists()
+
+
+class TestSkippedOutput:
+    def test_reports_skipped_counts(self, tmp_path: Path) -> None:
+        (tmp_path / "image.png").write_bytes(b"\x89PNG")
+        (tmp_path / "big.py").write_text("x = 1\n" * 100)
+
+        proc = _run_scanner(tmp_path, "--no-cache", "--max-file-size", "100")
+        output = json.loads(proc.stdout)
+
+        assert output["skipped"] == {"binary": 1, "too_large": 1}
+
+
+class TestNdjsonOutput:
+    def test_streams_one_record_per_line(self, tmp_path: Path) -> None:
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs/auth.md").write_text("# Auth")
+        (tmp_path / "specs/orphan.md").write_text("# Orphan")
+        (tmp_path / "src.py").write_text(
+            "# spec: specs/auth.md\n# spec-section: Behavior/Login\n# spec: specs/missing.md\n"
+        )
+
+        proc = _run_scanner(tmp_path, "--no-cache", "--ndjson")
+        records = [json.loads(line) for line in proc.stdout.splitlines()]
+
+        assert records == [
+            {
+                "type": "spec",
+                "spec": "specs/auth.md",
+                "implementors": ["src.py"],
+                "sections": {"Behavior/Login": ["src.py"]},
+            },
+            {
+                "type": "spec",
+                "spec": "specs/missing.md",
+                "implementors": ["src.py"],
+                "sections": {},
+            },
+            {"type": "dangling", "spec": "specs/missing.md"},
+            {"type": "orphan", "spec": "specs/orphan.md"},
+            {"type": "skipped", "binary": 0, "too_large": 0},
+        ]
+
+    def test_first_record_is_written_before_the_scan_finishes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs/auth.md").write_text("# Auth")
+        (tmp_path / "src.py").write_text("# spec: specs/auth.md\n")
+        written_before_persisting: list[str] = []
+        real_persist = scanner._persist
+
+        def persist(*args: object, **kwargs: object) -> None:
+            written_before_persisting.extend(capsys.readouterr().out.splitlines())
+            real_persist(*args, **kwargs)
+
+        monkeypatch.setattr(scanner, "_persist", persist)
+        monkeypatch.setattr(sys, "argv", ["backlink_scanner", str(tmp_path), "--ndjson"])
+
+        cli.main()
+
+        assert [json.loads(line)["type"] for line in written_before_persisting] == [
+            "spec",
+            "skipped",
+        ]
+        assert (tmp_path / ".cache").is_dir()
+
+    def test_keeps_exit_codes_and_cache_record(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_text("# spec: specs/missing.md")
+
+        proc = _run_scanner(tmp_path, "--ndjson")
+        report_only = _run_scanner(tmp_path, "--ndjson", "--report-only")
+
+        assert proc.returncode == 1
+        assert report_only.returncode == 0
+        assert json.loads(proc.stdout.splitlines()[-1])["type"] == "cache"
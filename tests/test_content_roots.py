@@ -0,0 +1,126 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Content roots
+
+"""Tests for content roots read from knowledge-base.yaml and the shared walk."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from tool_cli.content import content_roots, in_roots, parse_content_paths, walk_markdown
+
+KB_YAML = """\
+apiVersion: kb/v1
+
+paths:
+  docs: docs
+  # Exploratory writing
+  notes: "notes"
+  handbook: content/handbook/  # added later
+
+rules:
+  writes:
+    allow: ["docs/**"]
+"""
+
+
+class TestParseContentPaths:
+    def test_reads_the_paths_section(self) -> None:
+        assert parse_content_paths(KB_YAML) == {
+            "docs": "docs",
+            "notes": "notes",
+            "handbook": "content/handbook/",
+        }
+
+    def test_none_without_a_paths_section(self) -> None:
+        assert parse_content_paths("apiVersion: kb/v1\nname: x\n") is None
+
+
+class TestContentRoots:
+    def test_default_when_nothing_is_declared(self) -> None:
+        assert content_roots(None, ("docs", "notes")) == ("docs", "notes")
+
+    def test_declared_paths_with_exclusions_and_extras(self) -> None:
+        paths = parse_content_paths(KB_YAML)
+
+        roots = content_roots(paths, ("unused",), exclude={"notes"}, extra=("specs",))
+
+        assert roots == ("content/handbook", "docs", "specs")
+
+    def test_nested_and_escaping_roots_are_dropped(self) -> None:
+        paths = {"a": "docs", "b": "docs/api", "c": "../elsewhere", "d": "/abs"}
+
+        assert content_roots(paths, ()) == ("docs",)
+
+    def test_whole_tree(self) -> None:
+        assert content_roots({"all": "."}, (), extra=("specs",)) == (".",)
+
+    def test_in_roots(self) -> None:
+        roots = ("content/handbook", "docs")
+
+        assert in_roots("docs/a/b.md", roots)
+        assert in_roots("content/handbook/a.md", roots)
+        assert not in_roots("content/other.md", roots)
+        assert not in_roots("docs.md", roots)
+        assert in_roots("anything.md", (".",))
+
+
+class TestWalkMarkdown:
+    def _tree(self, root: Path) -> None:
+        for path in [
+            "docs/a.md",
+            "docs/sub/b.md",
+            "docs/node_modules/pkg/c.md",
+            "docs/image.png",
+            "content/handbook/d.md",
+            "content/other/e.md",
+            "src/f.md",
+            "top.md",
+        ]:
+            (root / path).parent.mkdir(parents=True, exist_ok=True)
+            (root / path).write_text("x\n")
+
+    def test_walks_only_the_roots(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+
+        files = walk_markdown(tmp_path, ("content/handbook", "docs", "missing"), {"node_modules"})
+
+        assert files == ["content/handbook/d.md", "docs/a.md", "docs/sub/b.md"]
+
+    def test_whole_tree(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+
+        files = walk_markdown(tmp_path, (".",), {"node_modules", "src"})
+
+        assert files == [
+            "content/handbook/d.md",
+            "content/other/e.md",
+            "docs/a.md",
+            "docs/sub/b.md",
+            "top.md",
+        ]
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        os.symlink(tmp_path / "src", tmp_path / "docs/linked")
+
+        assert "docs/linked/f.md" not in walk_markdown(tmp_path, ("docs",), ())
+
+    def test_skipped_directories_are_never_listed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._tree(tmp_path)
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def scandir(path: Path) -> Iterator[os.DirEntry[str]]:
+            listed.append(os.path.relpath(path, tmp_path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+
+        walk_markdown(tmp_path, ("docs",), {"node_modules"})
+
+        assert sorted(listed) == [".", "docs", "docs/sub"]
@@ -0,0 +1,150 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Rules
+
+"""Tests for the lazily parsed document model."""
+
+import io
+
+from kb_linter.document import (
+    BODY,
+    FRONTMATTER,
+    HEADINGS,
+    MAX_FRONTMATTER_CHARS,
+    Document,
+    Heading,
+    parse_frontmatter,
+)
+
+TEXT = """\
+---
+status: working
+owners: [daniel]
+title: "Quoted"
+nested:
+  status: ignored
+---
+
+# Title
+
+```markdown
+## Not a heading
+```
+
+Prose.
+
+## Sources ##
+   ### Indented
+#NoSpace
+"""
+
+
+class _Stream(io.StringIO):
+    """A text stream that counts the characters handed out."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self.consumed = 0
+
+    def readline(self, size: int = -1) -> str:  # type: ignore[override]
+        line = super().readline(size)
+        self.consumed += len(line)
+        return line
+
+    def read(self, size: int | None = -1) -> str:
+        text = super().read(size)
+        self.consumed += len(text)
+        return text
+
+
+class TestFrontmatter:
+    def test_top_level_fields(self) -> None:
+        document = Document("docs/a.md", io.StringIO(TEXT))
+
+        assert document.frontmatter == {
+            "status": "working",
+            "owners": "[daniel]",
+            "title": "Quoted",
+            "nested": "",
+        }
+
+    def test_missing_frontmatter(self) -> None:
+        assert Document("a.md", io.StringIO("# Title\n")).frontmatter is None
+        assert Document("a.md", io.StringIO("---\nstatus: x\n")).frontmatter is None
+        assert Document("a.md", io.StringIO("")).frontmatter is None
+
+    def test_reads_only_the_frontmatter(self) -> None:
+        stream = _Stream(TEXT)
+
+        Document("docs/a.md", stream).frontmatter  # noqa: B018
+
+        assert stream.consumed == TEXT.index("\n# Title")
+
+    def test_unterminated_frontmatter_read_is_bounded(self) -> None:
+        stream = _Stream("---\n" + "key: value\n" * MAX_FRONTMATTER_CHARS)
+
+        assert Document("a.md", stream).frontmatter is None
+        assert stream.consumed == MAX_FRONTMATTER_CHARS
+
+    def test_first_key_wins(self) -> None:
+        assert parse_frontmatter("status: a\nstatus: b\n# comment: x\n- item: y\n") == {
+            "status": "a"
+        }
+
+
+class TestHeadings:
+    def test_headings_outside_code_fences(self) -> None:
+        document = Document("docs/a.md", io.StringIO(TEXT))
+
+        assert document.headings == [
+            Heading(1, "Title", 9),
+            Heading(2, "Sources", 17),
+            Heading(3, "Indented", 18),
+        ]
+
+    def test_iteration_stops_reading(self) -> None:
+        stream = _Stream(TEXT + "more\n" * 1000)
+        document = Document("docs/a.md", stream, needs={FRONTMATTER, HEADINGS})
+
+        first = next(document.iter_headings())
+
+        assert first == Heading(1, "Title", 9)
+        assert stream.consumed == TEXT.index("\n```")
+
+    def test_headings_are_parsed_once(self) -> None:
+        stream = _Stream(TEXT)
+        document = Document("docs/a.md", stream)
+        headings = document.headings
+        consumed = stream.consumed
+
+        assert list(document.iter_headings()) == headings
+        assert stream.consumed == consumed
+
+    def test_no_frontmatter_starts_at_the_first_line(self) -> None:
+        document = Document("a.md", io.StringIO("# One\n---\n## Two"))
+
+        assert document.headings == [Heading(1, "One", 1), Heading(2, "Two", 3)]
+
+    def test_line_cut_by_the_frontmatter_limit_is_rejoined(self) -> None:
+        text = "---\n" + "x" * MAX_FRONTMATTER_CHARS + " ## Sources\n## Sources\n"
+
+        assert Document("a.md", io.StringIO(text)).headings == [Heading(2, "Sources", 3)]
+
+
+class TestBody:
+    def test_body_follows_the_frontmatter(self) -> None:
+        document = Document("a.md", io.StringIO("---\nstatus: x\n---\nbody\ntext"))
+
+        assert document.body == "body\ntext"
+
+    def test_whole_file_without_frontmatter(self) -> None:
+        assert Document("a.md", io.StringIO("a\fb\nc\n")).body == "a\fb\nc\n"
+
+    def test_body_and_headings_share_one_read(self) -> None:
+        stream = _Stream(TEXT)
+        document = Document("docs/a.md", stream, needs={HEADINGS, BODY})
+
+        next(document.iter_headings())
+
+        assert stream.consumed == len(TEXT)
+        assert document.body.startswith("\n# Title")
+        assert len(document.headings) == 3
@@ -0,0 +1,264 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/External links
+
+"""Tests for external URL checks, against a local HTTP server."""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from link_validator.external import ExternalChecker, UrlCache, check_urls, external_url
+from link_validator.validator import validate
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes: /ok, /missing (404), /no-head (405 to HEAD), /moved (301 to /ok), /slow, /lagging."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, send_body: bool) -> None:
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.requests.append((self.command, self.path))  # type: ignore[attr-defined]
+            server.ports.add(self.client_address[1])  # type: ignore[attr-defined]
+            server.in_flight += 1  # type: ignore[attr-defined]
+            server.peak = max(server.peak, server.in_flight)  # type: ignore[attr-defined]
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.05)
+            elif self.path.startswith("/lagging"):
+                time.sleep(0.1)
+            if self.path == "/missing":
+                status = 404
+            elif self.path == "/no-head" and self.command == "HEAD":
+                status = 405
+            elif self.path == "/moved":
+                status = 301
+            else:
+                status = 200
+            body = b"hello"
+            self.send_response(status)
+            if status == 301:
+                self.send_header("Location", "/ok")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+        finally:
+            with server.lock:  # type: ignore[attr-defined]
+                server.in_flight -= 1  # type: ignore[attr-defined]
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._respond(send_body=False)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond(send_body=True)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()  # type: ignore[attr-defined]
+    httpd.requests = []  # type: ignore[attr-defined]
+    httpd.ports = set()  # type: ignore[attr-defined]
+    httpd.in_flight = 0  # type: ignore[attr-defined]
+    httpd.peak = 0  # type: ignore[attr-defined]
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _base(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+class TestExternalUrl:
+    def test_http_and_https_only(self) -> None:
+        assert external_url("https://example.com/a") == "https://example.com/a"
+        assert external_url("mailto:someone@example.com") is None
+        assert external_url("docs/a.md") is None
+
+    def test_drops_fragment_and_title(self) -> None:
+        assert external_url('http://example.com/a#part "Title"') == "http://example.com/a"
+
+
+class TestExternalChecker:
+    def test_statuses(self, server: ThreadingHTTPServer) -> None:
+        base = _base(server)
+
+        results = ExternalChecker().check([f"{base}/ok", f"{base}/missing", f"{base}/moved"])
+
+        assert results[f"{base}/ok"].status == 200
+        assert results[f"{base}/missing"].status == 404
+        assert results[f"{base}/moved"].status == 200
+
+    def test_falls_back_to_get_when_head_fails(self, server: ThreadingHTTPServer) -> None:
+        url = f"{_base(server)}/no-head"
+
+        result = ExternalChecker().check([url])[url]
+
+        assert result.ok
+        assert server.requests == [("HEAD", "/no-head"), ("GET", "/no-head")]  # type: ignore[attr-defined]
+
+    def test_connection_errors_are_reported(self) -> None:
+        result = ExternalChecker(timeout=2).check(["http://127.0.0.1:9/"])["http://127.0.0.1:9/"]
+
+        assert not result.ok
+        assert result.status is None
+        assert "could not be fetched" in result.describe()
+
+    def test_reuses_keep_alive_connections(self, server: ThreadingHTTPServer) -> None:
+        checker = ExternalChecker(per_host=1)
+        urls = [f"{_base(server)}/ok?page={i}" for i in range(5)]
+
+        results = checker.check(urls)
+
+        assert all(result.ok for result in results.values())
+        assert checker.connections_opened == 1
+        assert len(server.ports) == 1  # type: ignore[attr-defined]
+
+    def test_per_host_limit(self, server: ThreadingHTTPServer) -> None:
+        urls = [f"{_base(server)}/slow?page={i}" for i in range(8)]
+
+        ExternalChecker(concurrency=8, per_host=2).check(urls)
+
+        assert server.peak <= 2  # type: ignore[attr-defined]
+
+    def test_global_limit(self, server: ThreadingHTTPServer) -> None:
+        urls = [f"{_base(server)}/slow?page={i}" for i in range(6)]
+
+        ExternalChecker(concurrency=1, per_host=4).check(urls)
+
+        assert server.peak == 1  # type: ignore[attr-defined]
+
+    def test_waiting_for_a_host_slot_does_not_count_against_the_timeout(
+        self, server: ThreadingHTTPServer
+    ) -> None:
+        # 12 requests of 0.1s, 2 at a time, take 0.6s; each URL gets 0.35s
+        urls = [f"{_base(server)}/lagging?page={i}" for i in range(12)]
+
+        results = ExternalChecker(per_host=2, timeout=0.35).check(urls)
+
+        assert [result.error for result in results.values()] == [None] * 12
+        assert all(result.ok for result in results.values())
+
+    def test_busy_host_does_not_starve_others(self, server: ThreadingHTTPServer) -> None:
+        busy = [f"{_base(server)}/lagging?page={i}" for i in range(4)]
+        other = f"http://localhost:{server.server_port}/ok?other"
+
+        ExternalChecker(concurrency=2, per_host=1).check([*busy, other])
+
+        # The busy host's queued URLs don't hold the second global slot
+        assert ("HEAD", "/ok?other") in server.requests[:2]  # type: ignore[attr-defined]
+
+
+class TestResultCache:
+    def test_fresh_results_skip_the_network(
+        self, server: ThreadingHTTPServer, tmp_path: Path
+    ) -> None:
+        urls = [f"{_base(server)}/ok", f"{_base(server)}/missing"]
+        check_urls(urls, tmp_path, tmp_path)
+        server.requests.clear()  # type: ignore[attr-defined]
+
+        results = check_urls(urls, tmp_path, tmp_path)
+
+        assert server.requests == []  # type: ignore[attr-defined]
+        assert all(result.cached for result in results.values())
+        assert results[urls[1]].status == 404
+
+    def test_expired_results_are_fetched_again(
+        self, server: ThreadingHTTPServer, tmp_path: Path
+    ) -> None:
+        url = f"{_base(server)}/ok"
+        check_urls([url], tmp_path, tmp_path)
+        cache = UrlCache.load(tmp_path, tmp_path)
+        cache.entries[url] = (time.time() - 120, 200)
+        cache.save(tmp_path, tmp_path)
+        server.requests.clear()  # type: ignore[attr-defined]
+
+        results = check_urls([url], tmp_path, tmp_path, ttl=60)
+
+        assert not results[url].cached
+        assert server.requests == [("HEAD", "/ok")]  # type: ignore[attr-defined]
+
+    def test_connection_errors_are_not_cached(self, tmp_path: Path) -> None:
+        url = "http://127.0.0.1:9/"
+
+        check_urls([url], tmp_path, tmp_path, checker=ExternalChecker(timeout=2))
+
+        assert UrlCache.load(tmp_path, tmp_path).entries == {}
+
+
+class TestValidateExternal:
+    def _kb(self, root: Path, base: str) -> None:
+        (root / "docs").mkdir()
+        (root / "docs/a.md").write_text(
+            f"[ok]({base}/ok) [gone]({base}/missing#x) [gone again]({base}/missing)\n"
+        )
+        (root / "docs/b.md").write_text(f"[ok]({base}/ok) [mail](mailto:x@example.com)\n")
+
+    def test_reports_each_broken_occurrence(
+        self, server: ThreadingHTTPServer, tmp_path: Path
+    ) -> None:
+        base = _base(server)
+        self._kb(tmp_path, base)
+
+        result = validate(str(tmp_path), check_external=True)
+
+        assert [(v.file, v.target, v.rule) for v in result.violations] == [
+            ("docs/a.md", f"{base}/missing#x", "broken-external"),
+            ("docs/a.md", f"{base}/missing", "broken-external"),
+        ]
+        assert result.violations[0].resolved == f"{base}/missing"
+        assert result.violations[0].message == "External URL returned HTTP 404"
+        assert result.external_urls == 2
+
+    def test_off_by_default(self, server: ThreadingHTTPServer, tmp_path: Path) -> None:
+        self._kb(tmp_path, _base(server))
+
+        result = validate(str(tmp_path))
+
+        assert result.violations == []
+        assert result.external_urls is None
+        assert server.requests == []  # type: ignore[attr-defined]
+
+    def test_cli_caches_between_runs(self, server: ThreadingHTTPServer, tmp_path: Path) -> None:
+        self._kb(tmp_path, _base(server))
+        cmd = [sys.executable, "-m", "link_validator", str(tmp_path), "--external"]
+
+        first = subprocess.run(cmd, capture_output=True, text=True)
+        second = subprocess.run(cmd, capture_output=True, text=True)
+
+        assert first.returncode == 1
+        summary = json.loads(second.stdout)["summary"]
+        assert summary["external_urls"] == 2
+        assert summary["external_cache_hits"] == 2
+
+    def test_cli_ttl_takes_fractional_seconds(
+        self, server: ThreadingHTTPServer, tmp_path: Path
+    ) -> None:
+        self._kb(tmp_path, _base(server))
+        cmd = [sys.executable, "-m", "link_validator", str(tmp_path), "--external"]
+
+        subprocess.run(cmd, capture_output=True, text=True)
+        time.sleep(0.6)
+        expired = subprocess.run([*cmd, "--external-ttl", "0.5"], capture_output=True, text=True)
+        invalid = subprocess.run([*cmd, "--external-ttl", "0"], capture_output=True, text=True)
+
+        assert json.loads(expired.stdout)["summary"]["external_cache_hits"] == 0
+        assert invalid.returncode == 2
@@ -0,0 +1,142 @@
+# spec: specs/tool-cli.md
+# spec-section: Behavior/Git index enumeration
+
+"""Tests for reading tracked files from .git/index."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from backlink_scanner.scanner import scan
+from kb_linter.linter import lint
+from link_validator.validator import validate
+from tool_cli.git_index import parse_index, tracked_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _init_repo(root: Path) -> None:
+    _git(root, "init", "-q")
+    (root / "src").mkdir()
+    (root / "src/app.py").write_text("# spec: specs/app.md\n")
+    (root / "specs").mkdir()
+    (root / "specs/app.md").write_text("# App\n")
+    (root / "README.md").write_text("# Readme\n")
+    _git(root, "add", ".")
+
+
+class TestTrackedFiles:
+    def test_lists_tracked_files_sorted(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+
+        assert tracked_files(tmp_path) == ["README.md", "specs/app.md", "src/app.py"]
+
+    def test_excludes_untracked_files(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build/out.py").write_text("# spec: specs/app.md\n")
+
+        files = tracked_files(tmp_path)
+
+        assert files is not None
+        assert "build/out.py" not in files
+
+    def test_excludes_tracked_files_deleted_from_worktree(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "README.md").unlink()
+
+        assert tracked_files(tmp_path) == ["specs/app.md", "src/app.py"]
+
+    def test_paths_relative_to_subdirectory_root(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+
+        assert tracked_files(tmp_path / "src") == ["app.py"]
+
+    def test_reads_index_version_4(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "src/app_helpers.py").write_text("x = 1\n")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "update-index", "--index-version", "4")
+
+        assert tracked_files(tmp_path) == [
+            "README.md",
+            "specs/app.md",
+            "src/app.py",
+            "src/app_helpers.py",
+        ]
+
+    def test_returns_none_outside_repository(self, tmp_path: Path) -> None:
+        (tmp_path / "file.md").write_text("x")
+
+        assert tracked_files(tmp_path) is None
+
+    def test_rejects_malformed_index(self) -> None:
+        assert parse_index(b"not an index") is None
+        assert parse_index(b"DIRC\x00\x00\x00\x02\x00\x00\x00\x05") is None
+
+
+class TestToolsUseGitIndex:
+    def test_scanner_ignores_untracked_files(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build/gen.py").write_text("# spec: specs/missing.md\n")
+
+        walked = scan(str(tmp_path))
+        indexed = scan(str(tmp_path), use_git_index=True)
+
+        assert walked.dangling == ["specs/missing.md"]
+        assert indexed.dangling == []
+        assert indexed.specs["specs/app.md"].implementors == ["src/app.py"]
+
+    def test_scanner_falls_back_outside_repository(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_text("# spec: specs/missing.md\n")
+
+        result = scan(str(tmp_path), use_git_index=True)
+
+        assert result.dangling == ["specs/missing.md"]
+
+    def test_validator_and_linter_use_tracked_content(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "knowledge-base.yaml").write_text('statuses: ["working"]\n')
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs/tracked.md").write_text("---\nstatus: working\n---\n[a](ok.md)\n")
+        (tmp_path / "docs/ok.md").write_text("---\nstatus: working\n---\n")
+        _git(tmp_path, "add", ".")
+        (tmp_path / "docs/untracked.md").write_text("[b](missing.md)\n")
+
+        validated = validate(str(tmp_path), use_git_index=True)
+        linted = lint(str(tmp_path), use_git_index=True)
+
+        assert validated.files_checked == 3
+        assert validated.violations == []
+        assert linted.files_checked == 2
+        assert linted.violations == []
+
+    def test_validator_path_index_comes_from_tracked_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs/tracked.md").write_text("[a](../src/app.py) [r](../README.md)\n")
+        _git(tmp_path, "add", ".")
+        (tmp_path / "vendor/pkg").mkdir(parents=True)
+        scandirs: list[str] = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scandirs.append(path) or real_scandir(path))
+
+        result = validate(str(tmp_path), use_git_index=True)
+
+        assert result.violations == []
+        assert scandirs == []
@@ -0,0 +1,87 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Provenance validation
+
+"""Tests for the compiled provenance glob matcher."""
+
+import re
+
+import pytest
+
+from kb_linter.globs import GlobMatcher, translate
+
+
+def _matches(pattern: str, path: str) -> bool:
+    return GlobMatcher([pattern]).matches(path)
+
+
+class TestGlobSyntax:
+    @pytest.mark.parametrize(
+        ("pattern", "path", "expected"),
+        [
+            ("docs/**", "docs/a.md", True),
+            ("docs/**", "docs/a/b/c.md", True),
+            ("docs/**", "docs", True),
+            ("docs/**", "docsx/a.md", False),
+            ("docs/guide.md", "docs/guide.md", True),
+            ("docs/guide.md", "docs/guide.md/x", False),
+            ("docs/*.md", "docs/a.md", True),
+            ("docs/*.md", "docs/sub/a.md", False),
+            ("docs/*", "docs", False),
+            ("docs/?.md", "docs/a.md", True),
+            ("docs/?.md", "docs/ab.md", False),
+            ("docs/**/README.md", "docs/README.md", True),
+            ("docs/**/README.md", "docs/a/b/README.md", True),
+            ("docs/**/README.md", "docs/a/README.mdx", False),
+            ("**/README.md", "README.md", True),
+            ("**/README.md", "docs/a/README.md", True),
+            ("**", "anything/at/all.md", True),
+            ("{docs,policies}/**", "policies/a.md", True),
+            ("{docs,policies}/**", "notes/a.md", False),
+            ("docs/{guides,area/*}/x.md", "docs/area/sub/x.md", True),
+            ("docs/{guides,area/*}/x.md", "docs/area/x.md", False),
+            ("docs/*-{a,b{1,2}}.md", "docs/n-b2.md", True),
+            ("docs/*-{a,b{1,2}}.md", "docs/n-b3.md", False),
+            ("docs/{oops.md", "docs/{oops.md", True),
+            ("docs/a+b.md", "docs/a+b.md", True),
+            ("./docs/**", "docs/a.md", True),
+        ],
+    )
+    def test_matches(self, pattern: str, path: str, expected: bool) -> None:
+        assert _matches(pattern, path) is expected
+
+    def test_translate(self) -> None:
+        assert re.fullmatch(translate(["a", "**", "*.md"]), "a/x/y/z.md")
+        assert translate(["**"]) == ".*"
+
+
+class TestGlobMatcher:
+    def test_any_pattern_matches(self) -> None:
+        matcher = GlobMatcher(["docs/**", "policies/*.md", "**/CANONICAL.md"])
+
+        assert matcher.matches("docs/a/b.md")
+        assert matcher.matches("policies/p.md")
+        assert matcher.matches("notes/deep/CANONICAL.md")
+        assert not matcher.matches("policies/sub/p.md")
+        assert not matcher.matches("notes/a.md")
+
+    def test_patterns_sharing_a_prefix(self) -> None:
+        matcher = GlobMatcher(["docs/a/*.md", "docs/b/**", "docs/index.md"])
+
+        assert matcher.matches("docs/a/x.md")
+        assert matcher.matches("docs/b/y/z.md")
+        assert matcher.matches("docs/index.md")
+        assert not matcher.matches("docs/c/x.md")
+        assert not matcher.matches("docs")
+
+    def test_many_patterns(self) -> None:
+        matcher = GlobMatcher([f"kb{i}/docs/**" for i in range(500)] + ["kb*/extra/*.md"])
+
+        assert matcher.matches("kb499/docs/a.md")
+        assert matcher.matches("kb7/extra/a.md")
+        assert not matcher.matches("kb500/docs/a.md")
+
+    def test_no_patterns(self) -> None:
+        matcher = GlobMatcher([])
+
+        assert not matcher
+        assert not matcher.matches("docs/a.md")
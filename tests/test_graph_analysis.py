@@ -0,0 +1,147 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Graph mode
+
+"""Tests for link graph export, reachability, and strongly connected components."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from link_validator.analysis import analyze, reachable_from, strongly_connected_components
+from tool_cli import UsageError
+
+
+def _make_kb(root: Path, human: str = "docs/README.md") -> None:
+    (root / "docs/guides").mkdir(parents=True)
+    (root / "notes").mkdir()
+    (root / "knowledge-base.yaml").write_text(
+        f"apiVersion: kb/v1\nentrypoints:\n  human: {human}\n  agent: CLAUDE.md\n"
+    )
+    (root / "docs/README.md").write_text("[guides](guides/) [self](#top) [ext](https://x.org)\n")
+    (root / "docs/guides/README.md").write_text("[a](a.md)\n")
+    (root / "docs/guides/a.md").write_text("[b](b.md) [index](README.md) [a again](a.md)\n")
+    (root / "docs/guides/b.md").write_text("[a](a.md) [missing](gone.md)\n")
+    (root / "notes/orphan.md").write_text("[home](../docs/README.md)\n")
+
+
+class TestGraphAlgorithms:
+    def test_reachable_from(self) -> None:
+        adjacency = [[1], [2], [], [0]]
+
+        assert reachable_from(adjacency, [0]) == [True, True, True, False]
+
+    def test_components(self) -> None:
+        adjacency = [[1], [2], [0, 3], [4], [3], []]
+
+        components = sorted(sorted(c) for c in strongly_connected_components(adjacency))
+
+        assert components == [[0, 1, 2], [3, 4], [5]]
+
+    def test_deep_chain_does_not_recurse(self) -> None:
+        count = 200_000
+        adjacency = [[node + 1] for node in range(count - 1)] + [[0]]
+
+        assert all(reachable_from(adjacency, [count - 1]))
+        assert [len(c) for c in strongly_connected_components(adjacency)] == [count]
+
+
+class TestAnalyze:
+    def test_edge_list_is_integer_indexed(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        report = analyze(str(tmp_path))
+
+        assert report.nodes == [
+            "docs/README.md",
+            "docs/guides/README.md",
+            "docs/guides/a.md",
+            "docs/guides/b.md",
+            "notes/orphan.md",
+        ]
+        # Directory links land on README.md; self, external, and broken links add no edge
+        assert report.edges == [(0, 1), (1, 2), (2, 1), (2, 3), (3, 2), (4, 0)]
+        assert report.entrypoints == [0]
+        assert report.in_degree == [1, 2, 2, 1, 0]
+        assert report.out_degree == [1, 1, 2, 1, 1]
+
+    def test_unreachable_and_components(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        report = analyze(str(tmp_path))
+
+        assert report.unreachable == ["notes/orphan.md"]
+        assert report.components == [[1, 2, 3]]
+
+    def test_explicit_entrypoint(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        report = analyze(str(tmp_path), entrypoint="notes/orphan.md")
+
+        assert report.unreachable == []
+
+    def test_entrypoint_outside_content_dirs_is_a_node(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path, human="GUIDE.md")
+        (tmp_path / "GUIDE.md").write_text("[docs](docs/README.md)\n")
+
+        report = analyze(str(tmp_path))
+
+        assert report.nodes[report.entrypoints[0]] == "GUIDE.md"
+        assert report.unreachable == ["notes/orphan.md"]
+
+    def test_entrypoint_outside_root_raises(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        with pytest.raises(UsageError, match="outside the root"):
+            analyze(str(tmp_path), entrypoint="docs/../../outside.md")
+
+    def test_missing_entrypoint_raises(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path, human="docs/nope.md")
+
+        with pytest.raises(FileNotFoundError, match="docs/nope.md"):
+            analyze(str(tmp_path))
+
+
+class TestGraphCli:
+    def _run(self, root: Path, *args: str) -> subprocess.CompletedProcess:
+        cmd = [sys.executable, "-m", "link_validator", "graph", str(root), *args]
+        return subprocess.run(cmd, capture_output=True, text=True)
+
+    def test_outputs_compact_graph(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        proc = self._run(tmp_path)
+
+        assert proc.returncode == 0
+        data = json.loads(proc.stdout)
+        assert data["edges"][0] == [0, 1]
+        assert data["summary"] == {"nodes": 5, "edges": 6, "unreachable": 1, "components": 1}
+
+    def test_report_only_exits_0(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        assert self._run(tmp_path, "--report-only").returncode == 0
+
+    def test_entrypoint_outside_root_exits_2(self, tmp_path: Path) -> None:
+        root = tmp_path / "kb"
+        root.mkdir()
+        _make_kb(root)
+        (tmp_path / "outside.md").write_text("# Outside\n")
+
+        proc = self._run(root, "--entrypoint", "../outside.md")
+
+        assert proc.returncode == 2
+        assert "outside the root" in proc.stderr
+
+    def test_all_reachable_exits_0(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        assert self._run(tmp_path, "--entrypoint", "notes/orphan.md").returncode == 0
+
+    def test_without_knowledge_base_exits_2(self, tmp_path: Path) -> None:
+        proc = self._run(tmp_path)
+
+        assert proc.returncode == 2
+        assert "knowledge-base.yaml" in proc.stderr
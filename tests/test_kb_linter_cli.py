@@ -98,6 +98,24 @@ class TestExitCodes:
 
         assert proc.returncode == 2
 
+    def test_jobs_output_matches_serial(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        for i in range(12):
+            (tmp_path / f"docs/f{i:02d}.md").write_text(f"---\nstatus: s{i % 2}\n---\n")
+
+        serial = _run_linter(tmp_path, "--no-cache")
+        parallel = _run_linter(tmp_path, "--no-cache", "--jobs", "3")
+
+        assert parallel.returncode == serial.returncode == 1
+        assert parallel.stdout == serial.stdout
+
+    def test_invalid_jobs_exits_2(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+
+        proc = _run_linter(tmp_path, "--jobs", "0")
+
+        assert proc.returncode == 2
+
     def test_report_only_still_produces_output(self, tmp_path: Path) -> None:
         _setup_kb(tmp_path)
         (tmp_path / "docs/bad.md").write_text("# No frontmatter\n")
@@ -44,6 +44,15 @@ class TestCLIOutput:
         assert output["summary"]["links_checked"] == 2
         assert output["summary"]["broken"] == 1
 
+    def test_summary_counts_repeated_resolutions(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/a.md").write_text("[x](shared.md) [y](shared.md) [z](../specs/z.md)\n")
+        (tmp_path / "docs/b.md").write_text("[x](shared.md)\n")
+
+        proc = _run_validator(tmp_path, "--report-only", "--no-cache")
+
+        assert json.loads(proc.stdout)["summary"]["resolve_cache_hits"] == 2
+
 
 class TestExitCodes:
     def test_exit_0_when_no_broken_links(self, tmp_path: Path) -> None:
@@ -77,3 +86,25 @@ class TestExitCodes:
         proc = _run_validator(tmp_path)
 
         assert proc.returncode == 0
+
+
+class TestJobsOption:
+    def test_jobs_output_matches_serial(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        for i in range(12):
+            (tmp_path / f"docs/page{i:02d}.md").write_text(
+                f"[next](page{i + 1:02d}.md) [gone](missing{i % 3}.md)\n"
+            )
+
+        serial = _run_validator(tmp_path)
+        parallel = _run_validator(tmp_path, "--jobs", "3")
+
+        assert parallel.returncode == serial.returncode == 1
+        assert json.loads(parallel.stdout) == json.loads(serial.stdout)
+
+    def test_invalid_jobs_exits_2(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+
+        proc = _run_validator(tmp_path, "--jobs", "0")
+
+        assert proc.returncode == 2
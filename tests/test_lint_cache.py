@@ -0,0 +1,207 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Result cache
+
+"""Tests for the content-hash-keyed lint result cache."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from kb_linter import cache as cache_module
+from kb_linter.cache import LintCache, lint_cache_file
+from kb_linter.linter import lint, parse_config
+
+KB_YAML = """\
+rules:
+  lifecycle:
+    statuses: ["draft", "working"]
+
+sources:
+  canonical:
+    - path: docs/**
+"""
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a file's mtime so its stat key isn't considered racy."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _make_kb(root: Path) -> None:
+    (root / "knowledge-base.yaml").write_text(KB_YAML)
+    (root / "docs").mkdir()
+    (root / "docs/good.md").write_text("---\nstatus: working\n---\n\n## Sources\n- x\n")
+    (root / "docs/bad.md").write_text("---\nstatus: bogus\n---\n")
+    (root / "docs/none.md").write_text("# No frontmatter\n")
+    for path in root.rglob("*.md"):
+        _age(path)
+
+
+def _cache_path(cache_dir: Path, root: Path) -> Path:
+    return lint_cache_file(cache_dir, parse_config(root).rules_key())
+
+
+@pytest.fixture
+def kb(tmp_path: Path) -> tuple[Path, Path]:
+    root = tmp_path / "kb"
+    root.mkdir()
+    _make_kb(root)
+    return root, tmp_path / "cache"
+
+
+class TestLintCache:
+    def test_cold_run_misses_every_file(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+
+        result = lint(str(root), cache_dir=str(cache_dir))
+
+        assert (result.cache_hits, result.cache_misses) == (0, 3)
+
+    def test_warm_run_hits_every_file(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+
+        cold = lint(str(root), cache_dir=str(cache_dir))
+        warm = lint(str(root), cache_dir=str(cache_dir))
+
+        assert (warm.cache_hits, warm.cache_misses) == (3, 0)
+        assert warm == cold == lint(str(root))
+
+    def test_changed_content_is_rechecked(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        lint(str(root), cache_dir=str(cache_dir))
+
+        (root / "docs/bad.md").write_text("---\nstatus: draft\n---\n\n## Sources\n")
+        result = lint(str(root), cache_dir=str(cache_dir))
+
+        assert (result.cache_hits, result.cache_misses) == (2, 1)
+        assert [v.file for v in result.violations] == ["docs/none.md", "docs/none.md"]
+
+    def test_fresh_checkout_hits_by_content(self, kb: tuple[Path, Path], tmp_path: Path) -> None:
+        root, cache_dir = kb
+        lint(str(root), cache_dir=str(cache_dir))
+        # A copy has new inodes and mtimes; same root path, same content
+        shutil.move(root, tmp_path / "moved")
+        shutil.copytree(tmp_path / "moved", root)
+
+        result = lint(str(root), cache_dir=str(cache_dir))
+
+        assert (result.cache_hits, result.cache_misses) == (3, 0)
+
+    def test_copies_at_other_paths_share_the_cache(
+        self, kb: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        root, cache_dir = kb
+        first = lint(str(root), cache_dir=str(cache_dir))
+        # Another workspace: same tree, different absolute path
+        copy = tmp_path / "elsewhere" / "checkout"
+        shutil.copytree(root, copy)
+
+        second = lint(str(copy), cache_dir=str(cache_dir))
+
+        assert (second.cache_hits, second.cache_misses) == (3, 0)
+        assert second == first
+        assert [path.name for path in cache_dir.iterdir()] == [_cache_path(cache_dir, root).name]
+
+    def test_unchanged_stat_skips_hashing(
+        self, kb: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root, cache_dir = kb
+        lint(str(root), cache_dir=str(cache_dir))
+        hashed: list[Path] = []
+        real_digest = cache_module.content_digest
+        monkeypatch.setattr(
+            cache_module, "content_digest", lambda path: hashed.append(path) or real_digest(path)
+        )
+
+        result = lint(str(root), cache_dir=str(cache_dir))
+
+        assert result.cache_hits == 3
+        assert hashed == []
+
+    def test_rule_changes_invalidate_the_cache(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        lint(str(root), cache_dir=str(cache_dir))
+
+        (root / "knowledge-base.yaml").write_text(
+            KB_YAML.replace('"working"]', '"working", "bogus"]')
+        )
+        result = lint(str(root), cache_dir=str(cache_dir))
+
+        assert (result.cache_hits, result.cache_misses) == (0, 3)
+        assert [v.rule for v in result.violations] == [
+            "missing-provenance",
+            "missing-frontmatter",
+            "missing-provenance",
+        ]
+
+    def test_deleted_files_are_dropped(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        lint(str(root), cache_dir=str(cache_dir))
+
+        (root / "docs/bad.md").unlink()
+        lint(str(root), cache_dir=str(cache_dir))
+
+        data = json.loads(_cache_path(cache_dir, root).read_text())
+        assert sorted(data["entries"]) == ["docs/good.md", "docs/none.md"]
+
+    def test_corrupt_cache_is_treated_as_empty(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        cache_dir.mkdir()
+        _cache_path(cache_dir, root).write_text("{not json")
+
+        result = lint(str(root), cache_dir=str(cache_dir))
+
+        assert result.cache_misses == 3
+        assert result == lint(str(root))
+
+    def test_jobs_with_cache(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        lint(str(root), cache_dir=str(cache_dir))
+        (root / "docs/none.md").write_text("---\nstatus: draft\n---\n")
+
+        result = lint(str(root), cache_dir=str(cache_dir), jobs=2)
+
+        assert result == lint(str(root))
+        assert (result.cache_hits, result.cache_misses) == (2, 1)
+
+    def test_racy_stat_keys_are_not_stored(self, tmp_path: Path) -> None:
+        (tmp_path / "fresh.md").write_text("x\n")
+        cache = LintCache(tmp_path / "cache", "rules")
+        key = (3, time.time_ns(), 1)
+
+        cache.put("fresh.md", key, "digest", [])
+
+        assert cache._entries["fresh.md"] == ["digest", None, []]
+
+
+class TestCacheCLI:
+    def test_summary_reports_hits_and_misses(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        cmd = [sys.executable, "-m", "kb_linter", str(root), "--cache-dir", str(cache_dir)]
+
+        subprocess.run(cmd, capture_output=True, text=True)
+        second = subprocess.run(cmd, capture_output=True, text=True)
+        uncached = subprocess.run(
+            [sys.executable, "-m", "kb_linter", str(root), "--no-cache"],
+            capture_output=True,
+            text=True,
+        )
+
+        summary = json.loads(second.stdout)["summary"]
+        assert (summary["cache_hits"], summary["cache_misses"]) == (3, 0)
+        assert "cache_hits" not in json.loads(uncached.stdout)["summary"]
+        assert not (root / ".cache").exists()
+
+    def test_default_cache_lives_under_the_root(self, kb: tuple[Path, Path]) -> None:
+        root, _cache_dir = kb
+
+        subprocess.run([sys.executable, "-m", "kb_linter", str(root)], capture_output=True)
+
+        assert _cache_path(root / ".cache/kb-linter", root).is_file()
@@ -4,7 +4,14 @@
 
 from pathlib import Path
 
-from kb_linter.linter import lint, parse_config
+from kb_linter.linter import (
+    MAX_FRONTMATTER_CHARS,
+    _check_file,
+    _check_in_worker,
+    _init_worker,
+    lint,
+    parse_config,
+)
 
 KB_YAML = """\
 apiVersion: kb/v1
@@ -189,6 +196,21 @@ class TestProvenanceValidation:
         rules = [v.rule for v in result.violations if v.file == "docs/sub/nested.md"]
         assert "missing-provenance" in rules
 
+    def test_glob_patterns(self, tmp_path: Path) -> None:
+        kb_yaml = KB_YAML.replace("path: docs/**", 'path: "docs/{guides,areas/*}/*.md"')
+        _setup_kb(tmp_path, kb_yaml)
+        body = "---\nstatus: working\n---\n\n# Guide\n"
+        for file in ["docs/guides/a.md", "docs/areas/x/b.md", "docs/areas/c.md", "docs/d.md"]:
+            (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / file).write_text(body)
+
+        result = lint(str(tmp_path))
+
+        assert [v.file for v in result.violations if v.rule == "missing-provenance"] == [
+            "docs/areas/x/b.md",
+            "docs/guides/a.md",
+        ]
+
 
 class TestScannedPaths:
     def test_does_not_scan_notes(self, tmp_path: Path) -> None:
@@ -223,6 +245,19 @@ class TestScannedPaths:
 
         assert result.files_checked == 3
 
+    def test_scans_declared_paths(self, tmp_path: Path) -> None:
+        kb_yaml = KB_YAML + "\npaths:\n  docs: docs\n  notes: notes\n  handbook: handbook\n"
+        _setup_kb(tmp_path, kb_yaml)
+        (tmp_path / "handbook").mkdir()
+        (tmp_path / "handbook/a.md").write_text("# No frontmatter")
+        (tmp_path / "policies/b.md").write_text("# Not declared")
+        (tmp_path / "notes").mkdir()
+        (tmp_path / "notes/c.md").write_text("# Notes stay unlinted")
+
+        result = lint(str(tmp_path))
+
+        assert [v.file for v in result.violations] == ["handbook/a.md"]
+
     def test_handles_missing_content_dirs(self, tmp_path: Path) -> None:
         (tmp_path / "knowledge-base.yaml").write_text(KB_YAML)
         # No docs/, policies/, playbooks/ directories
@@ -233,6 +268,96 @@ class TestScannedPaths:
         assert result.violations == []
 
 
+class TestParallelLinting:
+    def test_jobs_matches_serial_result(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/sub").mkdir()
+        for i in range(30):
+            folder = ("docs", "docs/sub", "policies", "playbooks")[i % 4]
+            status = ("working", "bogus", "")[i % 3]
+            sources = "## Sources\n" if i % 5 == 0 else ""
+            (tmp_path / f"{folder}/f{i:02d}.md").write_text(
+                f"---\nstatus: {status}\n---\n\n# F\n{sources}"
+            )
+
+        serial = lint(str(tmp_path))
+        parallel = lint(str(tmp_path), jobs=4)
+
+        assert parallel == serial
+        assert parallel.files_checked == 30
+        assert [v.file for v in parallel.violations] == sorted(v.file for v in serial.violations)
+
+    def test_workers_share_the_config_set_at_startup(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/a.md").write_text("# No frontmatter\n")
+        config = parse_config(tmp_path)
+
+        _init_worker(tmp_path, config)
+
+        assert _check_in_worker("docs/a.md") == _check_file(tmp_path, "docs/a.md", config)
+
+
+class TestBoundedReads:
+    # Undecodable bytes far past what the checks need are never read (a file
+    # that hit them would be skipped, losing its invalid-status violation)
+    PADDING = b"text\n" * 100_000 + b"\xff\xfe"
+
+    def test_stops_reading_at_the_closing_fence(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "playbooks/a.md").write_bytes(b"---\nstatus: bogus\n---\n" + self.PADDING)
+
+        result = lint(str(tmp_path))
+
+        assert [v.rule for v in result.violations] == ["invalid-status"]
+
+    def test_stops_reading_at_the_sources_heading(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/a.md").write_bytes(
+            b"---\nstatus: bogus\n---\n\n## Sources\n- x\n" + self.PADDING
+        )
+
+        result = lint(str(tmp_path))
+
+        assert [v.rule for v in result.violations] == ["invalid-status"]
+
+    def test_unterminated_frontmatter_is_missing(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        filler = "key: value\n" * (MAX_FRONTMATTER_CHARS // 5)
+        (tmp_path / "playbooks/a.md").write_text(f"---\nstatus: working\n{filler}")
+
+        result = lint(str(tmp_path))
+
+        assert [v.rule for v in result.violations] == ["missing-frontmatter"]
+
+    def test_oversized_frontmatter_is_missing(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        filler = "x" * MAX_FRONTMATTER_CHARS
+        (tmp_path / "playbooks/a.md").write_text(f"---\nstatus: working\nnote: {filler}\n---\n")
+
+        result = lint(str(tmp_path))
+
+        assert [v.rule for v in result.violations] == ["missing-frontmatter"]
+
+    def test_sources_heading_after_a_cut_line_is_found(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        filler = "x" * MAX_FRONTMATTER_CHARS
+        (tmp_path / "docs/a.md").write_text(f"---\n{filler} ## Sources\n## Sources\n")
+
+        result = lint(str(tmp_path))
+
+        assert [v.rule for v in result.violations] == ["missing-frontmatter"]
+
+    def test_sources_heading_inside_a_cut_line_does_not_count(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        # The frontmatter read stops right before "## Sources", mid-line
+        filler = "x" * (MAX_FRONTMATTER_CHARS - 4)
+        (tmp_path / "docs/a.md").write_text(f"---\n{filler}## Sources\n")
+
+        result = lint(str(tmp_path))
+
+        assert [v.rule for v in result.violations] == ["missing-frontmatter", "missing-provenance"]
+
+
 class TestEdgeCases:
     def test_skips_non_markdown_files(self, tmp_path: Path) -> None:
         _setup_kb(tmp_path)
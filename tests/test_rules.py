@@ -0,0 +1,91 @@
+# spec: specs/kb-linter.md
+# spec-section: Behavior/Rules
+
+"""Tests for the lint rule registry."""
+
+import io
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from kb_linter import rules
+from kb_linter.document import BODY, FRONTMATTER, HEADINGS, Document
+from kb_linter.linter import LintConfig, lint
+from kb_linter.rules import RULES, Rule, needed_parts, rule
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> list[Rule]:
+    """A copy of the registry that tests can add rules to."""
+    registered = list(RULES)
+    monkeypatch.setattr(rules, "RULES", registered)
+    monkeypatch.setattr("kb_linter.linter.RULES", registered)
+    return registered
+
+
+def _kb(root: Path) -> None:
+    (root / "knowledge-base.yaml").write_text('statuses: ["working"]\n')
+    (root / "docs").mkdir()
+    (root / "docs/a.md").write_text("---\nstatus: working\n---\n# One\n## Two\n")
+
+
+class TestRegistry:
+    def test_builtin_rules(self) -> None:
+        assert [(r.name, r.needs) for r in RULES] == [
+            ("status", frozenset({FRONTMATTER})),
+            ("provenance", frozenset({HEADINGS})),
+        ]
+        assert needed_parts(RULES) == {FRONTMATTER, HEADINGS}
+
+    def test_registered_rules_run(self, registry: list[Rule], tmp_path: Path) -> None:
+        _kb(tmp_path)
+
+        @rule("single-title", needs={HEADINGS})
+        def single_title(document: Document, config: LintConfig) -> Iterator[tuple[str, str]]:
+            titles = [h for h in document.iter_headings() if h.level == 1]
+            if len(titles) != 1:
+                yield "title-count", f"{len(titles)} level-1 headings"
+
+        @rule("owners", needs={FRONTMATTER})
+        def owners(document: Document, config: LintConfig) -> Iterator[tuple[str, str]]:
+            if document.frontmatter is not None and "owners" not in document.frontmatter:
+                yield "missing-owners", "No owners field in frontmatter"
+
+        result = lint(str(tmp_path))
+
+        assert [(v.file, v.rule) for v in result.violations] == [("docs/a.md", "missing-owners")]
+
+    def test_rules_share_one_parse(self, registry: list[Rule]) -> None:
+        seen: list[object] = []
+
+        @rule("first", needs={HEADINGS})
+        def first(document: Document, config: LintConfig) -> Iterator[tuple[str, str]]:
+            seen.append(document.headings)
+            yield from ()
+
+        @rule("second", needs={HEADINGS})
+        def second(document: Document, config: LintConfig) -> Iterator[tuple[str, str]]:
+            seen.append(document.headings)
+            yield from ()
+
+        document = Document("a.md", io.StringIO("# A\n"), needed_parts(registry))
+        for registered in registry:
+            list(registered.check(document, LintConfig()))
+
+        assert seen[0] == seen[1]
+
+    def test_unknown_parts_are_rejected(self, registry: list[Rule]) -> None:
+        with pytest.raises(ValueError, match="unknown parts"):
+            rule("bad", needs={"links"})
+
+    def test_duplicate_names_are_rejected(self, registry: list[Rule]) -> None:
+        with pytest.raises(ValueError, match="already registered"):
+            rule("status", needs={BODY})
+
+    def test_rule_set_is_part_of_the_cache_key(self, registry: list[Rule]) -> None:
+        before = LintConfig().rules_key()
+
+        rule("extra", needs={BODY})(lambda document, config: ())
+
+        assert LintConfig().rules_key() != before
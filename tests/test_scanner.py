@@ -2,9 +2,13 @@
 
 """Tests for the backlink scanner."""
 
+import os
 from pathlib import Path
 
-from backlink_scanner.scanner import scan
+import pytest
+
+from backlink_scanner import scanner
+from backlink_scanner.scanner import _extract_annotations, _scan_file, scan
 
 
 class TestScanningForBacklinks:
@@ -248,3 +252,225 @@ class TestEdgeCases:
         result = scan(str(tmp_path))
 
         assert result.specs["specs/auth.md"].implementors == ["a.py", "m.py", "z.py"]
+
+
+class TestParallelScanning:
+    def _make_tree(self, tmp_path: Path) -> None:
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs/auth.md").write_text("# Auth")
+        (tmp_path / "specs/orphan.md").write_text("# Orphan")
+        (tmp_path / "src").mkdir()
+        for i in range(40):
+            (tmp_path / f"src/mod{i:02d}.py").write_text(
+                "# spec: specs/auth.md\n"
+                f"# spec-section: Behavior/Part {i % 3}\n"
+                f"# spec: specs/missing{i % 2}.md\n"
+            )
+
+    def test_jobs_matches_serial_result(self, tmp_path: Path) -> None:
+        self._make_tree(tmp_path)
+
+        serial = scan(str(tmp_path))
+        parallel = scan(str(tmp_path), jobs=4)
+
+        assert parallel == serial
+
+    def test_jobs_preserves_deterministic_order(self, tmp_path: Path) -> None:
+        self._make_tree(tmp_path)
+
+        result = scan(str(tmp_path), jobs=3)
+
+        assert list(result.specs) == ["specs/auth.md", "specs/missing0.md", "specs/missing1.md"]
+        assert result.dangling == ["specs/missing0.md", "specs/missing1.md"]
+        assert result.orphans == ["specs/orphan.md"]
+        assert result.specs["specs/auth.md"].implementors == sorted(
+            f"src/mod{i:02d}.py" for i in range(40)
+        )
+
+
+class TestPrefilter:
+    def test_file_without_marker_is_not_decoded(self, tmp_path: Path) -> None:
+        (tmp_path / "data.txt").write_bytes(b"\xff\xfe not utf-8 and no annotation")
+
+        annotations = _scan_file(tmp_path, "data.txt")
+
+        assert annotations.spec_paths == []
+        assert annotations.sections == {}
+
+    def test_file_with_marker_is_parsed(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_bytes(b"x = 1\r\n# spec: specs/auth.md\r\n")
+
+        annotations = _scan_file(tmp_path, "src.py")
+
+        assert annotations.spec_paths == ["specs/auth.md"]
+
+    def test_marker_in_invalid_utf8_file_is_skipped(self, tmp_path: Path) -> None:
+        (tmp_path / "blob.dat").write_bytes(b"# spec: specs/auth.md\n\xff\xfe")
+
+        annotations = _scan_file(tmp_path, "blob.dat")
+
+        assert annotations.spec_paths == []
+
+    def test_large_files_use_mmap_search(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(scanner, "MMAP_THRESHOLD", 16)
+        (tmp_path / "big.py").write_text("x = 1\n" * 100 + "# spec: specs/auth.md\n")
+        (tmp_path / "plain.py").write_text("x = 1\n" * 100)
+
+        assert _scan_file(tmp_path, "big.py").spec_paths == ["specs/auth.md"]
+        assert _scan_file(tmp_path, "plain.py").spec_paths == []
+
+    def test_file_truncated_before_mmap_is_skipped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(scanner, "MMAP_THRESHOLD", 16)
+        big = tmp_path / "big.py"
+        big.write_text("# spec: specs/auth.md\n" + "x = 1\n" * 100)
+        real_stat = os.stat
+
+        def stat_then_truncate(path: Path, **kwargs: bool) -> os.stat_result:
+            st = real_stat(path, **kwargs)
+            if Path(path) == big and st.st_size:
+                big.write_bytes(b"")
+            return st
+
+        monkeypatch.setattr(os, "stat", stat_then_truncate)
+
+        assert _scan_file(tmp_path, "big.py").spec_paths == []
+
+
+class TestExtractionEngine:
+    def test_sections_attach_to_most_recent_spec(self) -> None:
+        content = (
+            "// spec-section: Before/Any spec\n"
+            "// spec: specs/a.md\n"
+            "// spec-section: One\n"
+            "  #   spec: specs/b.md  \n"
+            "# spec-section:   Two words  \n"
+        )
+
+        annotations = _extract_annotations(content, is_markdown=False)
+
+        assert annotations.spec_paths == ["specs/a.md", "specs/b.md"]
+        assert annotations.sections == {"specs/a.md": ["One"], "specs/b.md": ["Two words"]}
+
+    def test_matches_never_span_lines(self) -> None:
+        content = "#\nspec: specs/a.md\n# spec:\nspecs/b.md\n# spec-section:\n\nx\n"
+
+        annotations = _extract_annotations(content, is_markdown=False)
+
+        assert annotations.spec_paths == []
+        assert annotations.sections == {}
+
+    def test_crlf_line_endings(self) -> None:
+        content = "# spec: specs/a.md\r\n# spec-section: Behavior/Login\r\n"
+
+        annotations = _extract_annotations(content, is_markdown=False)
+
+        assert annotations.spec_paths == ["specs/a.md"]
+        assert annotations.sections == {"specs/a.md": ["Behavior/Login"]}
+
+    def test_lines_are_those_of_splitlines(self) -> None:
+        content = (
+            "# spec: specs/a.md\r# spec-section: Lone CR\x0b# spec: specs/b.md\x0c"
+            "# spec-section: Form feed\u2028```\u2029# spec: specs/fenced.md\x85```\r\n"
+        )
+
+        markdown = _extract_annotations(content, is_markdown=True)
+        source = _extract_annotations(content, is_markdown=False)
+
+        assert markdown.spec_paths == ["specs/a.md", "specs/b.md"]
+        assert markdown.sections == {"specs/a.md": ["Lone CR"], "specs/b.md": ["Form feed"]}
+        assert source.spec_paths == ["specs/a.md", "specs/b.md", "specs/fenced.md"]
+
+    def test_fence_ranges_suppress_only_markdown(self) -> None:
+        content = (
+            "# spec: specs/a.md\n"
+            "```\n# spec: specs/fenced.md\n```\n"
+            "# spec-section: After fence\n"
+            "  ```text\n# spec: specs/unclosed.md\n"
+        )
+
+        markdown = _extract_annotations(content, is_markdown=True)
+        source = _extract_annotations(content, is_markdown=False)
+
+        assert markdown.spec_paths == ["specs/a.md"]
+        assert markdown.sections == {"specs/a.md": ["After fence"]}
+        assert source.spec_paths == ["specs/a.md", "specs/fenced.md", "specs/unclosed.md"]
+
+    def test_fence_on_first_line(self) -> None:
+        content = "```\n# spec: specs/fenced.md\n```\n# spec: specs/a.md\n"
+
+        annotations = _extract_annotations(content, is_markdown=True)
+
+        assert annotations.spec_paths == ["specs/a.md"]
+
+
+class TestBinaryDetectionAndSizeCap:
+    def test_sniffs_nul_bytes_regardless_of_extension(self, tmp_path: Path) -> None:
+        (tmp_path / "data.sqlite").write_bytes(b"SQLite format 3\x00# spec: specs/auth.md\n")
+
+        result = scan(str(tmp_path))
+
+        assert result.specs == {}
+        assert result.skipped["binary"] == 1
+
+    def test_sniffs_invalid_utf8_ratio(self, tmp_path: Path) -> None:
+        (tmp_path / "blob.parquet").write_bytes(bytes(range(128, 256)) * 4 + b"# spec: x.md\n")
+
+        result = scan(str(tmp_path))
+
+        assert result.specs == {}
+        assert result.skipped["binary"] == 1
+
+    def test_counts_known_binary_extensions(self, tmp_path: Path) -> None:
+        (tmp_path / "image.png").write_text("# spec: specs/auth.md")
+
+        assert scan(str(tmp_path)).skipped == {"binary": 1, "too_large": 0}
+
+    def test_utf8_text_with_multibyte_characters_is_scanned(self, tmp_path: Path) -> None:
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs/auth.md").write_text("# Auth")
+        (tmp_path / "src.py").write_text("# spec: specs/auth.md\n# naïve café ✓ 日本語\n" * 500)
+
+        result = scan(str(tmp_path))
+
+        assert result.specs["specs/auth.md"].implementors == ["src.py"]
+        assert result.skipped == {"binary": 0, "too_large": 0}
+
+    def test_binary_verdict_is_remembered(self, tmp_path: Path) -> None:
+        (tmp_path / "data.bin2").write_bytes(b"\x00" * 64)
+        _scan_file(tmp_path, "data.bin2")
+
+        full_path = tmp_path / "data.bin2"
+        st = full_path.stat()
+        assert scanner._binary_verdicts[(str(full_path), st.st_size, st.st_mtime_ns)] is True
+
+    def test_skips_files_over_max_size(self, tmp_path: Path) -> None:
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs/auth.md").write_text("# Auth")
+        (tmp_path / "small.py").write_text("# spec: specs/auth.md\n")
+        (tmp_path / "big.py").write_text("# spec: specs/auth.md\n" + "x = 1\n" * 100)
+
+        result = scan(str(tmp_path), max_file_size=64)
+
+        assert result.specs["specs/auth.md"].implementors == ["small.py"]
+        assert result.skipped == {"binary": 0, "too_large": 1}
+
+    def test_no_size_limit_by_default(self, tmp_path: Path) -> None:
+        # Just over the 10 MiB that used to be the default cap
+        (tmp_path / "big.py").write_text("# spec: specs/auth.md\n" + "#" * (10 * 1024 * 1024))
+
+        result = scan(str(tmp_path))
+
+        assert result.specs["specs/auth.md"].implementors == ["big.py"]
+        assert result.skipped == {"binary": 0, "too_large": 0}
+
+    def test_no_size_limit(self, tmp_path: Path) -> None:
+        (tmp_path / "big.py").write_text("# spec: specs/auth.md\n" + "x = 1\n" * 100)
+
+        result = scan(str(tmp_path), max_file_size=None)
+
+        assert result.skipped == {"binary": 0, "too_large": 0}
+        assert "specs/auth.md" in result.specs
@@ -0,0 +1,140 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Annotation cache
+
+"""Tests for the persistent backlink annotation cache."""
+
+import os
+import time
+from pathlib import Path
+
+from backlink_scanner.scanner import scan
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a file's mtime so its cache entry isn't considered racy."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _make_tree(tmp_path: Path) -> None:
+    (tmp_path / "specs").mkdir()
+    (tmp_path / "specs/auth.md").write_text("# Auth")
+    (tmp_path / "a.py").write_text("# spec: specs/auth.md\n# spec-section: Behavior/Login\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+    for path in tmp_path.rglob("*"):
+        _age(path)
+
+
+class TestAnnotationCache:
+    def test_cold_run_misses_every_file(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path / "cache"
+
+        result = scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        assert result.cache is not None
+        assert result.cache.hits == 0
+        assert result.cache.misses == 3
+
+    def test_warm_run_hits_every_file(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+
+        cold = scan(str(tmp_path), cache_dir=str(cache_dir))
+        warm = scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        assert warm.cache is not None
+        assert (warm.cache.hits, warm.cache.misses) == (3, 0)
+        assert warm.specs == cold.specs
+        assert warm.specs == scan(str(tmp_path)).specs
+
+    def test_rescans_changed_file(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+        scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        (tmp_path / "b.py").write_text("# spec: specs/auth.md\n")
+        _age(tmp_path / "b.py", seconds=30)
+        result = scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        assert result.cache is not None
+        assert (result.cache.hits, result.cache.misses) == (2, 1)
+        assert result.specs["specs/auth.md"].implementors == ["a.py", "b.py"]
+
+    def test_deleted_file_drops_out(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+        scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        (tmp_path / "a.py").unlink()
+        result = scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        assert result.specs == {}
+        assert result.orphans == ["specs/auth.md"]
+
+    def test_recently_modified_files_are_not_cached(self, tmp_path: Path) -> None:
+        (tmp_path / "fresh.py").write_text("# spec: specs/auth.md\n")
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+
+        scan(str(tmp_path), cache_dir=str(cache_dir))
+        result = scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        assert result.cache is not None
+        assert result.cache.hits == 0
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+        scan(str(tmp_path), cache_dir=str(cache_dir))
+        for cache_file in cache_dir.iterdir():
+            cache_file.write_text("{not json")
+
+        result = scan(str(tmp_path), cache_dir=str(cache_dir))
+
+        assert result.cache is not None
+        assert result.cache.misses == 3
+        assert result.specs["specs/auth.md"].implementors == ["a.py"]
+
+    def test_cache_works_with_jobs(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+
+        scan(str(tmp_path), jobs=2, cache_dir=str(cache_dir))
+        warm = scan(str(tmp_path), jobs=2, cache_dir=str(cache_dir))
+
+        assert warm.cache is not None
+        assert warm.cache.hits == 3
+        assert warm.specs == scan(str(tmp_path)).specs
+
+    def test_no_cache_by_default(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+
+        result = scan(str(tmp_path))
+
+        assert result.cache is None
+
+    def test_skip_verdicts_are_cached(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        (tmp_path / "data.db").write_bytes(b"\x00\x01\x02")
+        (tmp_path / "huge.py").write_text("x = 1\n" * 100)
+        _age(tmp_path / "data.db")
+        _age(tmp_path / "huge.py")
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+
+        cold = scan(str(tmp_path), cache_dir=str(cache_dir), max_file_size=200)
+        warm = scan(str(tmp_path), cache_dir=str(cache_dir), max_file_size=200)
+
+        assert warm.cache is not None
+        assert warm.cache.misses == 0
+        assert warm.skipped == cold.skipped == {"binary": 1, "too_large": 1}
+
+    def test_changing_max_file_size_invalidates_cache(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        cache_dir = tmp_path.parent / f"{tmp_path.name}-cache"
+        scan(str(tmp_path), cache_dir=str(cache_dir), max_file_size=200)
+
+        result = scan(str(tmp_path), cache_dir=str(cache_dir), max_file_size=10)
+
+        assert result.cache is not None
+        assert result.cache.hits == 0
+        assert result.skipped["too_large"] == 1
@@ -0,0 +1,174 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Changed-files mode
+
+"""Tests for changed-files-only scans patched into a stored baseline."""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from backlink_scanner.scanner import scan, scan_changed
+
+
+def _make_tree(root: Path) -> None:
+    (root / "specs").mkdir()
+    (root / "specs/auth.md").write_text("# Auth")
+    (root / "specs/rate.md").write_text("# Rate")
+    (root / "a.py").write_text("# spec: specs/auth.md\n# spec-section: Behavior/Login\n")
+    (root / "b.py").write_text("# spec: specs/rate.md\n# spec-section: Behavior/Limits\n")
+    (root / "c.py").write_text("x = 1\n")
+
+
+def _full(root: Path) -> tuple:
+    result = scan(str(root))
+    return result.specs, result.dangling, result.orphans
+
+
+def _patched(root: Path, changed: list[str], cache_dir: Path) -> tuple:
+    result = scan_changed(str(root), changed, cache_dir=str(cache_dir))
+    return result.specs, result.dangling, result.orphans
+
+
+class TestScanChanged:
+    def test_edited_file_replaces_stale_entries(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        scan(str(root), cache_dir=str(tmp_path / "cache"))
+
+        (root / "a.py").write_text("# spec: specs/rate.md\n# spec-section: Behavior/Bursts\n")
+
+        assert _patched(root, ["a.py"], tmp_path / "cache") == _full(root)
+
+    def test_added_and_deleted_files(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        scan(str(root), cache_dir=str(tmp_path / "cache"))
+
+        (root / "b.py").unlink()
+        (root / "d.py").write_text("# spec: specs/missing.md\n")
+
+        specs, dangling, orphans = _patched(root, ["b.py", "d.py"], tmp_path / "cache")
+
+        assert (specs, dangling, orphans) == _full(root)
+        assert dangling == ["specs/missing.md"]
+        assert orphans == ["specs/rate.md"]
+
+    def test_deleted_spec_becomes_dangling(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        scan(str(root), cache_dir=str(tmp_path / "cache"))
+
+        (root / "specs/auth.md").unlink()
+        (root / "specs/new.md").write_text("# New")
+
+        specs, dangling, orphans = _patched(
+            root, ["specs/auth.md", "specs/new.md"], tmp_path / "cache"
+        )
+
+        assert (specs, dangling, orphans) == _full(root)
+        assert dangling == ["specs/auth.md"]
+        assert orphans == ["specs/new.md"]
+
+    def test_baseline_is_updated_for_next_run(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        scan(str(root), cache_dir=str(tmp_path / "cache"))
+
+        (root / "c.py").write_text("# spec: specs/auth.md\n")
+        scan_changed(str(root), ["c.py"], cache_dir=str(tmp_path / "cache"))
+        (root / "a.py").unlink()
+
+        assert _patched(root, ["a.py"], tmp_path / "cache") == _full(root)
+
+    def test_normalizes_and_filters_paths(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        (root / "node_modules").mkdir()
+        scan(str(root), cache_dir=str(tmp_path / "cache"))
+
+        (root / "a.py").write_text("x = 1\n")
+        (root / "c.py").write_text("# spec: specs/auth.md\n")
+        (root / "node_modules/dep.js").write_text("// spec: specs/missing.md\n")
+
+        changed = ["./a.py", str(root / "c.py"), "node_modules/dep.js", "../outside.py", ""]
+        assert _patched(root, changed, tmp_path / "cache") == _full(root)
+
+    def test_without_baseline_runs_full_scan(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+
+        assert _patched(root, [], tmp_path / "cache") == _full(root)
+        assert any((tmp_path / "cache").glob("baseline-*.json"))
+
+
+def _run_scanner(root: Path, *args: str, stdin: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "backlink_scanner", str(root), *args],
+        capture_output=True,
+        text=True,
+        input=stdin,
+    )
+
+
+class TestChangedCLI:
+    def test_changed_reads_paths_from_stdin(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        _run_scanner(tmp_path)
+        (tmp_path / "c.py").write_text("# spec: specs/missing.md\n")
+
+        proc = _run_scanner(tmp_path, "--changed", stdin="c.py\n")
+        output = json.loads(proc.stdout)
+
+        assert proc.returncode == 1
+        assert output["dangling"] == ["specs/missing.md"]
+
+    def test_changed_requires_cache(self, tmp_path: Path) -> None:
+        proc = _run_scanner(tmp_path, "--changed", "--no-cache")
+
+        assert proc.returncode == 2
+        assert "--no-cache" in proc.stderr
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_since_uses_local_git_diff(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-qm", "base"], cwd=tmp_path, check=True)
+        _run_scanner(tmp_path)
+
+        (tmp_path / "b.py").unlink()
+        (tmp_path / "new.py").write_text("# spec: specs/rate.md\n")
+
+        proc = _run_scanner(tmp_path, "--since", "HEAD")
+        output = json.loads(proc.stdout)
+
+        assert output["specs"]["specs/rate.md"]["implementors"] == ["new.py"]
+        assert output == json.loads(_run_scanner(tmp_path, "--no-cache").stdout)
+
+    def test_changed_with_git_index_exits_2(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+
+        proc = _run_scanner(tmp_path, "--changed", "--git-index", stdin="a.py\n")
+
+        assert proc.returncode == 2
+        assert "--git-index" in proc.stderr
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_since_unknown_revision_exits_2(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+
+        proc = _run_scanner(tmp_path, "--since", "no-such-rev")
+
+        assert proc.returncode == 2
+        assert "no-such-rev" in proc.stderr
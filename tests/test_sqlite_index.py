@@ -0,0 +1,253 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Traceability index
+
+"""Tests for the SQLite traceability index and the query subcommand."""
+
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from backlink_scanner.scanner import SpecIndex, _get_files, _scan_files, scan, scan_changed
+from backlink_scanner.sqlite_index import DEFAULT_INDEX_FILE, TraceabilityIndex
+from tool_cli import UsageError
+
+
+def _make_tree(root: Path) -> None:
+    (root / "specs").mkdir()
+    (root / "specs/auth.md").write_text("# Auth")
+    (root / "specs/rate.md").write_text("# Rate")
+    (root / "a.py").write_text(
+        "# spec: specs/auth.md\n# spec-section: Behavior/Login\n# spec-section: Behavior/Logout\n"
+    )
+    (root / "b.py").write_text(
+        "# spec: specs/rate.md\n# spec: specs/auth.md\n# spec-section: Behavior/Login\n"
+    )
+    (root / "c.py").write_text("x = 1\n")
+
+
+def _run_scanner(*args: str, stdin: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "backlink_scanner", *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _spec_index(root: Path) -> SpecIndex:
+    files = _get_files(root)
+    index = SpecIndex()
+    for file, annotations in zip(files, _scan_files(root, files, 1), strict=True):
+        index.set_file(file, annotations)
+    return index
+
+
+class TestTraceabilityIndex:
+    def test_queries_answer_each_direction(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        db_path = tmp_path / "index.sqlite"
+        scan(str(tmp_path), index_path=str(db_path))
+
+        with TraceabilityIndex.open_existing(db_path, tmp_path.resolve()) as db:
+            assert db.query_file("b.py") == {
+                "file": "b.py",
+                "specs": {"specs/auth.md": ["Behavior/Login"], "specs/rate.md": []},
+            }
+            assert db.query_spec("specs/auth.md") == {
+                "spec": "specs/auth.md",
+                "implementors": ["a.py", "b.py"],
+                "sections": {"Behavior/Login": ["a.py", "b.py"], "Behavior/Logout": ["a.py"]},
+            }
+            assert db.query_section("Behavior/Login") == {
+                "section": "Behavior/Login",
+                "specs": {"specs/auth.md": ["a.py", "b.py"]},
+            }
+
+    def test_unknown_keys_return_empty_answers(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        db_path = tmp_path / "index.sqlite"
+        scan(str(tmp_path), index_path=str(db_path))
+
+        with TraceabilityIndex.open_existing(db_path, tmp_path.resolve()) as db:
+            assert db.query_file("c.py") == {"file": "c.py", "specs": {}}
+            assert db.query_spec("specs/none.md")["implementors"] == []
+            assert db.query_section("Nope") == {"section": "Nope", "specs": {}}
+
+    def test_sync_upserts_only_changed_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        root = tmp_path.resolve()
+        db_path = tmp_path / "index.sqlite"
+        scan(str(tmp_path), index_path=str(db_path))
+
+        (tmp_path / "a.py").write_text("# spec: specs/rate.md\n")
+        (tmp_path / "b.py").unlink()
+        result_index = _spec_index(root)
+        with TraceabilityIndex(db_path, root) as db:
+            stats = db.sync(result_index.annotations)
+            assert (stats.upserted, stats.removed) == (1, 1)
+            assert db.query_spec("specs/auth.md")["implementors"] == []
+            assert db.query_file("a.py")["specs"] == {"specs/rate.md": []}
+
+            again = db.sync(result_index.annotations)
+            assert (again.upserted, again.removed) == (0, 0)
+
+    def test_changed_scan_updates_index(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        cache_dir = tmp_path / "cache"
+        db_path = tmp_path / "index.sqlite"
+        scan(str(root), cache_dir=str(cache_dir), index_path=str(db_path))
+
+        (root / "c.py").write_text("# spec: specs/rate.md\n# spec-section: Behavior/Limits\n")
+        scan_changed(str(root), ["c.py"], cache_dir=str(cache_dir), index_path=str(db_path))
+
+        with TraceabilityIndex.open_existing(db_path, root.resolve()) as db:
+            assert db.query_section("Behavior/Limits")["specs"] == {"specs/rate.md": ["c.py"]}
+            assert db.query_spec("specs/rate.md")["implementors"] == ["b.py", "c.py"]
+
+    def test_index_for_another_root_is_reset(self, tmp_path: Path) -> None:
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        for root in (first, second):
+            root.mkdir()
+        _make_tree(first)
+        (second / "z.py").write_text("# spec: specs/other.md\n")
+        db_path = tmp_path / "index.sqlite"
+
+        scan(str(first), index_path=str(db_path))
+        scan(str(second), index_path=str(db_path))
+
+        with TraceabilityIndex.open_existing(db_path, second.resolve()) as db:
+            assert db.query_file("a.py")["specs"] == {}
+            assert db.query_file("z.py")["specs"] == {"specs/other.md": []}
+
+    def test_open_existing_refuses_another_root_without_clearing(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        db_path = tmp_path / "index.sqlite"
+        scan(str(root), index_path=str(db_path))
+
+        with pytest.raises(UsageError, match="re-run a scan"):
+            TraceabilityIndex.open_existing(db_path, tmp_path.resolve())
+
+        with TraceabilityIndex.open_existing(db_path, root.resolve()) as db:
+            assert db.query_spec("specs/rate.md")["implementors"] == ["b.py"]
+
+    def test_open_existing_is_read_only(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "index.sqlite"
+        TraceabilityIndex(db_path, tmp_path).close()
+
+        with (
+            TraceabilityIndex.open_existing(db_path, tmp_path) as db,
+            pytest.raises(sqlite3.OperationalError, match="readonly"),
+        ):
+            db.upsert_file("a.py", SimpleNamespace(spec_paths=["specs/x.md"], sections={}))
+
+    def test_open_existing_rejects_other_files(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "index.sqlite"
+        db_path.write_text("not a database")
+
+        with pytest.raises(UsageError, match="not a traceability index"):
+            TraceabilityIndex.open_existing(db_path, tmp_path)
+
+    def test_open_existing_requires_index(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            TraceabilityIndex.open_existing(tmp_path / "missing.sqlite", tmp_path)
+
+
+class TestQueryCli:
+    def test_index_then_query(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        scanned = _run_scanner(str(tmp_path), "--index")
+        assert scanned.returncode == 0
+        assert (tmp_path / DEFAULT_INDEX_FILE).is_file()
+
+        result = _run_scanner("query", str(tmp_path), "--spec", "specs/rate.md")
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == {
+            "spec": "specs/rate.md",
+            "implementors": ["b.py"],
+            "sections": {},
+        }
+
+    def test_custom_index_path(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        db_path = tmp_path / "elsewhere.sqlite"
+        _run_scanner(str(tmp_path), "--no-cache", "--index-path", str(db_path))
+
+        result = _run_scanner(
+            "query", str(tmp_path), "--index-path", str(db_path), "--section=Behavior/Logout"
+        )
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["specs"] == {"specs/auth.md": ["a.py"]}
+
+    def test_query_for_another_root_keeps_the_index(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        db_path = tmp_path / "index.sqlite"
+        _run_scanner(str(root), "--no-cache", "--index-path", str(db_path))
+
+        elsewhere = subprocess.run(
+            [sys.executable, "-m", "backlink_scanner", "query", "--index-path", str(db_path)]
+            + ["--spec", "specs/rate.md"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
+        again = _run_scanner(
+            "query", str(root), "--index-path", str(db_path), "--spec", "specs/rate.md"
+        )
+
+        assert elsewhere.returncode == 2
+        assert str(root.resolve()) in elsewhere.stderr
+        assert json.loads(again.stdout)["implementors"] == ["b.py"]
+
+    def test_query_paths_are_normalized(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        (tmp_path / "specs/sub").mkdir()
+        _run_scanner(str(tmp_path), "--no-cache", "--index")
+        expected = {
+            "file": "b.py",
+            "specs": {"specs/auth.md": ["Behavior/Login"], "specs/rate.md": []},
+        }
+
+        dotted = _run_scanner("query", str(tmp_path), "--file", "./b.py")
+        absolute = _run_scanner("query", str(tmp_path), "--file", str(tmp_path / "b.py"))
+        from_subdir = subprocess.run(
+            [sys.executable, "-m", "backlink_scanner", "query", "../..", "--spec", "../rate.md"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path / "specs/sub",
+        )
+
+        assert json.loads(dotted.stdout) == json.loads(absolute.stdout) == expected
+        assert json.loads(from_subdir.stdout)["implementors"] == ["b.py"]
+
+    def test_query_path_outside_root_exits_2(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _make_tree(root)
+        _run_scanner(str(root), "--no-cache", "--index")
+
+        result = _run_scanner("query", str(root), "--file", str(tmp_path / "other.py"))
+
+        assert result.returncode == 2
+        assert "outside" in result.stderr
+
+    def test_query_without_index_exits_2(self, tmp_path: Path) -> None:
+        result = _run_scanner("query", str(tmp_path), "--file", "a.py")
+        assert result.returncode == 2
+        assert "not found" in result.stderr
+
+    def test_query_needs_exactly_one_lookup(self, tmp_path: Path) -> None:
+        result = _run_scanner("query", str(tmp_path), "--file", "a.py", "--spec", "specs/x.md")
+        assert result.returncode == 2
+        assert "exactly one" in result.stderr
@@ -0,0 +1,91 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Fix suggestions
+
+"""Tests for "did you mean" suggestions on broken links."""
+
+import os
+import time
+from pathlib import Path
+
+from link_validator.suggest import SuggestionIndex, name_trigrams
+from link_validator.validator import validate, validate_changed
+
+PATHS = [
+    "docs/guides/setup.md",
+    "docs/guides/README.md",
+    "docs/practices/README.md",
+    "docs/practices/guides/README.md",
+    "docs/practices/writing-specs.md",
+    "notes/2026-01-24-setup.md",
+    "notes/archive",
+]
+
+
+class TestSuggestionIndex:
+    def test_moved_file_is_found_by_name(self) -> None:
+        index = SuggestionIndex(PATHS)
+
+        assert index.suggest("docs/setup.md") == ["docs/guides/setup.md"]
+
+    def test_shared_trailing_directories_rank_first(self) -> None:
+        index = SuggestionIndex(PATHS)
+
+        assert index.suggest("old/guides/README.md") == [
+            "docs/guides/README.md",
+            "docs/practices/guides/README.md",
+            "docs/practices/README.md",
+        ]
+
+    def test_renamed_file_is_found_by_similar_name(self) -> None:
+        index = SuggestionIndex(PATHS)
+
+        assert index.suggest("docs/practices/writing-spec.md")[0] == (
+            "docs/practices/writing-specs.md"
+        )
+
+    def test_limit(self) -> None:
+        index = SuggestionIndex(PATHS)
+
+        assert len(index.suggest("docs/README.md", limit=2)) == 2
+
+    def test_dissimilar_names_have_no_suggestions(self) -> None:
+        index = SuggestionIndex(PATHS)
+
+        assert index.suggest("docs/zzqqxx.md") == []
+
+    def test_directories_are_candidates(self) -> None:
+        index = SuggestionIndex(PATHS)
+
+        assert index.suggest("notes/archives") == ["notes/archive"]
+
+    def test_trigrams_are_padded(self) -> None:
+        assert name_trigrams("ab") == frozenset({" ab", "ab "})
+
+
+class TestValidateSuggestions:
+    def _kb(self, root: Path) -> None:
+        (root / "docs/guides").mkdir(parents=True)
+        (root / "docs/guides/setup.md").write_text("# Setup\n")
+        (root / "docs/index.md").write_text("[setup](setup.md) [gone](nothing-like-it.md)\n")
+        past = time.time() - 60
+        for path in root.rglob("*.md"):
+            os.utime(path, (past, past))
+
+    def test_broken_links_carry_suggestions(self, tmp_path: Path) -> None:
+        self._kb(tmp_path)
+
+        result = validate(str(tmp_path))
+
+        assert [(v.resolved, v.suggestions) for v in result.violations] == [
+            ("docs/setup.md", ["docs/guides/setup.md"]),
+            ("docs/nothing-like-it.md", []),
+        ]
+
+    def test_changed_mode_suggests_too(self, tmp_path: Path) -> None:
+        self._kb(tmp_path)
+        cache_dir = tmp_path / ".cache"
+        validate(str(tmp_path), cache_dir=str(cache_dir))
+
+        result = validate_changed(str(tmp_path), ["docs/index.md"], cache_dir=str(cache_dir))
+
+        assert result.violations[0].suggestions == ["docs/guides/setup.md"]
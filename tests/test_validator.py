@@ -2,9 +2,19 @@
 
 """Tests for the link validator."""
 
+import os
 from pathlib import Path
 
-from link_validator.validator import _extract_links, _resolve_path, validate
+import pytest
+
+from link_validator.path_index import PathIndex
+from link_validator.validator import (
+    SKIP_DIRS,
+    ResolutionCache,
+    _extract_links,
+    _resolve_path,
+    validate,
+)
 
 
 def _setup_kb(tmp_path: Path) -> None:
@@ -61,6 +71,42 @@ class TestLinkExtraction:
         content = "[policy](../policies/rules.md)"
         assert _extract_links(content) == ["../policies/rules.md"]
 
+    def test_skips_fence_on_first_line(self) -> None:
+        content = "```\n[example](fake.md)\n```\n[real](real.md)"
+        assert _extract_links(content) == ["real.md"]
+
+    def test_skips_indented_fences(self) -> None:
+        content = "  ~~~\n[example](fake.md)\n  ~~~\n[real](real.md)"
+        assert _extract_links(content) == ["real.md"]
+
+    def test_unclosed_fence_runs_to_end(self) -> None:
+        content = "[real](real.md)\n```\n[example](fake.md)\n"
+        assert _extract_links(content) == ["real.md"]
+
+    def test_fence_with_info_string_does_not_close(self) -> None:
+        content = "```\n```js\n[example](fake.md)\n```\n[real](real.md)"
+        assert _extract_links(content) == ["real.md"]
+
+    def test_handles_crlf_line_endings(self) -> None:
+        content = "x\r\n```\r\n[example](fake.md)\r\n```\r\n[real](real.md)\r\n"
+        assert _extract_links(content) == ["real.md"]
+
+    def test_extracts_link_with_code_in_text(self) -> None:
+        content = "[`tool`](tool.md)"
+        assert _extract_links(content) == ["tool.md"]
+
+    def test_extracts_link_after_bracket_in_inline_code(self) -> None:
+        content = "Type `[` then [real](real.md)"
+        assert _extract_links(content) == ["real.md"]
+
+    def test_extracts_link_with_bracket_in_code_in_text(self) -> None:
+        content = "[a `]` b](t.md) and [`]]`](u.md)"
+        assert _extract_links(content) == ["t.md", "u.md"]
+
+    def test_skips_link_with_code_target(self) -> None:
+        content = "[text](`target`)"
+        assert _extract_links(content) == []
+
 
 class TestPathResolution:
     def test_resolves_sibling_link(self) -> None:
@@ -101,6 +147,52 @@ class TestPathResolution:
         assert result.startswith("..")
 
 
+class TestResolutionCache:
+    def test_repeats_are_hits(self) -> None:
+        cache = ResolutionCache()
+
+        results = [cache.resolve(t, "notes") for t in ("../index.md", "a.md", "../index.md")]
+
+        assert results == ["index.md", "notes/a.md", "index.md"]
+        assert cache.hits == 1
+
+    def test_key_includes_directory(self) -> None:
+        cache = ResolutionCache()
+
+        assert cache.resolve("a.md", "docs") == "docs/a.md"
+        assert cache.resolve("a.md", "notes") == "notes/a.md"
+        assert cache.hits == 0
+
+    def test_memoizes_external_links(self) -> None:
+        cache = ResolutionCache()
+
+        cache.resolve("https://example.com", "docs")
+
+        assert cache.resolve("https://example.com", "docs") is None
+        assert cache.hits == 1
+
+    def test_evicts_oldest_when_full(self) -> None:
+        cache = ResolutionCache(max_size=2)
+        for target in ("a.md", "b.md", "c.md"):
+            cache.resolve(target, "docs")
+
+        cache.resolve("a.md", "docs")
+        cache.resolve("c.md", "docs")
+
+        assert cache.hits == 1
+
+    def test_validate_counts_hits(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "index.md").write_text("# Index\n")
+        for i in range(3):
+            (tmp_path / f"notes/n{i}.md").write_text("[home](../index.md) [home](../index.md)\n")
+
+        result = validate(str(tmp_path), jobs=2)
+
+        assert result.links_checked == 6
+        assert result.resolve_cache_hits == 5
+
+
 class TestValidation:
     def test_no_violations_for_valid_links(self, tmp_path: Path) -> None:
         _setup_kb(tmp_path)
@@ -255,3 +347,115 @@ class TestValidation:
         result = validate(str(tmp_path))
 
         assert result.violations == []
+
+
+class TestScannedPaths:
+    def test_scans_declared_paths_and_specs(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "knowledge-base.yaml").write_text("paths:\n  docs: docs\n  guides: kb/guides\n")
+        for file in ["docs/a.md", "kb/guides/b.md", "specs/c.md", "policies/d.md"]:
+            (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / file).write_text("[gone](gone.md)\n")
+
+        result = validate(str(tmp_path))
+
+        assert [v.file for v in result.violations] == ["docs/a.md", "kb/guides/b.md", "specs/c.md"]
+
+
+class TestPathIndex:
+    def test_indexes_files_and_ancestor_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "docs/sub").mkdir(parents=True)
+        (tmp_path / "docs/sub/page.md").write_text("# Page\n")
+
+        index = PathIndex(tmp_path)
+
+        for path in (".", "docs", "docs/sub", "docs/sub/page.md"):
+            assert index.exists(path)
+        assert not index.exists("docs/sub/missing.md")
+        assert not index.exists("../outside.md")
+
+    def test_skipped_directories_fall_back_to_disk(self, tmp_path: Path) -> None:
+        (tmp_path / "node_modules/pkg").mkdir(parents=True)
+        (tmp_path / "node_modules/pkg/README.md").write_text("# Pkg\n")
+
+        index = PathIndex(tmp_path, SKIP_DIRS)
+
+        assert len(index) == 2  # root and node_modules itself
+        assert index.exists("node_modules/pkg/README.md")
+        assert not index.exists("node_modules/pkg/gone.md")
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_symlinks_match_filesystem(self, tmp_path: Path) -> None:
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real/page.md").write_text("# Page\n")
+        (tmp_path / "linked").symlink_to(tmp_path / "real")
+        (tmp_path / "dangling.md").symlink_to(tmp_path / "nowhere.md")
+
+        index = PathIndex(tmp_path)
+
+        assert index.exists("linked/page.md")
+        assert not index.exists("dangling.md")
+
+    def test_lists_only_target_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/a.md").write_text("[b](../notes/b.md) [c](../notes/c.md) [g](gone.md)\n")
+        (tmp_path / "notes/b.md").write_text("# B\n")
+        (tmp_path / "build/out/deep").mkdir(parents=True)
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def scandir(path: "os.PathLike[str]") -> "os.ScandirIterator[str]":
+            listed.append(Path(path).relative_to(tmp_path.resolve()).as_posix())
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        index = PathIndex(tmp_path.resolve(), SKIP_DIRS)
+
+        assert index.exists("notes/b.md")
+        assert not index.exists("notes/c.md")
+        assert not index.exists("docs/gone.md")
+        assert not index.exists("missing/dir/page.md")
+        assert listed == ["notes", "docs", "missing/dir"]
+
+    def test_known_paths_answer_without_listing(self, tmp_path: Path) -> None:
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs/untracked.md").write_text("# Untracked\n")
+
+        index = PathIndex(tmp_path, SKIP_DIRS, known=["docs/a.md", "node_modules/x/y.md"])
+
+        assert index.exists("docs/a.md")
+        assert index.exists("docs")
+        assert index._listings == {}
+        assert index.exists("docs/untracked.md")
+        assert sorted(index) == ["docs", "docs/a.md"]
+
+    def test_validate_accepts_shared_index(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/source.md").write_text("[t](target.md)\n")
+        index = PathIndex(tmp_path.resolve(), SKIP_DIRS)
+        assert not index.exists("docs/target.md")
+        # Created after docs/ was listed, so the shared index doesn't know it
+        (tmp_path / "docs/target.md").write_text("# Target\n")
+
+        assert len(validate(str(tmp_path), path_index=index).violations) == 1
+        assert validate(str(tmp_path)).violations == []
+
+
+class TestParallelValidation:
+    def test_jobs_matches_serial_result(self, tmp_path: Path) -> None:
+        _setup_kb(tmp_path)
+        (tmp_path / "docs/sub").mkdir()
+        for i in range(30):
+            folder = "docs/sub" if i % 2 else "notes"
+            (tmp_path / f"{folder}/n{i:02d}.md").write_text(
+                f"[a](../specs/) [b](missing{i % 4}.md) [c](https://example.com) `[x](y.md)`\n"
+            )
+
+        serial = validate(str(tmp_path))
+        parallel = validate(str(tmp_path), jobs=4)
+
+        assert parallel == serial
+        assert parallel.files_checked == 30
+        assert [v.file for v in parallel.violations] == sorted(v.file for v in serial.violations)
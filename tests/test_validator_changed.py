@@ -0,0 +1,180 @@
+# spec: specs/link-validator.md
+# spec-section: Behavior/Incremental validation
+
+"""Tests for the persistent link graph and --changed re-validation."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from link_validator import validator
+from link_validator.graph import LinkGraph
+from link_validator.validator import validate, validate_changed
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a file's mtime so its graph entry isn't considered racy."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _make_kb(root: Path) -> None:
+    (root / "docs/guides").mkdir(parents=True)
+    (root / "notes").mkdir()
+    (root / "docs/index.md").write_text("[guide](guides/setup.md) [dir](guides/)\n")
+    (root / "docs/guides/setup.md").write_text("# Setup\n[home](../index.md)\n")
+    (root / "notes/n1.md").write_text("[setup](../docs/guides/setup.md) [old](../docs/old.md)\n")
+    for path in root.rglob("*.md"):
+        _age(path)
+
+
+def _full(root: Path) -> validator.ValidateResult:
+    return validate(str(root))
+
+
+def _patched(root: Path, changed: list[str], cache_dir: Path) -> validator.ValidateResult:
+    return validate_changed(str(root), changed, cache_dir=str(cache_dir))
+
+
+@pytest.fixture
+def kb(tmp_path: Path) -> tuple[Path, Path]:
+    root = tmp_path / "kb"
+    root.mkdir()
+    _make_kb(root)
+    cache_dir = tmp_path / "cache"
+    validate(str(root), cache_dir=str(cache_dir))
+    return root, cache_dir
+
+
+class TestLinkGraphCache:
+    def test_cached_run_matches_uncached(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+
+        assert validate(str(root), cache_dir=str(cache_dir)) == _full(root)
+
+    def test_unchanged_sources_are_not_reparsed(
+        self, kb: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root, cache_dir = kb
+        parsed: list[str] = []
+        original = validator._read_targets
+
+        def counting(root: Path, file: str) -> list:
+            parsed.append(file)
+            return original(root, file)
+
+        monkeypatch.setattr(validator, "_read_targets", counting)
+        (root / "notes/n1.md").write_text("[gone](missing.md)\n")
+
+        result = validate(str(root), cache_dir=str(cache_dir))
+
+        assert parsed == ["notes/n1.md"]
+        assert [v.resolved for v in result.violations] == ["notes/missing.md"]
+
+    def test_graph_records_reverse_index(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+
+        graph = LinkGraph.load(cache_dir, root.resolve())
+
+        assert graph is not None
+        assert graph.referrers["docs/guides/setup.md"] == {"docs/index.md", "notes/n1.md"}
+        assert graph.exists["docs/old.md"] is False
+
+
+class TestValidateChanged:
+    def test_deleted_target_breaks_its_referrers(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        (root / "docs/guides/setup.md").unlink()
+
+        result = _patched(root, ["docs/guides/setup.md"], cache_dir)
+
+        assert result == _full(root)
+        assert {v.file for v in result.violations} == {"docs/index.md", "notes/n1.md"}
+
+    def test_added_target_fixes_link(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        (root / "docs/old.md").write_text("# Old\n")
+
+        result = _patched(root, ["docs/old.md"], cache_dir)
+
+        assert result == _full(root)
+        assert result.violations == []
+
+    def test_removed_directory_rechecks_ancestor_links(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        shutil.rmtree(root / "docs/guides")
+
+        result = _patched(root, ["docs/guides/setup.md"], cache_dir)
+
+        assert result == _full(root)
+        assert "docs/guides" in {v.resolved for v in result.violations}
+        assert result.files_checked == 2
+
+    def test_edited_and_new_sources_are_parsed(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+        (root / "notes/n1.md").write_text("[idx](../docs/index.md)\n")
+        (root / "notes/archive").mkdir()
+        (root / "notes/archive/n2.md").write_text("[nope](nope.md)\n")
+
+        result = _patched(root, ["notes/n1.md", str(root / "notes/archive")], cache_dir)
+
+        assert result == _full(root)
+        assert [v.resolved for v in result.violations] == ["notes/archive/nope.md"]
+
+    def test_out_of_scope_paths_are_ignored(self, kb: tuple[Path, Path]) -> None:
+        root, cache_dir = kb
+
+        result = _patched(root, ["../elsewhere.md", "src/tool.py", ""], cache_dir)
+
+        assert result == _full(root)
+
+    def test_without_graph_falls_back_to_full_validation(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+        cache_dir = tmp_path / ".cache"
+
+        result = _patched(tmp_path, [], cache_dir)
+
+        assert result == _full(tmp_path)
+        assert LinkGraph.load(cache_dir, tmp_path.resolve()) is not None
+
+
+class TestChangedCli:
+    def _run(self, root: Path, *args: str, stdin: str = "") -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-m", "link_validator", str(root), *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_changed_from_stdin(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+        assert self._run(tmp_path).returncode == 1
+        (tmp_path / "docs/old.md").write_text("# Old\n")
+
+        proc = self._run(tmp_path, "--changed", stdin="docs/old.md\n")
+
+        assert proc.returncode == 0
+        assert json.loads(proc.stdout)["summary"]["broken"] == 0
+
+    def test_changed_without_cache_exits_2(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        proc = self._run(tmp_path, "--changed", "--no-cache", stdin="docs/old.md\n")
+
+        assert proc.returncode == 2
+        assert "--no-cache" in proc.stderr
+
+    def test_changed_with_git_index_exits_2(self, tmp_path: Path) -> None:
+        _make_kb(tmp_path)
+
+        proc = self._run(tmp_path, "--changed", "--git-index", stdin="docs/old.md\n")
+
+        assert proc.returncode == 2
+        assert "--git-index" in proc.stderr
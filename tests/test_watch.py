@@ -0,0 +1,249 @@
+# spec: specs/backlink-scanner.md
+# spec-section: Behavior/Watch mode
+
+"""Tests for the backlink scanner watch mode."""
+
+import ctypes
+import errno
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from backlink_scanner.scanner import ScanResult, scan
+from backlink_scanner.watch import InotifyChangeSource, LiveScan, PollingChangeSource, watch
+from tests.fakes.fake_change_source import FakeChangeSource
+
+
+def _make_tree(root: Path) -> None:
+    (root / "specs").mkdir()
+    (root / "specs/auth.md").write_text("# Auth")
+    (root / "a.py").write_text("# spec: specs/auth.md\n")
+
+
+def _run_watch(root: Path, source: FakeChangeSource) -> list[ScanResult]:
+    emitted: list[ScanResult] = []
+    watch(
+        str(root),
+        emit=emitted.append,
+        source=source,
+        should_stop=lambda: source.exhausted,
+    )
+    return emitted
+
+
+class TestLiveScan:
+    def test_apply_patches_changed_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        live = LiveScan(tmp_path)
+
+        (tmp_path / "b.py").write_text("# spec: specs/auth.md\n")
+
+        assert live.apply({"b.py"}) is True
+        assert live.result == scan(str(tmp_path))
+
+    def test_apply_reports_unchanged_result(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        live = LiveScan(tmp_path)
+
+        (tmp_path / "notes.txt").write_text("no annotations here")
+
+        assert live.apply({"notes.txt"}) is False
+
+    def test_deleted_directory_removes_its_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        (tmp_path / "pkg/sub").mkdir(parents=True)
+        (tmp_path / "pkg/sub/c.py").write_text("# spec: specs/missing.md\n")
+        live = LiveScan(tmp_path)
+
+        (tmp_path / "pkg/sub/c.py").unlink()
+        (tmp_path / "pkg/sub").rmdir()
+        (tmp_path / "pkg").rmdir()
+
+        assert live.apply({"pkg"}) is True
+        assert live.result.dangling == []
+
+    def test_created_directory_adds_its_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        live = LiveScan(tmp_path)
+
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg/c.py").write_text("# spec: specs/missing.md\n")
+
+        assert live.apply({"pkg"}) is True
+        assert live.result == scan(str(tmp_path))
+
+    def test_none_triggers_full_rescan(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        live = LiveScan(tmp_path)
+
+        (tmp_path / "a.py").unlink()
+
+        assert live.apply(None) is True
+        assert live.result.orphans == ["specs/auth.md"]
+
+
+class TestWatchLoop:
+    def test_emits_initial_snapshot(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        source = FakeChangeSource()
+
+        emitted = _run_watch(tmp_path, source)
+
+        assert emitted == [scan(str(tmp_path))]
+        assert source.closed
+
+    def test_emits_only_when_result_changes(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+
+        def write_plain() -> None:
+            (tmp_path / "plain.py").write_text("x = 1\n")
+
+        def add_implementor() -> None:
+            (tmp_path / "b.py").write_text("# spec: specs/auth.md\n")
+
+        source = FakeChangeSource(
+            steps=[
+                (write_plain, {"plain.py"}),
+                (None, set()),
+                (add_implementor, {"b.py"}),
+                (None, set()),
+            ]
+        )
+
+        emitted = _run_watch(tmp_path, source)
+
+        assert len(emitted) == 2
+        assert emitted[1].specs["specs/auth.md"].implementors == ["a.py", "b.py"]
+
+    def test_debounces_bursts_into_one_update(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+
+        def write(name: str, spec: str) -> None:
+            (tmp_path / name).write_text(f"# spec: {spec}\n")
+
+        source = FakeChangeSource(
+            steps=[
+                (lambda: write("b.py", "specs/one.md"), {"b.py"}),
+                (lambda: write("b.py", "specs/two.md"), {"b.py"}),
+                (lambda: write("c.py", "specs/three.md"), {"c.py"}),
+                (None, set()),
+            ]
+        )
+
+        emitted = _run_watch(tmp_path, source)
+
+        assert len(emitted) == 2
+        assert emitted[1].dangling == ["specs/three.md", "specs/two.md"]
+        assert source.wait_calls[1:] == [0.2, 0.2, 0.2]
+
+    def test_failing_source_falls_back_to_polling(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+
+        def add_file_then_fail() -> None:
+            (tmp_path / "b.py").write_text("# spec: specs/auth.md\n")
+            raise OSError(errno.ENOSPC, "no inotify watches left")
+
+        source = FakeChangeSource(steps=[(add_file_then_fail, None)])
+        emitted = _run_watch(tmp_path, source)
+
+        assert source.closed
+        assert emitted[-1].specs["specs/auth.md"].implementors == ["a.py", "b.py"]
+
+    def test_missing_directory_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            watch(str(tmp_path / "missing"), emit=lambda r: None, source=FakeChangeSource())
+
+
+class TestChangeSources:
+    def test_polling_detects_added_modified_and_deleted(self, tmp_path: Path) -> None:
+        (tmp_path / "keep.py").write_text("x = 1\n")
+        (tmp_path / "edit.py").write_text("x = 1\n")
+        (tmp_path / "gone.py").write_text("x = 1\n")
+        source = PollingChangeSource(tmp_path)
+
+        (tmp_path / "edit.py").write_text("x = 12345\n")
+        (tmp_path / "gone.py").unlink()
+        (tmp_path / "new.py").write_text("x = 1\n")
+
+        assert source.wait(0) == {"edit.py", "gone.py", "new.py"}
+        assert source.wait(0) == set()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_reports_files_and_new_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("x = 1\n")
+        source = InotifyChangeSource(tmp_path)
+        try:
+            (tmp_path / "a.py").write_text("x = 2\n")
+            (tmp_path / "pkg").mkdir()
+            (tmp_path / "pkg/b.py").write_text("x = 1\n")
+            (tmp_path / "node_modules").mkdir()
+
+            changed: set[str] = set()
+            deadline = time.monotonic() + 5
+            while "pkg/b.py" not in changed and time.monotonic() < deadline:
+                changed |= source.wait(0.5) or set()
+        finally:
+            source.close()
+
+        assert {"a.py", "pkg", "pkg/b.py"} <= changed
+        assert "node_modules" not in changed
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_raises_when_a_watch_cant_be_added(self, tmp_path: Path) -> None:
+        source = InotifyChangeSource(tmp_path)
+
+        class OutOfWatches:
+            def inotify_add_watch(self, fd: int, path: bytes, mask: int) -> int:
+                ctypes.set_errno(errno.ENOSPC)
+                return -1
+
+        source._libc = OutOfWatches()
+        try:
+            (tmp_path / "pkg").mkdir()
+            with pytest.raises(OSError) as error:
+                deadline = time.monotonic() + 5
+                while time.monotonic() < deadline:
+                    source.wait(0.5)
+        finally:
+            source.close()
+
+        assert error.value.errno == errno.ENOSPC
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_ignores_directories_removed_before_watching(self, tmp_path: Path) -> None:
+        source = InotifyChangeSource(tmp_path)
+        try:
+            source._add_watch("gone")
+        finally:
+            source.close()
+
+
+class TestWatchCLI:
+    def test_prints_initial_snapshot_as_json_line(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "backlink_scanner", str(tmp_path), "--watch", "--poll"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert proc.stdout is not None
+            line = proc.stdout.readline()
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+        assert json.loads(line)["specs"]["specs/auth.md"]["implementors"] == ["a.py"]
+
+    def test_invalid_interval_exits_2(self, tmp_path: Path) -> None:
+        proc = subprocess.run(
+            [sys.executable, "-m", "backlink_scanner", str(tmp_path), "--watch", "--interval", "0"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert proc.returncode == 2